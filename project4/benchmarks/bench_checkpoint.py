@@ -0,0 +1,56 @@
+"""
+bench_checkpoint.py - Measure bulk checkpoint/restore cost for live sessions
+
+Usage: python benchmarks/bench_checkpoint.py [sessions]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from game_logic import GameLogic
+from session_store import SessionCheckpointer
+
+
+def build_sessions(checkpointer: SessionCheckpointer, count: int) -> None:
+    """Register `count` games, each with a few guesses made"""
+    stats = {}
+    for i in range(count):
+        game = GameLogic(f"player{i}", stats=stats)
+        game.autosave = False
+        game.start_new_game()
+        for guess in (1, 2, 3):
+            if game.game_active and guess != game.secret_number:
+                game.make_guess(guess)
+        checkpointer.register(game)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        checkpointer = SessionCheckpointer(os.path.join(tmp, "sessions.json"))
+        build_sessions(checkpointer, count)
+
+        start = time.perf_counter()
+        saved = checkpointer.checkpoint()
+        checkpoint_time = time.perf_counter() - start
+        size = os.path.getsize(checkpointer.path)
+
+        start = time.perf_counter()
+        restored = SessionCheckpointer(checkpointer.path).restore(stats={})
+        restore_time = time.perf_counter() - start
+
+    print(f"Sessions:        {count}")
+    print(f"Checkpointed:    {saved}")
+    print(f"Checkpoint time: {checkpoint_time * 1000:.1f} ms "
+          f"({checkpoint_time / max(saved, 1) * 1e6:.2f} us/session)")
+    print(f"File size:       {size / 1024:.0f} KiB ({size / max(saved, 1):.1f} B/session)")
+    print(f"Restore time:    {restore_time * 1000:.1f} ms ({len(restored)} sessions)")
+
+
+if __name__ == "__main__":
+    main()
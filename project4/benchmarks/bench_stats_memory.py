@@ -0,0 +1,189 @@
+"""
+bench_stats_memory.py - Load time and memory of GameLogic.stats at scale
+
+Streams a game_stats.json with N players x 50 games to disk, then measures
+load_stats time and the memory held by the loaded stats (compact records
+vs plain json.load dicts), each in a single load, and the cost of
+get_player_stats copies.
+
+Usage: python benchmarks/bench_stats_memory.py [players ...]
+
+Memory is the growth in resident set size (Linux), which costs nothing at
+100k players; elsewhere it falls back to tracemalloc, which is exact but
+several times slower.
+"""
+
+import gc
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from game_logic import GameLogic
+
+DIFFICULTIES = ("easy", "medium", "hard", "expert")
+GAME_POOL = 4096
+
+
+def synthesize_game(rng: random.Random) -> dict:
+    """One game record without its timestamp"""
+    attempts = rng.randint(1, 7)
+    return {
+        "difficulty": rng.choice(DIFFICULTIES),
+        "won": rng.random() < 0.6,
+        "score": rng.randint(1, 200),
+        "attempts_used": attempts,
+        "secret_number": rng.randint(1, 500),
+        "duration_ms": rng.randint(1000, 120000),
+        "guess_ms": [rng.randint(200, 20000) for _ in range(attempts)]
+    }
+
+
+def write_stats(path: str, players: int, games_per_player: int = 50, seed: int = 1) -> None:
+    """Stream a stats file shaped like game_stats.json, one player per line
+
+    Games are drawn from a pool of pre-serialized bodies and each gets its
+    own timestamp, so writing 100k players takes seconds and never holds
+    more than one player in memory.
+    """
+    rng = random.Random(seed)
+    pool = []
+    for _ in range(GAME_POOL):
+        game = synthesize_game(rng)
+        pool.append((json.dumps(game)[1:], game["won"], game["score"]))
+
+    start = datetime(2026, 1, 1)
+    minute = timedelta(minutes=1)
+    with open(path, 'w') as f:
+        f.write("{\n")
+        for p in range(players):
+            when = start + p * games_per_player * minute
+            games = []
+            wins = best = 0
+            for _ in range(games_per_player):
+                body, won, score = pool[rng.randrange(GAME_POOL)]
+                games.append(f'{{"timestamp": "{when.isoformat()}", {body}')
+                wins += won
+                best = max(best, score)
+                when += minute
+            sep = ",\n" if p < players - 1 else "\n"
+            f.write(f'"player{p}": {{"total_games": {games_per_player}, "wins": {wins}, '
+                    f'"losses": {games_per_player - wins}, "best_score": {best}, '
+                    f'"games": [{", ".join(games)}]}}{sep}')
+        f.write("}\n")
+
+
+def load_game(path: str) -> GameLogic:
+    game = GameLogic.__new__(GameLogic)
+    game.stats_file = path
+    game.load_stats()
+    return game
+
+
+def load_plain(path: str) -> dict:
+    """The file as plain json.load dicts, parsed one player line at a time
+
+    Builds the same objects json.load would without the whole file text
+    alongside them, which is what lets 100k players fit in memory.
+    """
+    stats = {}
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.rstrip().rstrip(",")
+            if line not in ("{", "}"):
+                stats.update(json.loads("{" + line + "}"))
+    return stats
+
+
+def _rss() -> int:
+    """Resident set size in bytes, or -1 where /proc is unavailable"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, AttributeError, ValueError):
+        return -1
+
+
+def measure(load, path: str, traced: bool = False):
+    """Return (result, seconds, bytes held) from a single call of load(path)
+
+    Bytes held is the RSS growth, or tracemalloc's count when traced is set
+    or RSS is unavailable; the timing then includes tracing overhead.
+    """
+    gc.collect()
+    before = -1 if traced else _rss()
+    if before < 0:
+        tracemalloc.start()
+    start = time.perf_counter()
+    result = load(path)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    if before < 0:
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    else:
+        size = _rss() - before
+    return result, elapsed, size
+
+
+def measure_load(path: str, traced: bool = False):
+    """Return (game, seconds, bytes) for GameLogic loading the stats file"""
+    return measure(load_game, path, traced)
+
+
+def measure_plain_load(path: str, traced: bool = False):
+    """Return (seconds, bytes) for the same file loaded as plain dicts"""
+    stats, elapsed, size = measure(load_plain, path, traced)
+    del stats
+    return elapsed, size
+
+
+def measure_copies(game: GameLogic, calls: int = 1000):
+    """Return (seconds per call, traced bytes per retained copy)"""
+    names = list(game.stats)[:calls]
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    copies = []
+    for name in names:
+        game.player_name = name
+        copies.append(game.get_player_stats())
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed / len(names), size / len(names)
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [10_000, 100_000]
+    for players in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "game_stats.json")
+            start = time.perf_counter()
+            write_stats(path, players)
+            write_time = time.perf_counter() - start
+            file_size = os.path.getsize(path)
+
+            plain_time, plain = measure_plain_load(path)
+            game, load_time, compact = measure_load(path)
+            per_call, per_copy = measure_copies(game)
+            del game
+            games = players * 50
+
+        print(f"Players: {players} ({games} games, file {file_size / 2**20:.0f} MiB, "
+              f"written in {write_time:.1f} s)")
+        print(f"  load_stats:         {load_time:.2f} s")
+        print(f"  plain json.loads:   {plain_time:.2f} s")
+        print(f"  plain dicts:        {plain / 2**20:.0f} MiB ({plain / games:.0f} B/game)")
+        print(f"  compact records:    {compact / 2**20:.0f} MiB ({compact / games:.0f} B/game)")
+        print(f"  get_player_stats:   {per_call * 1e6:.1f} us/call, {per_copy:.0f} B/copy")
+
+
+if __name__ == "__main__":
+    main()
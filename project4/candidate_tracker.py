@@ -0,0 +1,131 @@
+"""
+candidate_tracker.py - Numbers still consistent with the hints given so far
+"""
+
+import math
+from typing import List, Optional, Tuple
+
+from difficulty_config import DifficultyLevel
+
+
+class CandidateTracker:
+    """Remaining candidates as sorted, disjoint, inclusive intervals
+
+    Each hint maps to a contiguous band of distances on one side of the
+    guess, so narrowing is an interval intersection costing O(#intervals)
+    no matter how wide the range is.
+    """
+
+    def __init__(self, low: int, high: int):
+        self.intervals: List[Tuple[int, int]] = [(low, high)] if low <= high else []
+
+    def count(self) -> int:
+        """How many numbers are still possible"""
+        return sum(hi - lo + 1 for lo, hi in self.intervals)
+
+    def __contains__(self, value: int) -> bool:
+        return any(lo <= value <= hi for lo, hi in self.intervals)
+
+    def count_between(self, low: float, high: float) -> int:
+        """How many candidates fall in [low, high]"""
+        total = 0
+        for lo, hi in self.intervals:
+            a, b = max(lo, low), min(hi, high)
+            if a <= b:
+                total += int(b - a) + 1
+        return total
+
+    def intersect(self, low: float, high: float) -> None:
+        """Keep only candidates in [low, high] (bounds may be infinite)"""
+        kept = []
+        for lo, hi in self.intervals:
+            a, b = max(lo, low), min(hi, high)
+            if a <= b:
+                kept.append((int(a), int(b)))
+        self.intervals = kept
+
+    def exclude(self, value: int) -> None:
+        """Remove a single number"""
+        kept = []
+        for lo, hi in self.intervals:
+            if lo <= value <= hi:
+                if lo < value:
+                    kept.append((lo, value - 1))
+                if value < hi:
+                    kept.append((value + 1, hi))
+            else:
+                kept.append((lo, hi))
+        self.intervals = kept
+
+    @staticmethod
+    def _band_distances(level: DifficultyLevel, band: int) -> Tuple[int, float]:
+        """Smallest and largest distance a hint band covers"""
+        bands = level.hint_bands
+        lowest = bands[band - 1] + 1 if band > 0 else 1
+        highest = bands[band] if band < len(bands) else math.inf
+        return lowest, highest
+
+    def apply_hint(self, level: DifficultyLevel, guess: int, too_low: bool, band: int) -> None:
+        """Narrow the candidates using the hint for a wrong guess"""
+        near, far = self._band_distances(level, band)
+        if too_low:
+            self.intersect(guess + near, guess + far)
+        else:
+            self.intersect(guess - far, guess - near)
+        self.exclude(guess)
+
+    def _outcome_counts(self, level: DifficultyLevel, guess: int) -> List[int]:
+        """Candidates that would produce each possible hint for a guess"""
+        counts = [1 if guess in self else 0]
+        for band in range(len(level.hint_bands) + 1):
+            near, far = self._band_distances(level, band)
+            counts.append(self.count_between(guess + near, guess + far))
+            counts.append(self.count_between(guess - far, guess - near))
+        return counts
+
+    def information(self, level: DifficultyLevel, guess: int) -> float:
+        """Expected information (bits) the hint for a guess would give"""
+        total = self.count()
+        if total == 0:
+            return 0.0
+        return -sum(c / total * math.log2(c / total)
+                    for c in self._outcome_counts(level, guess) if c)
+
+    def suggest(self, level: DifficultyLevel) -> Optional[int]:
+        """Candidate whose hint is expected to be most informative"""
+        if not self.intervals:
+            return None
+        if self.count() <= 2:
+            return self.intervals[0][0]
+
+        # Outcome counts are piecewise linear in the guess, changing slope only
+        # where a band edge meets an interval edge, so the entropy is concave
+        # between those breakpoints and a ternary search finds each segment's peak.
+        offsets = {0}
+        for band in range(len(level.hint_bands) + 1):
+            near, far = self._band_distances(level, band)
+            for d in (near, far):
+                if d != math.inf:
+                    offsets.update((d, -d, d - 1, -d + 1, d + 1, -d - 1))
+        edges = {e for lo, hi in self.intervals for e in (lo, hi)}
+        breakpoints = sorted({e - o for e in edges for o in offsets})
+
+        best, best_info = None, -1.0
+        for lo, hi in self.intervals:
+            points = [lo] + [p for p in breakpoints if lo < p < hi] + [hi]
+            for a, b in zip(points, points[1:] or points):
+                guess = self._ternary_max(level, a, b)
+                info = self.information(level, guess)
+                if info > best_info:
+                    best, best_info = guess, info
+        return best
+
+    def _ternary_max(self, level: DifficultyLevel, low: int, high: int) -> int:
+        while high - low > 2:
+            m1 = low + (high - low) // 3
+            m2 = high - (high - low) // 3
+            if self.information(level, m1) < self.information(level, m2):
+                low = m1 + 1
+            else:
+                high = m2 - 1
+        return max(range(low, high + 1), key=lambda g: self.information(level, g))
@@ -0,0 +1,527 @@
+"""
+cluster.py - Local multi-worker sharding of game sessions by player
+
+A ClusterRouter consistent-hashes player names onto ShardWorker processes.
+Each worker owns the GameLogic sessions and the stats shard for its players
+and serves them over a Unix socket using newline-delimited JSON.
+
+Usage: python cluster.py [workers] [data_dir]
+
+data_dir holds the worker stats shards and sockets; it defaults to the
+current directory, where the game keeps game_stats.json.
+"""
+
+import bisect
+import hashlib
+import heapq
+import json
+import multiprocessing
+import os
+import shutil
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from compact_stats import compact_stats, json_default, load_compact_stats
+from game_logic import GameLogic
+
+
+class HashRing:
+    """Consistent hash ring with virtual nodes"""
+
+    def __init__(self, nodes: Iterable[str] = (), replicas: int = 64):
+        self.replicas = replicas
+        self._points: List[int] = []
+        self._owners: List[str] = []
+        self.nodes = set()
+        for node in nodes:
+            self.add_node(node)
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        return int.from_bytes(hashlib.md5(key.encode("utf-8")).digest()[:8], "big")
+
+    def add_node(self, node: str) -> None:
+        """Place a node's virtual points on the ring"""
+        if node in self.nodes:
+            return
+        self.nodes.add(node)
+        for i in range(self.replicas):
+            point = self._hash(f"{node}#{i}")
+            idx = bisect.bisect(self._points, point)
+            self._points.insert(idx, point)
+            self._owners.insert(idx, node)
+
+    def remove_node(self, node: str) -> None:
+        """Remove a node's virtual points from the ring"""
+        if node not in self.nodes:
+            return
+        self.nodes.discard(node)
+        keep = [(p, o) for p, o in zip(self._points, self._owners) if o != node]
+        self._points = [p for p, _ in keep]
+        self._owners = [o for _, o in keep]
+
+    def get_node(self, key: str) -> Optional[str]:
+        """Return the node that owns a key"""
+        if not self._points:
+            return None
+        idx = bisect.bisect(self._points, self._hash(key)) % len(self._points)
+        return self._owners[idx]
+
+
+class _ReadWriteLock:
+    """Many concurrent readers or one writer"""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._writer = False
+
+    def acquire_read(self):
+        with self._cond:
+            self._cond.wait_for(lambda: not self._writer)
+            self._readers += 1
+
+    def release_read(self):
+        with self._cond:
+            self._readers -= 1
+            self._cond.notify_all()
+
+    def acquire_write(self):
+        with self._cond:
+            self._cond.wait_for(lambda: not self._writer and self._readers == 0)
+            self._writer = True
+
+    def release_write(self):
+        with self._cond:
+            self._writer = False
+            self._cond.notify_all()
+
+
+class ShardWorker:
+    """Owns the sessions and stats of the players hashed to it"""
+
+    def __init__(self, name: str, socket_path: str, stats_file: str):
+        self.name = name
+        self.socket_path = socket_path
+        self.stats_file = stats_file
+        self.sessions: Dict[str, GameLogic] = {}
+        self._lock = threading.Lock()
+        self.load_stats()
+
+    def load_stats(self) -> None:
+        """Load this worker's stats shard"""
+        try:
+            with open(self.stats_file, 'r') as f:
+                self.stats = load_compact_stats(f)
+        except (OSError, ValueError):
+            self.stats = {}
+
+    def save_stats(self) -> None:
+        """Save this worker's stats shard"""
+        with open(self.stats_file, 'w') as f:
+            json.dump(self.stats, f, indent=2, default=json_default)
+
+    def _game(self, player: str) -> GameLogic:
+        game = self.sessions.get(player)
+        if game is None:
+            game = GameLogic(player, stats=self.stats)
+            game.stats_file = self.stats_file
+            self.sessions[player] = game
+        return game
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Dispatch one request to its op_* method
+
+        A bad request gets an error reply rather than an exception, which
+        would end the connection the router shares for all its players.
+        """
+        if not isinstance(request, dict):
+            return {"error": "Request must be an object"}
+        method = getattr(self, "op_" + str(request.get("op")), None)
+        if method is None:
+            return {"error": f"Unknown op: {request.get('op')}"}
+        with self._lock:
+            try:
+                return method(request)
+            except KeyError as e:
+                return {"error": f"Missing field: {e.args[0]}"}
+            except Exception as e:
+                return {"error": str(e) or type(e).__name__}
+
+    def op_start(self, request):
+        game = self._game(request["player"])
+        if not game.set_difficulty(request.get("difficulty", game.difficulty)):
+            return {"error": "Unknown difficulty"}
+        game.start_new_game()
+        return self._public_state(game)
+
+    def op_guess(self, request):
+        game = self.sessions.get(request["player"])
+        if game is None:
+            return {"error": "Game not active"}
+        guess = request["guess"]
+        if not isinstance(guess, int) or isinstance(guess, bool):
+            return {"error": "Guess must be a whole number"}
+        result = game.make_guess(guess)
+        if result.get("game_over"):
+            # The result is in the stats; keep only games still in play
+            del self.sessions[request["player"]]
+        return result
+
+    def op_state(self, request):
+        game = self.sessions.get(request["player"])
+        if game is None:
+            return {"error": "No game for this player"}
+        return self._public_state(game)
+
+    def op_stats(self, request):
+        game = GameLogic(request["player"], stats=self.stats)
+        return game.get_player_stats()
+
+    def op_leaderboard(self, request):
+        top = heapq.nlargest(
+            request.get("k", 10),
+            ((p["best_score"], name) for name, p in self.stats.items())
+        )
+        return {"top": top}
+
+    def op_summary(self, request):
+        return {
+            "worker": self.name,
+            "players": len(self.stats),
+            "sessions": len(self.sessions),
+            "games": sum(p["total_games"] for p in self.stats.values()),
+            "wins": sum(p["wins"] for p in self.stats.values()),
+        }
+
+    def op_keys(self, request):
+        return {"keys": sorted(set(self.stats) | set(self.sessions))}
+
+    def op_export(self, request):
+        """Hand the given players over to another worker"""
+        sessions, stats = [], {}
+        for player in request["players"]:
+            game = self.sessions.pop(player, None)
+            if game is not None:
+                snap = game.snapshot()
+                if snap is not None:
+                    sessions.append(snap)
+            if player in self.stats:
+                stats[player] = self.stats.pop(player)
+        if stats:
+            self.save_stats()
+        return {"sessions": sessions, "stats": stats}
+
+    def op_import(self, request):
+        self.stats.update(compact_stats(request.get("stats", {})))
+        imported = 0
+        for snap in request.get("sessions", []):
+            # A session this worker's levels cannot run is dropped
+            if GameLogic.snapshot_is_valid(snap):
+                self._game(snap[0]).restore_snapshot(snap)
+                imported += 1
+        if request.get("stats"):
+            self.save_stats()
+        return {"imported": imported}
+
+    def op_ping(self, request):
+        return {"worker": self.name}
+
+    @staticmethod
+    def _public_state(game: GameLogic) -> Dict[str, Any]:
+        state = game.get_game_state()
+        state.pop("secret_number")
+        return state
+
+    def serve_forever(self) -> None:
+        """Serve requests on the Unix socket until told to shut down"""
+        worker = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    try:
+                        request = json.loads(line)
+                    except ValueError as e:
+                        response = {"error": f"Bad JSON: {e}"}
+                    else:
+                        if isinstance(request, dict) and request.get("op") == "shutdown":
+                            self.wfile.write(b'{"ok": true}\n')
+                            self.wfile.flush()
+                            threading.Thread(target=server.shutdown, daemon=True).start()
+                            return
+                        response = worker.handle(request)
+                    self.wfile.write(json.dumps(response, default=json_default).encode("utf-8") + b"\n")
+                    self.wfile.flush()
+
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        server = socketserver.ThreadingUnixStreamServer(self.socket_path, Handler)
+        server.daemon_threads = True
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+
+def _run_worker(name: str, socket_path: str, stats_file: str) -> None:
+    ShardWorker(name, socket_path, stats_file).serve_forever()
+
+
+class _WorkerConnection:
+    """Router side of a worker: its process and a socket to it"""
+
+    def __init__(self, name: str, socket_path: str, process):
+        self.name = name
+        self.socket_path = socket_path
+        self.process = process
+        self.lock = threading.Lock()
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(socket_path)
+        self.reader = self.sock.makefile("rb")
+
+    def send(self, request: Dict[str, Any]) -> None:
+        self.sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+
+    def receive(self) -> Dict[str, Any]:
+        line = self.reader.readline()
+        if not line:
+            raise ConnectionError(f"Worker {self.name} closed the connection")
+        return json.loads(line)
+
+    def call(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        with self.lock:
+            self.send(request)
+            return self.receive()
+
+    def close(self) -> None:
+        self.reader.close()
+        self.sock.close()
+
+
+class ClusterRouter:
+    """Routes player requests to the worker that owns them"""
+
+    def __init__(self, workers: int = 2, data_dir: Optional[str] = None,
+                 replicas: int = 64, startup_timeout: float = 10.0):
+        # A temporary data directory is removed again by close()
+        self._temp_dir = data_dir is None
+        self.data_dir = data_dir or tempfile.mkdtemp(prefix="guess_cluster_")
+        self.startup_timeout = startup_timeout
+        self.ring = HashRing(replicas=replicas)
+        self.workers: Dict[str, _WorkerConnection] = {}
+        self._topology = _ReadWriteLock()
+        for i in range(workers):
+            self.add_worker(f"worker{i}")
+
+    def _spawn(self, name: str) -> _WorkerConnection:
+        socket_path = os.path.join(self.data_dir, f"{name}.sock")
+        stats_file = os.path.join(self.data_dir, f"game_stats.{name}.json")
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+        process = multiprocessing.Process(
+            target=_run_worker, args=(name, socket_path, stats_file), daemon=True
+        )
+        process.start()
+
+        deadline = time.monotonic() + self.startup_timeout
+        while True:
+            try:
+                return _WorkerConnection(name, socket_path, process)
+            except (FileNotFoundError, ConnectionRefusedError):
+                if time.monotonic() > deadline or not process.is_alive():
+                    process.terminate()
+                    raise RuntimeError(f"Worker {name} failed to start")
+                time.sleep(0.01)
+
+    def _move(self, source: _WorkerConnection, players: List[str]) -> None:
+        """Move players from a worker to their current owners on the ring"""
+        by_target: Dict[str, List[str]] = {}
+        for player in players:
+            by_target.setdefault(self.ring.get_node(player), []).append(player)
+        for target, group in by_target.items():
+            if target == source.name:
+                continue
+            payload = source.call({"op": "export", "players": group})
+            self.workers[target].call({"op": "import", **payload})
+
+    def add_worker(self, name: str) -> None:
+        """Start a worker and move the players it now owns onto it"""
+        self._topology.acquire_write()
+        try:
+            if name in self.workers:
+                raise ValueError(f"Worker {name} already exists")
+            self.workers[name] = self._spawn(name)
+            self.ring.add_node(name)
+            for conn in list(self.workers.values()):
+                if conn.name != name:
+                    keys = conn.call({"op": "keys"})["keys"]
+                    self._move(conn, [k for k in keys if self.ring.get_node(k) == name])
+        finally:
+            self._topology.release_write()
+
+    def remove_worker(self, name: str) -> None:
+        """Drain a worker's players to the remaining workers and stop it"""
+        self._topology.acquire_write()
+        try:
+            if name not in self.workers:
+                raise KeyError(name)
+            if len(self.workers) == 1:
+                raise ValueError("Cannot remove the last worker")
+            conn = self.workers[name]
+            self.ring.remove_node(name)
+            self._move(conn, conn.call({"op": "keys"})["keys"])
+            del self.workers[name]
+            self._stop(conn)
+        finally:
+            self._topology.release_write()
+
+    def _stop(self, conn: _WorkerConnection) -> None:
+        try:
+            conn.call({"op": "shutdown"})
+        except (OSError, ConnectionError):
+            pass
+        conn.close()
+        conn.process.join(timeout=5)
+        if conn.process.is_alive():
+            conn.process.terminate()
+        try:
+            os.unlink(conn.socket_path)
+        except FileNotFoundError:
+            pass
+
+    def _call_player(self, player: str, request: Dict[str, Any]) -> Dict[str, Any]:
+        self._topology.acquire_read()
+        try:
+            conn = self.workers[self.ring.get_node(player)]
+            return conn.call(dict(request, player=player))
+        finally:
+            self._topology.release_read()
+
+    def _fan_out(self, request: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Send a request to every worker and gather the replies"""
+        self._topology.acquire_read()
+        try:
+            conns = sorted(self.workers.values(), key=lambda c: c.name)
+            for conn in conns:
+                conn.lock.acquire()
+            try:
+                # Send everything first so the workers answer in parallel
+                for conn in conns:
+                    conn.send(request)
+                return [conn.receive() for conn in conns]
+            finally:
+                for conn in conns:
+                    conn.lock.release()
+        finally:
+            self._topology.release_read()
+
+    def worker_for(self, player: str) -> Optional[str]:
+        """Name of the worker that owns a player"""
+        return self.ring.get_node(player)
+
+    def start_game(self, player: str, difficulty: Optional[str] = None) -> Dict[str, Any]:
+        """Start a game (on the player's current level when difficulty is None)"""
+        request = {"op": "start"}
+        if difficulty is not None:
+            request["difficulty"] = difficulty
+        return self._call_player(player, request)
+
+    def make_guess(self, player: str, guess: int) -> Dict[str, Any]:
+        return self._call_player(player, {"op": "guess", "guess": guess})
+
+    def get_game_state(self, player: str) -> Dict[str, Any]:
+        return self._call_player(player, {"op": "state"})
+
+    def get_player_stats(self, player: str) -> Dict[str, Any]:
+        return self._call_player(player, {"op": "stats"})
+
+    def leaderboard(self, k: int = 10) -> List[Tuple[str, int]]:
+        """Top k players by best score across all shards"""
+        replies = self._fan_out({"op": "leaderboard", "k": k})
+        merged = heapq.nlargest(k, (tuple(entry) for r in replies for entry in r["top"]))
+        return [(name, score) for score, name in merged]
+
+    def summary(self) -> Dict[str, Any]:
+        """Aggregated totals across all shards"""
+        replies = self._fan_out({"op": "summary"})
+        totals = {"workers": len(replies), "players": 0, "sessions": 0, "games": 0, "wins": 0}
+        for reply in replies:
+            for key in ("players", "sessions", "games", "wins"):
+                totals[key] += reply[key]
+        totals["shards"] = replies
+        return totals
+
+    def close(self) -> None:
+        """Shut down every worker"""
+        self._topology.acquire_write()
+        try:
+            for conn in self.workers.values():
+                self._stop(conn)
+            self.workers.clear()
+            if self._temp_dir:
+                shutil.rmtree(self.data_dir, ignore_errors=True)
+        finally:
+            self._topology.release_write()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main():
+    """Run a local cluster with a small command prompt"""
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    data_dir = sys.argv[2] if len(sys.argv) > 2 else os.getcwd()
+    os.makedirs(data_dir, exist_ok=True)
+    commands = (
+        "start <player> [difficulty] | guess <player> <n> | stats <player> | "
+        "top [k] | summary | add <worker> | remove <worker> | quit"
+    )
+    with ClusterRouter(workers=workers, data_dir=data_dir) as router:
+        print(f"Cluster running with {workers} workers in {router.data_dir}")
+        print(commands)
+        while True:
+            try:
+                parts = input("> ").split()
+            except EOFError:
+                break
+            if not parts:
+                continue
+            cmd, args = parts[0], parts[1:]
+            try:
+                if cmd == "quit":
+                    break
+                elif cmd == "start":
+                    print(router.start_game(*args))
+                elif cmd == "guess":
+                    print(router.make_guess(args[0], int(args[1])))
+                elif cmd == "stats":
+                    print(router.get_player_stats(args[0]))
+                elif cmd == "top":
+                    for rank, (name, score) in enumerate(router.leaderboard(*map(int, args)), 1):
+                        print(f"{rank}. {name} - {score}")
+                elif cmd == "summary":
+                    print(router.summary())
+                elif cmd == "add":
+                    router.add_worker(args[0])
+                elif cmd == "remove":
+                    router.remove_worker(args[0])
+                else:
+                    print(commands)
+            except (IndexError, ValueError, KeyError) as e:
+                print(f"Error: {e}")
+
+
+if __name__ == "__main__":
+    main()
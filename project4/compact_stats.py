@@ -0,0 +1,118 @@
+"""
+compact_stats.py - Memory-lean representation of recorded games
+"""
+
+import json
+import sys
+from array import array
+from collections.abc import Mapping
+from typing import Any, Dict, IO, Iterator, Optional
+
+
+class GameRecord(Mapping):
+    """One finished game, read like the dict stored in game_stats.json
+
+    Fields live in slots instead of a per-record dict, difficulty names are
+    interned and per-guess timings are packed into an array, which cuts the
+    cost of a record to a fraction of the equivalent dict.
+    """
+
+    FIELDS = ("timestamp", "difficulty", "won", "score", "attempts_used",
+              "secret_number", "duration_ms", "guess_ms")
+    _FIELD_SET = frozenset(FIELDS)
+
+    __slots__ = FIELDS + ("extra",)
+
+    def __init__(self, timestamp: str, difficulty: str, won: bool, score: int,
+                 attempts_used: int, secret_number: Optional[int],
+                 duration_ms: Optional[int] = None, guess_ms=None,
+                 extra: Optional[Dict[str, Any]] = None):
+        self.timestamp = timestamp
+        self.difficulty = sys.intern(difficulty) if isinstance(difficulty, str) else difficulty
+        self.won = won
+        self.score = score
+        self.attempts_used = attempts_used
+        self.secret_number = secret_number
+        self.duration_ms = duration_ms
+        self.guess_ms = _pack(guess_ms) if guess_ms is not None else None
+        self.extra = extra or None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GameRecord":
+        """Build a record from a dict loaded from JSON"""
+        get = data.get
+        extra = None
+        if not data.keys() <= cls._FIELD_SET:
+            extra = {k: v for k, v in data.items() if k not in cls._FIELD_SET}
+        return cls(get("timestamp"), get("difficulty"), get("won"), get("score"),
+                   get("attempts_used"), get("secret_number"), get("duration_ms"),
+                   get("guess_ms"), extra)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict for saving"""
+        return dict(self.items())
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._FIELD_SET:
+            value = getattr(self, key)
+            if key == "guess_ms" and value is not None:
+                return value.tolist()
+            return value
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.FIELDS
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        return len(self.FIELDS) + (len(self.extra) if self.extra else 0)
+
+    def __repr__(self) -> str:
+        return f"GameRecord({self.to_dict()!r})"
+
+
+def _pack(values) -> array:
+    """Pack millisecond timings into 4-byte ints, widening if one overflows"""
+    try:
+        return array("I", values)
+    except OverflowError:
+        return array("Q", values)
+
+
+def compact_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert every player's game dicts to GameRecords, in place"""
+    for player_stats in stats.values():
+        games = player_stats.get("games") if isinstance(player_stats, dict) else None
+        if games:
+            player_stats["games"] = [
+                g if isinstance(g, GameRecord) else GameRecord.from_dict(g) for g in games
+            ]
+    return stats
+
+
+def _game_hook(obj: Dict[str, Any]) -> Any:
+    """json object_hook that turns each game dict into a GameRecord as it is parsed"""
+    if isinstance(obj.get("timestamp"), str) and "won" in obj:
+        return GameRecord.from_dict(obj)
+    return obj
+
+
+def load_compact_stats(f: IO[str]) -> Dict[str, Any]:
+    """json.load a stats file straight into GameRecords
+
+    Game dicts are converted while parsing, so the plain dicts for the
+    whole file never exist at once and loading peaks near the compact size.
+    """
+    return compact_stats(json.load(f, object_hook=_game_hook))
+
+
+def json_default(obj: Any) -> Any:
+    """json.dump hook that writes GameRecords as plain objects"""
+    if isinstance(obj, GameRecord):
+        return obj.to_dict()
+    if isinstance(obj, array):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
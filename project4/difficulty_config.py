@@ -0,0 +1,149 @@
+"""
+difficulty_config.py - Difficulty levels and hint bands loaded from a config file
+"""
+
+import json
+import os
+from bisect import bisect_left
+from typing import Any, Dict, Tuple
+
+DEFAULT_CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "difficulties.json")
+
+# Level new games start on, when the config has it
+PREFERRED_DEFAULT = "medium"
+
+# Used when no config file is present
+DEFAULT_CONFIG = {
+    "hint_messages": {
+        "low": ["A bit low. Getting close!", "Too low. Go higher.", "Way too low! Try much higher."],
+        "high": ["A bit high. Getting close!", "Too high. Go lower.", "Way too high! Try much lower."]
+    },
+    "levels": {
+        "easy": {"range": [1, 50], "attempts": 10, "points": 10, "hint_bands": [20, 50]},
+        "medium": {"range": [1, 100], "attempts": 7, "points": 20, "hint_bands": [20, 50]},
+        "hard": {"range": [1, 200], "attempts": 5, "points": 50, "hint_bands": [25, 60]},
+        "expert": {"range": [1, 500], "attempts": 3, "points": 100, "hint_bands": [50, 150]}
+    }
+}
+
+
+class DifficultyConfigError(ValueError):
+    """Raised when a difficulty config file is invalid"""
+
+
+class DifficultyLevel:
+    """A difficulty compiled into lookup tables for make_guess/get_hint"""
+
+    __slots__ = ("name", "range", "attempts", "points", "hint_bands",
+                 "low_hints", "high_hints", "points_table")
+
+    def __init__(self, name: str, num_range: Tuple[int, int], attempts: int, points: int,
+                 hint_bands: Tuple[int, ...], low_hints: Tuple[str, ...],
+                 high_hints: Tuple[str, ...]):
+        self.name = name
+        self.range = num_range
+        self.attempts = attempts
+        self.points = points
+        self.hint_bands = hint_bands
+        self.low_hints = low_hints
+        self.high_hints = high_hints
+        # points_table[n] = points for the n-th guess, precomputed once
+        self.points_table = tuple(
+            max(1, points // (n * 2)) if n else 0 for n in range(attempts + 1)
+        )
+
+    def points_for(self, guess_number: int) -> int:
+        """Points earned by the n-th guess of a game"""
+        if guess_number < len(self.points_table):
+            return self.points_table[guess_number]
+        return max(1, self.points // (guess_number * 2))
+
+    def band(self, distance: int) -> int:
+        """Index of the hint band a distance falls into"""
+        return bisect_left(self.hint_bands, distance)
+
+    def hint(self, guess: int, secret_number: int) -> str:
+        """Hint text for a guess"""
+        if guess < secret_number:
+            return self.low_hints[self.band(secret_number - guess)]
+        return self.high_hints[self.band(guess - secret_number)]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Plain dict in the shape of the old DIFFICULTY_LEVELS entries"""
+        return {"range": self.range, "attempts": self.attempts, "points": self.points}
+
+
+def _positive_int(value: Any, what: str) -> int:
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise DifficultyConfigError(f"{what} must be a positive integer, got {value!r}")
+    return value
+
+
+def compile_config(config: Dict[str, Any]) -> Dict[str, DifficultyLevel]:
+    """Validate a config dict and compile it into DifficultyLevels"""
+    if not isinstance(config, dict):
+        raise DifficultyConfigError("Config must be a JSON object")
+
+    messages = config.get("hint_messages", DEFAULT_CONFIG["hint_messages"])
+    try:
+        low_hints, high_hints = tuple(messages["low"]), tuple(messages["high"])
+    except (KeyError, TypeError):
+        raise DifficultyConfigError("hint_messages needs 'low' and 'high' lists")
+    if len(low_hints) != len(high_hints) or len(low_hints) < 1:
+        raise DifficultyConfigError("hint_messages 'low' and 'high' must be the same length")
+
+    levels = config.get("levels")
+    if not isinstance(levels, dict) or not levels:
+        raise DifficultyConfigError("Config needs a non-empty 'levels' object")
+
+    compiled = {}
+    for name, level in levels.items():
+        if not isinstance(level, dict):
+            raise DifficultyConfigError(f"Level {name!r} must be an object")
+        try:
+            min_num, max_num = level["range"]
+        except (KeyError, TypeError, ValueError):
+            raise DifficultyConfigError(f"Level {name!r} needs a [min, max] range")
+        for bound in (min_num, max_num):
+            if isinstance(bound, bool) or not isinstance(bound, int):
+                raise DifficultyConfigError(f"Level {name!r} range must be integers")
+        if min_num >= max_num:
+            raise DifficultyConfigError(f"Level {name!r} range is empty")
+
+        attempts = _positive_int(level.get("attempts"), f"{name}.attempts")
+        points = _positive_int(level.get("points"), f"{name}.points")
+
+        bands = tuple(
+            _positive_int(b, f"{name}.hint_bands") for b in level.get("hint_bands", [])
+        )
+        if any(a >= b for a, b in zip(bands, bands[1:])):
+            raise DifficultyConfigError(f"Level {name!r} hint_bands must be increasing")
+        if len(bands) != len(low_hints) - 1:
+            raise DifficultyConfigError(
+                f"Level {name!r} needs {len(low_hints) - 1} hint_bands for "
+                f"{len(low_hints)} hint messages"
+            )
+
+        compiled[name] = DifficultyLevel(
+            name, (min_num, max_num), attempts, points, bands, low_hints, high_hints
+        )
+    return compiled
+
+
+def default_difficulty(levels: Dict[str, DifficultyLevel]) -> str:
+    """Level new games start on: PREFERRED_DEFAULT, else the first configured"""
+    if PREFERRED_DEFAULT in levels:
+        return PREFERRED_DEFAULT
+    return next(iter(levels))
+
+
+def load_difficulties(path: str = DEFAULT_CONFIG_FILE) -> Dict[str, DifficultyLevel]:
+    """Load and compile difficulty levels, falling back to the defaults"""
+    if not os.path.exists(path):
+        return compile_config(DEFAULT_CONFIG)
+    try:
+        with open(path, 'r') as f:
+            config = json.load(f)
+    except ValueError as e:
+        raise DifficultyConfigError(f"{path}: {e}")
+    return compile_config(config)
@@ -1,212 +1,398 @@
-"""
-game_logic.py - Core game mechanics for number guessing
-"""
-
-import random
-import json
-import os
-from datetime import datetime
-from typing import Tuple, Optional, Dict, Any
-
-class GameLogic:
-    """Handles the core number guessing game logic"""
-    
-    DIFFICULTY_LEVELS = {
-        "easy": {"range": (1, 50), "attempts": 10, "points": 10},
-        "medium": {"range": (1, 100), "attempts": 7, "points": 20},
-        "hard": {"range": (1, 200), "attempts": 5, "points": 50},
-        "expert": {"range": (1, 500), "attempts": 3, "points": 100}
-    }
-    
-    def __init__(self, player_name: str = "Player"):
-        self.player_name = player_name
-        self.difficulty = "medium"
-        self.secret_number = None
-        self.attempts_left = 0
-        self.max_attempts = 0
-        self.guesses = []
-        self.game_start_time = None
-        self.game_active = False
-        self.score = 0
-        self.stats_file = "game_stats.json"
-        self.load_stats()
-    
-    def load_stats(self) -> None:
-        """Load player statistics from file"""
-        if os.path.exists(self.stats_file):
-            try:
-                with open(self.stats_file, 'r') as f:
-                    self.stats = json.load(f)
-            except:
-                self.stats = {}
-        else:
-            self.stats = {}
-    
-    def save_stats(self) -> None:
-        """Save player statistics to file"""
-        try:
-            with open(self.stats_file, 'w') as f:
-                json.dump(self.stats, f, indent=2)
-        except:
-            pass
-    
-    def set_difficulty(self, difficulty: str) -> bool:
-        """Set game difficulty level"""
-        if difficulty in self.DIFFICULTY_LEVELS:
-            self.difficulty = difficulty
-            return True
-        return False
-    
-    def start_new_game(self) -> None:
-        """Start a new game with current difficulty"""
-        level = self.DIFFICULTY_LEVELS[self.difficulty]
-        min_num, max_num = level["range"]
-        
-        self.secret_number = random.randint(min_num, max_num)
-        self.max_attempts = level["attempts"]
-        self.attempts_left = self.max_attempts
-        self.guesses = []
-        self.game_start_time = datetime.now()
-        self.game_active = True
-        self.score = 0
-    
-    def make_guess(self, guess: int) -> Dict[str, Any]:
-        """Process a player's guess"""
-        if not self.game_active:
-            return {"error": "Game not active"}
-        
-        if guess in self.guesses:
-            return {"error": "You already guessed this number"}
-        
-        self.attempts_left -= 1
-        self.guesses.append(guess)
-        
-        # Calculate points for this guess
-        base_points = self.DIFFICULTY_LEVELS[self.difficulty]["points"]
-        points_earned = max(1, base_points // (len(self.guesses) * 2))
-        
-        if guess == self.secret_number:
-            self.game_active = False
-            self.score += points_earned * 2  # Bonus for correct guess
-            
-            # Record win
-            self.record_game_result(win=True)
-            
-            return {
-                "correct": True,
-                "message": f"🎉 Correct! The number was {self.secret_number}",
-                "attempts_used": len(self.guesses),
-                "points_earned": points_earned * 2,
-                "game_over": True
-            }
-        
-        if self.attempts_left <= 0:
-            self.game_active = False
-            self.record_game_result(win=False)
-            
-            return {
-                "correct": False,
-                "message": f"💀 Game Over! The number was {self.secret_number}",
-                "hint": self.get_hint(guess),
-                "game_over": True
-            }
-        
-        hint = self.get_hint(guess)
-        self.score += points_earned
-        
-        return {
-            "correct": False,
-            "message": f"Not quite! {hint}",
-            "hint": hint,
-            "attempts_left": self.attempts_left,
-            "points_earned": points_earned,
-            "game_over": False
-        }
-    
-    def get_hint(self, guess: int) -> str:
-        """Provide hint based on the guess"""
-        if guess < self.secret_number:
-            difference = self.secret_number - guess
-            if difference > 50:
-                return "Way too low! Try much higher."
-            elif difference > 20:
-                return "Too low. Go higher."
-            else:
-                return "A bit low. Getting close!"
-        else:
-            difference = guess - self.secret_number
-            if difference > 50:
-                return "Way too high! Try much lower."
-            elif difference > 20:
-                return "Too high. Go lower."
-            else:
-                return "A bit high. Getting close!"
-    
-    def get_range(self) -> Tuple[int, int]:
-        """Get current difficulty range"""
-        level = self.DIFFICULTY_LEVELS[self.difficulty]
-        return level["range"]
-    
-    def get_game_state(self) -> Dict[str, Any]:
-        """Get current game state"""
-        return {
-            "secret_number": self.secret_number,
-            "attempts_left": self.attempts_left,
-            "max_attempts": self.max_attempts,
-            "guesses": self.guesses.copy(),
-            "difficulty": self.difficulty,
-            "score": self.score,
-            "game_active": self.game_active,
-            "range": self.get_range()
-        }
-    
-    def record_game_result(self, win: bool) -> None:
-        """Record game result to statistics"""
-        if self.player_name not in self.stats:
-            self.stats[self.player_name] = {
-                "total_games": 0,
-                "wins": 0,
-                "losses": 0,
-                "best_score": 0,
-                "games": []
-            }
-        
-        player_stats = self.stats[self.player_name]
-        player_stats["total_games"] += 1
-        
-        if win:
-            player_stats["wins"] += 1
-        else:
-            player_stats["losses"] += 1
-        
-        if self.score > player_stats["best_score"]:
-            player_stats["best_score"] = self.score
-        
-        game_record = {
-            "timestamp": datetime.now().isoformat(),
-            "difficulty": self.difficulty,
-            "won": win,
-            "score": self.score,
-            "attempts_used": len(self.guesses),
-            "secret_number": self.secret_number
-        }
-        
-        player_stats["games"].append(game_record)
-        
-        # Keep only last 50 games
-        if len(player_stats["games"]) > 50:
-            player_stats["games"] = player_stats["games"][-50:]
-        
-        self.save_stats()
-    
-    def get_player_stats(self) -> Dict[str, Any]:
-        """Get statistics for current player"""
-        if self.player_name in self.stats:
-            return self.stats[self.player_name].copy()
-        return {
-            "total_games": 0,
-            "wins": 0,
-            "losses": 0,
-            "best_score": 0,
-            "games": []
-        }
\ No newline at end of file
+"""
+game_logic.py - Core game mechanics for number guessing
+"""
+
+import random
+import json
+import os
+import time
+from datetime import datetime
+from typing import Tuple, Optional, Dict, Any
+
+from candidate_tracker import CandidateTracker
+from compact_stats import GameRecord, json_default, load_compact_stats
+from difficulty_config import (
+    DEFAULT_CONFIG_FILE, DifficultyLevel, default_difficulty, load_difficulties
+)
+from latency_sketch import LatencySketch
+
+class GameLogic:
+    """Handles the core number guessing game logic"""
+    
+    # Compiled levels, loaded from difficulties.json by configure_difficulties()
+    LEVELS: Dict[str, DifficultyLevel] = {}
+    DIFFICULTY_LEVELS: Dict[str, Dict[str, Any]] = {}
+    DEFAULT_DIFFICULTY = "medium"
+    
+    @classmethod
+    def configure_difficulties(cls, path: str = DEFAULT_CONFIG_FILE) -> None:
+        """Load difficulty levels and hint bands from a config file"""
+        levels = load_difficulties(path)
+        cls.LEVELS = levels
+        cls.DIFFICULTY_LEVELS = {name: level.as_dict() for name, level in levels.items()}
+        cls.DEFAULT_DIFFICULTY = default_difficulty(levels)
+    
+    def __init__(self, player_name: str = "Player", stats: Optional[Dict[str, Any]] = None):
+        self.player_name = player_name
+        self.difficulty = self.DEFAULT_DIFFICULTY
+        self.secret_number = None
+        self.attempts_left = 0
+        self.max_attempts = 0
+        self.guesses = []
+        self._guessed = set()
+        self.candidates: Optional[CandidateTracker] = None
+        self.game_start_time = None
+        # Monotonic timings in perf_counter_ns units; think times in ms
+        self._start_ns: Optional[int] = None
+        self._last_guess_ns: Optional[int] = None
+        self._paused_ns: Optional[int] = None
+        self.guess_times_ms = []
+        self.game_active = False
+        self.paused = False
+        self.score = 0
+        self.stats_file = "game_stats.json"
+        self.autosave = True
+        if stats is not None:
+            # Shared stats (e.g. a race room) - skip reading the file per player
+            self.stats = stats
+        else:
+            self.load_stats()
+    
+    def load_stats(self) -> None:
+        """Load player statistics from file"""
+        if os.path.exists(self.stats_file):
+            try:
+                with open(self.stats_file, 'r') as f:
+                    self.stats = load_compact_stats(f)
+            except:
+                self.stats = {}
+        else:
+            self.stats = {}
+    
+    def save_stats(self) -> None:
+        """Save player statistics to file"""
+        try:
+            with open(self.stats_file, 'w') as f:
+                json.dump(self.stats, f, indent=2, default=json_default)
+        except:
+            pass
+    
+    def set_difficulty(self, difficulty: str) -> bool:
+        """Set game difficulty level"""
+        if difficulty in self.LEVELS:
+            self.difficulty = difficulty
+            return True
+        return False
+    
+    def start_new_game(self, secret_number: Optional[int] = None) -> None:
+        """Start a new game with current difficulty"""
+        level = self.LEVELS[self.difficulty]
+        min_num, max_num = level.range
+        
+        if secret_number is None:
+            secret_number = random.randint(min_num, max_num)
+        self.secret_number = secret_number
+        self.max_attempts = level.attempts
+        self.attempts_left = self.max_attempts
+        self.guesses = []
+        self._guessed = set()
+        self.candidates = CandidateTracker(min_num, max_num)
+        self.game_start_time = datetime.now()
+        self._start_ns = self._last_guess_ns = time.perf_counter_ns()
+        self._paused_ns = None
+        self.guess_times_ms = []
+        self.game_active = True
+        self.paused = False
+        self.score = 0
+    
+    def pause(self) -> bool:
+        """Pause the game in progress"""
+        if not self.game_active:
+            return False
+        self.game_active = False
+        self.paused = True
+        self._paused_ns = time.perf_counter_ns()
+        return True
+    
+    def resume(self) -> bool:
+        """Resume a paused game"""
+        if not self.paused:
+            return False
+        self.paused = False
+        self.game_active = True
+        # Time spent paused counts towards neither the game nor the next guess
+        if self._paused_ns is not None:
+            paused_for = time.perf_counter_ns() - self._paused_ns
+            if self._start_ns is not None:
+                self._start_ns += paused_for
+                self._last_guess_ns += paused_for
+            self._paused_ns = None
+        return True
+    
+    def elapsed_ms(self) -> Optional[int]:
+        """Active play time of the current game in milliseconds"""
+        if self._start_ns is None:
+            return None
+        now = self._paused_ns if self._paused_ns is not None else time.perf_counter_ns()
+        return (now - self._start_ns) // 1_000_000
+    
+    def make_guess(self, guess: int) -> Dict[str, Any]:
+        """Process a player's guess"""
+        if self.paused:
+            return {"error": "Game is paused"}
+        
+        if not self.game_active:
+            return {"error": "Game not active"}
+        
+        if guess in self._guessed:
+            return {"error": "You already guessed this number"}
+        
+        now = time.perf_counter_ns()
+        if self._last_guess_ns is not None:
+            self.guess_times_ms.append((now - self._last_guess_ns) // 1_000_000)
+        self._last_guess_ns = now
+        
+        self.attempts_left -= 1
+        self.guesses.append(guess)
+        self._guessed.add(guess)
+        self._narrow_candidates(guess)
+        
+        # Points for this guess come from the level's precomputed table
+        points_earned = self.LEVELS[self.difficulty].points_for(len(self.guesses))
+        
+        if guess == self.secret_number:
+            self.game_active = False
+            self.score += points_earned * 2  # Bonus for correct guess
+            
+            # Record win
+            self.record_game_result(win=True)
+            
+            return {
+                "correct": True,
+                "message": f"🎉 Correct! The number was {self.secret_number}",
+                "attempts_used": len(self.guesses),
+                "points_earned": points_earned * 2,
+                "game_over": True
+            }
+        
+        if self.attempts_left <= 0:
+            self.game_active = False
+            self.record_game_result(win=False)
+            
+            return {
+                "correct": False,
+                "message": f"💀 Game Over! The number was {self.secret_number}",
+                "hint": self.get_hint(guess),
+                "game_over": True
+            }
+        
+        hint = self.get_hint(guess)
+        self.score += points_earned
+        
+        return {
+            "correct": False,
+            "message": f"Not quite! {hint}",
+            "hint": hint,
+            "attempts_left": self.attempts_left,
+            "points_earned": points_earned,
+            "game_over": False
+        }
+    
+    def _narrow_candidates(self, guess: int) -> None:
+        """Apply what the result of a guess reveals to the candidate set"""
+        if guess == self.secret_number:
+            self.candidates.intersect(guess, guess)
+            return
+        level = self.LEVELS[self.difficulty]
+        distance = abs(self.secret_number - guess)
+        self.candidates.apply_hint(level, guess, guess < self.secret_number, level.band(distance))
+    
+    def candidate_count(self) -> int:
+        """How many numbers are still consistent with the hints so far"""
+        return self.candidates.count() if self.candidates else 0
+    
+    def suggest_guess(self) -> Optional[int]:
+        """The guess expected to reveal the most, given the hints so far"""
+        if self.candidates is None:
+            return None
+        return self.candidates.suggest(self.LEVELS[self.difficulty])
+    
+    def get_hint(self, guess: int) -> str:
+        """Provide hint based on the guess"""
+        return self.LEVELS[self.difficulty].hint(guess, self.secret_number)
+    
+    def get_range(self) -> Tuple[int, int]:
+        """Get current difficulty range"""
+        return self.LEVELS[self.difficulty].range
+    
+    def get_game_state(self) -> Dict[str, Any]:
+        """Get current game state"""
+        return {
+            "secret_number": self.secret_number,
+            "attempts_left": self.attempts_left,
+            "max_attempts": self.max_attempts,
+            "guesses": self.guesses.copy(),
+            "difficulty": self.difficulty,
+            "score": self.score,
+            "game_active": self.game_active,
+            "candidate_count": self.candidate_count(),
+            "paused": self.paused,
+            "range": self.get_range()
+        }
+    
+    def snapshot(self) -> Optional[list]:
+        """Compact snapshot of the game in progress, or None if there is none"""
+        if not (self.game_active or self.paused):
+            return None
+        return [
+            self.player_name,
+            self.difficulty,
+            self.secret_number,
+            self.max_attempts,
+            self.attempts_left,
+            self.score,
+            list(self.guesses),
+            self.paused,
+            self.elapsed_ms(),
+            list(self.guess_times_ms)
+        ]
+    
+    @classmethod
+    def snapshot_is_valid(cls, snapshot: Any) -> bool:
+        """True if a saved snapshot fits the current levels and can be restored
+
+        Checkpoints outlive config changes, so a snapshot may name a level
+        that was since removed, or hold a secret outside its new range.
+        """
+        if not isinstance(snapshot, (list, tuple)) or len(snapshot) < 8:
+            return False
+        name, difficulty, secret, max_attempts, attempts_left, score, guesses, paused = snapshot[:8]
+        level = cls.LEVELS.get(difficulty) if isinstance(difficulty, str) else None
+        if not isinstance(name, str) or level is None or not isinstance(paused, bool):
+            return False
+        if not all(isinstance(n, int) and not isinstance(n, bool)
+                   for n in (secret, max_attempts, attempts_left, score)):
+            return False
+        if not level.range[0] <= secret <= level.range[1]:
+            return False
+        if not isinstance(guesses, list) or not all(
+                isinstance(g, int) and not isinstance(g, bool) for g in guesses):
+            return False
+        if len(snapshot) >= 10:
+            elapsed_ms, guess_times = snapshot[8:10]
+            if elapsed_ms is not None and not isinstance(elapsed_ms, int):
+                return False
+            if not isinstance(guess_times, list):
+                return False
+        return True
+    
+    def restore_snapshot(self, snapshot: list) -> bool:
+        """Continue a game from a snapshot taken with snapshot()
+
+        Returns False, leaving the game as it was, if the snapshot does
+        not fit the current levels (see snapshot_is_valid).
+        """
+        if not self.snapshot_is_valid(snapshot):
+            return False
+        (self.player_name, self.difficulty, self.secret_number, self.max_attempts,
+         self.attempts_left, self.score, guesses, self.paused) = snapshot[:8]
+        # Snapshots written before timing was tracked have no timing fields
+        elapsed_ms, guess_times = snapshot[8:10] if len(snapshot) >= 10 else (None, [])
+        self.guesses = list(guesses)
+        self._guessed = set(self.guesses)
+        self.candidates = CandidateTracker(*self.get_range())
+        for guess in self.guesses:
+            self._narrow_candidates(guess)
+        self.guess_times_ms = list(guess_times)
+        self.game_start_time = datetime.now()
+        now = time.perf_counter_ns()
+        self._start_ns = now - (elapsed_ms or 0) * 1_000_000
+        self._last_guess_ns = now
+        self._paused_ns = now if self.paused else None
+        self.game_active = not self.paused
+        return True
+    
+    def record_game_result(self, win: bool) -> None:
+        """Record game result to statistics"""
+        if self.player_name not in self.stats:
+            self.stats[self.player_name] = {
+                "total_games": 0,
+                "wins": 0,
+                "losses": 0,
+                "best_score": 0,
+                "games": []
+            }
+        
+        player_stats = self.stats[self.player_name]
+        player_stats["total_games"] += 1
+        
+        if win:
+            player_stats["wins"] += 1
+        else:
+            player_stats["losses"] += 1
+        
+        if self.score > player_stats["best_score"]:
+            player_stats["best_score"] = self.score
+        
+        game_record = GameRecord(
+            timestamp=datetime.now().isoformat(),
+            difficulty=self.difficulty,
+            won=win,
+            score=self.score,
+            attempts_used=len(self.guesses),
+            secret_number=self.secret_number,
+            duration_ms=self.elapsed_ms(),
+            guess_ms=self.guess_times_ms
+        )
+        
+        player_stats["games"].append(game_record)
+        self._record_timing(player_stats, game_record)
+        
+        # Keep only last 50 games
+        if len(player_stats["games"]) > 50:
+            player_stats["games"] = player_stats["games"][-50:]
+        
+        if self.autosave:
+            self.save_stats()
+    
+    def _record_timing(self, player_stats: Dict[str, Any], game_record: GameRecord) -> None:
+        """Fold a finished game's timings into the per-difficulty sketches"""
+        if game_record.duration_ms is None:
+            return
+        timing = player_stats.setdefault("timing", {}).setdefault(self.difficulty, {})
+        game_sketch = LatencySketch.from_dict(timing.get("game"))
+        game_sketch.add(game_record.duration_ms)
+        guess_sketch = LatencySketch.from_dict(timing.get("guess"))
+        guess_sketch.update(game_record.guess_ms)
+        timing["game"] = game_sketch.to_dict()
+        timing["guess"] = guess_sketch.to_dict()
+    
+    def get_timing_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Game duration and think-time percentiles (ms) per difficulty"""
+        timing = self.stats.get(self.player_name, {}).get("timing", {})
+        result = {}
+        for difficulty, sketches in timing.items():
+            game_sketch = LatencySketch.from_dict(sketches.get("game"))
+            guess_sketch = LatencySketch.from_dict(sketches.get("guess"))
+            result[difficulty] = {
+                "games": game_sketch.count,
+                "guesses": guess_sketch.count,
+                "game_ms": game_sketch.percentiles(),
+                "guess_ms": guess_sketch.percentiles()
+            }
+        return result
+    
+    def get_player_stats(self) -> Dict[str, Any]:
+        """Get statistics for current player"""
+        if self.player_name in self.stats:
+            return self.stats[self.player_name].copy()
+        return {
+            "total_games": 0,
+            "wins": 0,
+            "losses": 0,
+            "best_score": 0,
+            "games": []
+        }
+
+
+GameLogic.configure_difficulties()
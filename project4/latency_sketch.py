@@ -0,0 +1,99 @@
+"""
+latency_sketch.py - Streaming percentile sketch with bounded memory
+"""
+
+import math
+from typing import Any, Dict, Iterable, Optional
+
+
+class LatencySketch:
+    """Log-bucketed histogram that answers percentile queries
+
+    Values are counted in buckets whose width grows geometrically, so any
+    quantile is accurate to within `relative_accuracy` of the true value.
+    Memory is capped at `max_buckets`; past that the lowest buckets are
+    merged, which only loses precision at the fast end.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.02, max_buckets: int = 512):
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def _key(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Record a value (negative values count as zero)"""
+        self.count += count
+        if value <= 0:
+            self.zero_count += count
+            return
+        key = self._key(value)
+        self.buckets[key] = self.buckets.get(key, 0) + count
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def update(self, values: Iterable[float]) -> None:
+        """Record many values"""
+        for value in values:
+            self.add(value)
+
+    def _collapse(self) -> None:
+        keys = sorted(self.buckets)
+        excess = len(keys) - self.max_buckets
+        merged = sum(self.buckets.pop(k) for k in keys[:excess])
+        self.buckets[keys[excess]] += merged
+
+    def merge(self, other: "LatencySketch") -> None:
+        """Fold another sketch with the same accuracy into this one"""
+        self.count += other.count
+        self.zero_count += other.zero_count
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        while len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate value at quantile q (0-1), or None if empty"""
+        if self.count == 0:
+            return None
+        rank = math.floor(q * (self.count - 1) + 0.5)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                # Midpoint of the bucket (gamma^(k-1), gamma^k]
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+    def percentiles(self, *qs: float) -> Dict[str, Optional[float]]:
+        """Percentiles keyed like {'p50': ..., 'p90': ...}"""
+        qs = qs or (0.5, 0.9, 0.99)
+        return {f"p{q * 100:g}": self.quantile(q) for q in qs}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly form for storing in game_stats.json"""
+        return {
+            "alpha": self.relative_accuracy,
+            "count": self.count,
+            "zero": self.zero_count,
+            "buckets": [[k, c] for k, c in sorted(self.buckets.items())]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]], max_buckets: int = 512) -> "LatencySketch":
+        """Rebuild a sketch saved with to_dict()"""
+        if not data:
+            return cls(max_buckets=max_buckets)
+        sketch = cls(data.get("alpha", 0.02), max_buckets)
+        sketch.count = data.get("count", 0)
+        sketch.zero_count = data.get("zero", 0)
+        sketch.buckets = {int(k): c for k, c in data.get("buckets", [])}
+        return sketch
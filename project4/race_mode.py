@@ -0,0 +1,199 @@
+"""
+race_mode.py - Shared-secret race mode with event fan-out
+"""
+
+import json
+import random
+import threading
+from collections import deque
+from itertools import islice
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from compact_stats import json_default
+from game_logic import GameLogic
+
+
+class RaceEvent(NamedTuple):
+    """A guess made by one racer, broadcast to every participant"""
+    player: str
+    guess: int
+    correct: bool
+    attempts_used: int
+    race_over: bool
+
+
+class Subscription:
+    """A participant's read cursor into an EventBroadcaster"""
+
+    def __init__(self, broadcaster: "EventBroadcaster", cursor: int, max_pending: int):
+        self.broadcaster = broadcaster
+        self.cursor = cursor
+        self.max_pending = max_pending
+        self.dropped = 0
+
+    def poll(self, timeout: Optional[float] = None) -> List[Any]:
+        """Return events published since the last poll
+
+        With a timeout, waits up to that many seconds for at least one event.
+        """
+        return self.broadcaster.read(self, timeout)
+
+
+class EventBroadcaster:
+    """Pub/sub channel that fans out events without copying them
+
+    Each event is stored once in a shared ring buffer and subscribers only
+    hold a cursor into it, so publishing costs O(1) no matter how many
+    players are listening. A subscriber lagging more than `max_pending`
+    events behind skips ahead; the skipped count is kept in `dropped`.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.capacity = capacity
+        self._log = deque(maxlen=capacity)
+        self._next_seq = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def subscribe(self, max_pending: Optional[int] = None) -> Subscription:
+        """Create a subscriber that sees events published from now on"""
+        if max_pending is None or max_pending > self.capacity:
+            max_pending = self.capacity
+        with self._cond:
+            return Subscription(self, self._next_seq, max(1, max_pending))
+
+    def publish(self, event: Any) -> int:
+        """Publish an event and return its sequence number"""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Broadcaster is closed")
+            seq = self._next_seq
+            self._log.append(event)
+            self._next_seq += 1
+            self._cond.notify_all()
+        return seq
+
+    def close(self) -> None:
+        """Stop accepting events and wake up any waiting subscribers"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def read(self, sub: Subscription, timeout: Optional[float] = None) -> List[Any]:
+        """Return the events a subscriber has not seen yet"""
+        with self._cond:
+            if timeout is not None:
+                self._cond.wait_for(
+                    lambda: sub.cursor < self._next_seq or self._closed, timeout
+                )
+
+            base = self._next_seq - len(self._log)
+            start = max(sub.cursor, base, self._next_seq - sub.max_pending)
+            sub.dropped += start - sub.cursor
+            events = list(islice(self._log, start - base, None))
+            sub.cursor = self._next_seq
+        return events
+
+
+class RaceRoom:
+    """N players racing to guess the same secret number"""
+
+    def __init__(self, difficulty: Optional[str] = None, secret_number: Optional[int] = None,
+                 stats: Optional[Dict[str, Any]] = None, queue_size: int = 256,
+                 history_size: int = 4096):
+        if difficulty is None:
+            difficulty = GameLogic.DEFAULT_DIFFICULTY
+        if difficulty not in GameLogic.DIFFICULTY_LEVELS:
+            raise ValueError(f"Unknown difficulty: {difficulty}")
+
+        self.difficulty = difficulty
+        if secret_number is None:
+            min_num, max_num = GameLogic.DIFFICULTY_LEVELS[difficulty]["range"]
+            secret_number = random.randint(min_num, max_num)
+        self.secret_number = secret_number
+
+        # All racers share one stats dict; it is only written when the race ends
+        self.stats = stats if stats is not None else {}
+        self.queue_size = queue_size
+        self.broadcaster = EventBroadcaster(capacity=history_size)
+        self.players: Dict[str, GameLogic] = {}
+        self.winner: Optional[str] = None
+        self.finished = False
+        self._active = 0
+        self._lock = threading.Lock()
+
+    def join(self, player_name: str) -> Subscription:
+        """Add a player to the race and subscribe them to its events"""
+        with self._lock:
+            if self.finished:
+                raise RuntimeError("Race is already over")
+            if player_name in self.players:
+                raise ValueError(f"{player_name} already joined this race")
+
+            game = GameLogic(player_name, stats=self.stats)
+            game.autosave = False
+            game.set_difficulty(self.difficulty)
+            game.start_new_game(self.secret_number)
+            self.players[player_name] = game
+            self._active += 1
+            return self.broadcaster.subscribe(self.queue_size)
+
+    def make_guess(self, player_name: str, guess: int) -> Dict[str, Any]:
+        """Process a racer's guess and broadcast it to everyone"""
+        with self._lock:
+            if self.finished:
+                return {"error": "Race is over"}
+
+            game = self.players.get(player_name)
+            if game is None:
+                return {"error": "Player is not in this race"}
+
+            result = game.make_guess(guess)
+            if "error" in result:
+                return result
+
+            if result["game_over"]:
+                self._active -= 1
+            if result["correct"]:
+                self.winner = player_name
+                self._end_race()
+            elif self._active == 0:
+                self._end_race()
+
+            self.broadcaster.publish(RaceEvent(
+                player_name, guess, result["correct"], len(game.guesses), self.finished
+            ))
+            if self.finished:
+                self.broadcaster.close()
+
+            result["race_over"] = self.finished
+            result["winner"] = self.winner
+            return result
+
+    def _end_race(self) -> None:
+        """Close out every racer that is still playing"""
+        self.finished = True
+        for game in self.players.values():
+            if game.game_active:
+                game.game_active = False
+                game.record_game_result(win=False)
+        self._active = 0
+
+    def standings(self) -> List[Dict[str, Any]]:
+        """Racers ordered by winner first, then score"""
+        rows = [
+            {"player": name, "score": game.score, "attempts_used": len(game.guesses),
+             "won": name == self.winner}
+            for name, game in self.players.items()
+        ]
+        rows.sort(key=lambda r: (not r["won"], -r["score"], r["attempts_used"]))
+        return rows
+
+    def save_stats(self, stats_file: str = "game_stats.json") -> None:
+        """Persist the shared stats in one write once the race is over"""
+        with open(stats_file, 'w') as f:
+            json.dump(self.stats, f, indent=2, default=json_default)
@@ -0,0 +1,123 @@
+"""
+session_store.py - Bulk checkpointing of in-progress game sessions
+"""
+
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+from game_logic import GameLogic
+
+
+class SessionCheckpointer:
+    """Periodically writes every live session to disk in one file
+
+    Sessions are checkpointed in bulk on a timer rather than on every guess,
+    so the cost of a guess is unchanged. Each session is stored as the
+    compact list returned by GameLogic.snapshot().
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str = "game_sessions.json"):
+        self.path = path
+        self.sessions: Dict[str, GameLogic] = {}
+        self._timer: Optional[threading.Timer] = None
+        self._running = False
+        self._lock = threading.Lock()
+
+    def register(self, game: GameLogic, key: Optional[str] = None) -> str:
+        """Track a session so it is included in future checkpoints"""
+        key = key if key is not None else game.player_name
+        self.sessions[key] = game
+        return key
+
+    def unregister(self, key: str) -> None:
+        """Stop tracking a session"""
+        self.sessions.pop(key, None)
+
+    def _write(self, snapshots: List[list]) -> None:
+        data = {"version": self.VERSION, "sessions": snapshots}
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(json.dumps(data, separators=(",", ":")))
+        # Atomic swap so a crash mid-write never loses the last checkpoint
+        os.replace(tmp_path, self.path)
+
+    def checkpoint(self) -> int:
+        """Write all in-progress sessions to disk, returning how many were saved"""
+        with self._lock:
+            snapshots = []
+            for game in list(self.sessions.values()):
+                snap = game.snapshot()
+                if snap is not None:
+                    snapshots.append(snap)
+            self._write(snapshots)
+            return len(snapshots)
+
+    def load(self) -> List[list]:
+        """Read the snapshots saved by the last checkpoint"""
+        if not os.path.exists(self.path):
+            return []
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return []
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return []
+        sessions = data.get("sessions", [])
+        return sessions if isinstance(sessions, list) else []
+
+    def restore(self, stats: Optional[Dict[str, Any]] = None) -> Dict[str, GameLogic]:
+        """Rebuild and register a GameLogic for every saved session"""
+        if stats is None:
+            stats = {}
+        restored = {}
+        for snap in self.load():
+            game = GameLogic(stats=stats)
+            # Snapshots that no longer fit the levels are skipped
+            if game.restore_snapshot(snap):
+                restored[self.register(game)] = game
+        return restored
+
+    def find(self, player_name: str) -> Optional[list]:
+        """Return the saved snapshot for a player, if any"""
+        for snap in self.load():
+            if isinstance(snap, list) and snap and snap[0] == player_name:
+                return snap
+        return None
+
+    def discard(self, player_name: str) -> None:
+        """Drop a player's saved snapshot (e.g. one that can no longer be restored)"""
+        with self._lock:
+            kept = [s for s in self.load()
+                    if not (isinstance(s, list) and s and s[0] == player_name)]
+            self._write(kept)
+
+    def start(self, interval: float = 5.0) -> None:
+        """Checkpoint in the background every `interval` seconds"""
+        self.stop()
+        self._running = True
+        self._schedule(interval)
+
+    def _schedule(self, interval: float) -> None:
+        def tick():
+            try:
+                self.checkpoint()
+            except OSError:
+                pass
+            if self._running:
+                self._schedule(interval)
+
+        self._timer = threading.Timer(interval, tick)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def stop(self) -> None:
+        """Stop background checkpointing"""
+        self._running = False
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
@@ -0,0 +1,115 @@
+"""
+test_candidate_tracker.py - Unit tests for the candidate set and guess suggestions
+"""
+
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from candidate_tracker import CandidateTracker
+from difficulty_config import compile_config
+from game_logic import GameLogic
+
+
+class TestCandidateTracker(unittest.TestCase):
+    """Test cases for CandidateTracker interval arithmetic"""
+
+    def setUp(self):
+        self.medium = GameLogic.LEVELS["medium"]  # bands 20 / 50
+
+    def test_exclude_splits_interval(self):
+        """Test removing a number from the middle of an interval"""
+        tracker = CandidateTracker(1, 10)
+        tracker.exclude(5)
+        self.assertEqual(tracker.intervals, [(1, 4), (6, 10)])
+        self.assertEqual(tracker.count(), 9)
+        self.assertNotIn(5, tracker)
+
+    def test_apply_hint_bands(self):
+        """Test that each hint band maps to the right interval"""
+        cases = [
+            (40, True, 0, (41, 60)),    # "A bit low": 1-20 above
+            (40, True, 1, (61, 90)),    # "Too low": 21-50 above
+            (40, True, 2, (91, 100)),   # "Way too low": more than 50 above
+            (60, False, 0, (40, 59)),   # "A bit high": 1-20 below
+            (60, False, 2, (1, 9)),     # "Way too high": more than 50 below
+        ]
+        for guess, too_low, band, expected in cases:
+            with self.subTest(guess=guess, band=band):
+                tracker = CandidateTracker(1, 100)
+                tracker.apply_hint(self.medium, guess, too_low, band)
+                self.assertEqual(tracker.intervals, [expected])
+
+    def test_suggest_single_candidate(self):
+        """Test suggesting when only one number is left"""
+        tracker = CandidateTracker(7, 7)
+        self.assertEqual(tracker.suggest(self.medium), 7)
+        self.assertIsNone(CandidateTracker(5, 4).suggest(self.medium))
+
+    def test_suggest_beats_midpoint(self):
+        """Test that the suggestion uses the hint bands, not just bisection"""
+        tracker = CandidateTracker(1, 100)
+        best = tracker.suggest(self.medium)
+        self.assertGreaterEqual(
+            tracker.information(self.medium, best),
+            tracker.information(self.medium, 50)
+        )
+
+    def test_huge_range_is_fast(self):
+        """Test narrowing and suggesting on a 10^12 range"""
+        level = compile_config({"levels": {"huge": {
+            "range": [1, 10 ** 12], "attempts": 50, "points": 10,
+            "hint_bands": [10 ** 6, 10 ** 9]
+        }}})["huge"]
+        tracker = CandidateTracker(1, 10 ** 12)
+        tracker.apply_hint(level, 10 ** 11, True, 2)
+
+        self.assertEqual(tracker.count(), 10 ** 12 - 10 ** 11 - 10 ** 9)
+        guess = tracker.suggest(level)
+        self.assertIn(guess, tracker)
+
+
+class TestGameCandidates(unittest.TestCase):
+    """Test the candidate tracker wired into GameLogic"""
+
+    def test_secret_always_remains_candidate(self):
+        """Test that hints never rule out the secret"""
+        for difficulty in ("easy", "medium", "hard", "expert"):
+            low, high = GameLogic.LEVELS[difficulty].range
+            for secret in range(low, high + 1, 7):
+                with self.subTest(difficulty=difficulty, secret=secret):
+                    game = GameLogic(stats={})
+                    game.autosave = False
+                    game.set_difficulty(difficulty)
+                    game.start_new_game(secret_number=secret)
+                    while game.game_active:
+                        game.make_guess(game.suggest_guess())
+                        self.assertIn(secret, game.candidates)
+
+    def test_candidate_count_in_state(self):
+        """Test that the game state reports the candidate count"""
+        game = GameLogic(stats={})
+        game.autosave = False
+        game.start_new_game(secret_number=70)
+        self.assertEqual(game.get_game_state()["candidate_count"], 100)
+
+        game.make_guess(40)  # "Too low": 61-90
+        self.assertEqual(game.candidate_count(), 30)
+        self.assertIn(game.suggest_guess(), range(61, 91))
+
+    def test_candidates_rebuilt_on_restore(self):
+        """Test that a restored game has the same candidates"""
+        game = GameLogic(stats={})
+        game.start_new_game(secret_number=70)
+        game.make_guess(40)
+
+        restored = GameLogic(stats={})
+        restored.restore_snapshot(game.snapshot())
+        self.assertEqual(restored.candidates.intervals, game.candidates.intervals)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+"""
+test_cluster.py - Unit tests for consistent-hash sharding of game sessions
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+from collections import Counter
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from cluster import ClusterRouter, HashRing
+
+
+class TestHashRing(unittest.TestCase):
+    """Test cases for HashRing"""
+
+    def setUp(self):
+        self.players = [f"player{i}" for i in range(2000)]
+
+    def test_empty_ring(self):
+        """Test lookups on a ring without nodes"""
+        self.assertIsNone(HashRing().get_node("alice"))
+
+    def test_lookup_is_stable(self):
+        """Test that a key always maps to the same node"""
+        ring = HashRing(["a", "b", "c"])
+        self.assertEqual(ring.get_node("alice"), ring.get_node("alice"))
+
+    def test_keys_are_spread(self):
+        """Test that virtual nodes balance keys across nodes"""
+        ring = HashRing(["a", "b", "c", "d"])
+        counts = Counter(ring.get_node(p) for p in self.players)
+
+        self.assertEqual(set(counts), {"a", "b", "c", "d"})
+        for count in counts.values():
+            self.assertGreater(count, len(self.players) / 4 * 0.5)
+
+    def test_adding_node_moves_few_keys(self):
+        """Test that only keys claimed by the new node move"""
+        ring = HashRing(["a", "b", "c"])
+        before = {p: ring.get_node(p) for p in self.players}
+        ring.add_node("d")
+        after = {p: ring.get_node(p) for p in self.players}
+
+        moved = [p for p in self.players if before[p] != after[p]]
+        self.assertTrue(all(after[p] == "d" for p in moved))
+        self.assertLess(len(moved), len(self.players) / 2)
+
+    def test_remove_node(self):
+        """Test that a removed node no longer owns keys"""
+        ring = HashRing(["a", "b"])
+        ring.remove_node("a")
+        self.assertEqual({ring.get_node(p) for p in self.players}, {"b"})
+
+
+class TestClusterRouter(unittest.TestCase):
+    """Integration tests running real worker processes"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.router = ClusterRouter(workers=2, data_dir=self.tmp.name)
+
+    def tearDown(self):
+        self.router.close()
+        self.tmp.cleanup()
+
+    def play_to_win(self, player):
+        """Binary search to a win so the player has stats"""
+        self.router.start_game(player, "easy")
+        low, high = 1, 50
+        while True:
+            guess = (low + high) // 2
+            result = self.router.make_guess(player, guess)
+            if result["game_over"]:
+                return result
+            hint = result["hint"]
+            if "higher" in hint or "bit low" in hint:
+                low = guess + 1
+            else:
+                high = guess - 1
+
+    def test_game_through_router(self):
+        """Test playing a game on the owning worker"""
+        state = self.router.start_game("alice", "easy")
+        self.assertNotIn("secret_number", state)
+        self.assertEqual(state["range"], [1, 50])
+
+        result = self.play_to_win("alice")
+        self.assertTrue(result["game_over"])
+        self.assertEqual(self.router.get_player_stats("alice")["total_games"], 1)
+
+    def test_finished_games_are_evicted(self):
+        """Test that workers only keep sessions of games still in play"""
+        for i in range(6):
+            self.play_to_win(f"p{i}")
+        self.router.start_game("alice", "easy")
+
+        self.assertEqual(self.router.summary()["sessions"], 1)
+        self.assertIn("error", self.router.get_game_state("p0"))
+        self.assertEqual(self.router.start_game("p0", "easy")["guesses"], [])
+
+    def test_temporary_data_dir_is_removed(self):
+        """Test that a router without a data_dir cleans up after itself"""
+        router = ClusterRouter(workers=1)
+        data_dir = router.data_dir
+        self.assertTrue(os.path.isdir(data_dir))
+        router.close()
+        self.assertFalse(os.path.exists(data_dir))
+
+    def test_bad_requests_keep_the_connection(self):
+        """Test that bad requests get errors and the worker keeps serving"""
+        self.router.start_game("alice", "easy")
+        conn = self.router.workers[self.router.ring.get_node("alice")]
+        for request in ({"op": "guess"}, {"op": "guess", "player": "alice", "guess": "ten"},
+                        ["not", "an", "object"], None):
+            with self.subTest(request=request):
+                self.assertIn("error", conn.call(request))
+        with conn.lock:
+            conn.sock.sendall(b"not json\n")
+            self.assertIn("error", conn.receive())
+        stale = ["bob", "legendary", 3, 5, 5, 0, [], False]
+        self.assertEqual(conn.call({"op": "import", "sessions": [stale, "junk"]}),
+                         {"imported": 0})
+
+        self.assertIn("game_over", self.router.make_guess("alice", 25))
+        self.assertEqual(self.router.get_game_state("alice")["guesses"], [25])
+
+    def test_stats_written_per_shard(self):
+        """Test that each worker writes its own stats file"""
+        for i in range(10):
+            self.play_to_win(f"p{i}")
+
+        shard_files = [f for f in os.listdir(self.tmp.name) if f.startswith("game_stats.")]
+        self.assertEqual(len(shard_files), 2)
+
+    def test_leaderboard_and_summary_fan_out(self):
+        """Test aggregate queries across every shard"""
+        for i in range(10):
+            self.play_to_win(f"p{i}")
+
+        top = self.router.leaderboard(3)
+        self.assertEqual(len(top), 3)
+        self.assertEqual([s for _, s in top], sorted((s for _, s in top), reverse=True))
+
+        summary = self.router.summary()
+        self.assertEqual(summary["players"], 10)
+        self.assertEqual(summary["games"], 10)
+        self.assertEqual(len(summary["shards"]), 2)
+
+    def test_rebalance_on_add_and_remove(self):
+        """Test that sessions and stats follow their players"""
+        players = [f"p{i}" for i in range(20)]
+        active = []
+        for player in players:
+            self.play_to_win(player)
+            self.router.start_game(player, "easy")
+            if not self.router.make_guess(player, 1)["game_over"]:
+                active.append(player)
+
+        self.router.add_worker("worker2")
+        self.assertEqual(self.router.summary()["players"], 20)
+        owners = {self.router.worker_for(p) for p in players}
+        self.assertIn("worker2", owners)
+
+        self.router.remove_worker("worker0")
+        summary = self.router.summary()
+        self.assertEqual(summary["players"], 20)
+        self.assertGreaterEqual(summary["sessions"], len(active))
+
+        for player in active:
+            state = self.router.get_game_state(player)
+            self.assertTrue(state["game_active"])
+            self.assertEqual(state["guesses"], [1])
+            self.assertEqual(self.router.get_player_stats(player)["total_games"], 1)
+
+    def test_cannot_remove_last_worker(self):
+        """Test that the cluster keeps at least one worker"""
+        self.router.remove_worker("worker1")
+        with self.assertRaises(ValueError):
+            self.router.remove_worker("worker0")
+
+
+if __name__ == "__main__":
+    unittest.main()
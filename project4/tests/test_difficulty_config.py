@@ -0,0 +1,153 @@
+"""
+test_difficulty_config.py - Unit tests for config-driven difficulty levels
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+import copy
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from difficulty_config import (
+    DEFAULT_CONFIG, DEFAULT_CONFIG_FILE, DifficultyConfigError, compile_config, load_difficulties
+)
+from game_logic import GameLogic
+
+
+class TestCompileConfig(unittest.TestCase):
+    """Test cases for validating and compiling difficulty configs"""
+
+    def setUp(self):
+        self.config = copy.deepcopy(DEFAULT_CONFIG)
+
+    def test_shipped_config_matches_defaults(self):
+        """Test that difficulties.json loads and matches the built-in defaults"""
+        shipped = load_difficulties(DEFAULT_CONFIG_FILE)
+        defaults = compile_config(DEFAULT_CONFIG)
+        self.assertEqual(
+            {n: l.as_dict() for n, l in shipped.items()},
+            {n: l.as_dict() for n, l in defaults.items()}
+        )
+
+    def test_points_table(self):
+        """Test that points per attempt are precomputed"""
+        medium = compile_config(self.config)["medium"]
+        self.assertEqual(medium.points_table, (0, 10, 5, 3, 2, 2, 1, 1))
+        self.assertEqual(medium.points_for(2), 5)
+        self.assertEqual(medium.points_for(100), 1)
+
+    def test_band_lookup(self):
+        """Test bisect-based band lookup at the boundaries"""
+        medium = compile_config(self.config)["medium"]
+        self.assertEqual(medium.band(1), 0)
+        self.assertEqual(medium.band(20), 0)
+        self.assertEqual(medium.band(21), 1)
+        self.assertEqual(medium.band(50), 1)
+        self.assertEqual(medium.band(51), 2)
+
+    def test_invalid_configs(self):
+        """Test that bad configs are rejected with a clear error"""
+        bad_levels = [
+            {"range": [10, 1], "attempts": 3, "points": 10, "hint_bands": [20, 50]},
+            {"range": [1], "attempts": 3, "points": 10, "hint_bands": [20, 50]},
+            {"range": [1, 100], "attempts": 0, "points": 10, "hint_bands": [20, 50]},
+            {"range": [1, 100], "attempts": 3, "points": "10", "hint_bands": [20, 50]},
+            {"range": [1, 100], "attempts": 3, "points": 10, "hint_bands": [50, 20]},
+            {"range": [1, 100], "attempts": 3, "points": 10, "hint_bands": [20]},
+            {"range": [1.5, 100], "attempts": 3, "points": 10, "hint_bands": [20, 50]},
+        ]
+        for level in bad_levels:
+            with self.subTest(level=level):
+                self.config["levels"]["broken"] = level
+                with self.assertRaises(DifficultyConfigError):
+                    compile_config(self.config)
+
+        with self.assertRaises(DifficultyConfigError):
+            compile_config({"levels": {}})
+
+    def test_invalid_json_file(self):
+        """Test that an unparseable config file raises"""
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+            f.write("{oops")
+        try:
+            with self.assertRaises(DifficultyConfigError):
+                load_difficulties(f.name)
+        finally:
+            os.unlink(f.name)
+
+
+class TestConfiguredGame(unittest.TestCase):
+    """Test GameLogic running on custom difficulty configs"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.config_path = os.path.join(self.tmp.name, "difficulties.json")
+        config = copy.deepcopy(DEFAULT_CONFIG)
+        config["levels"]["cosmic"] = {
+            "range": [1, 10 ** 12], "attempts": 40, "points": 1000,
+            "hint_bands": [10 ** 6, 10 ** 9]
+        }
+        with open(self.config_path, 'w') as f:
+            json.dump(config, f)
+        GameLogic.configure_difficulties(self.config_path)
+
+    def tearDown(self):
+        GameLogic.configure_difficulties()
+        self.tmp.cleanup()
+
+    def test_config_without_medium(self):
+        """Test that games start on the first level when there is no medium"""
+        config = {"levels": {"tiny": {"range": [1, 9], "attempts": 3, "points": 5,
+                                      "hint_bands": [2, 5]}}}
+        with open(self.config_path, 'w') as f:
+            json.dump(config, f)
+        GameLogic.configure_difficulties(self.config_path)
+        game = GameLogic(stats={})
+        game.autosave = False
+        self.assertEqual(game.difficulty, "tiny")
+        game.start_new_game()
+        self.assertEqual(game.get_range(), (1, 9))
+
+    def test_huge_range(self):
+        """Test a level with a range of 10^12"""
+        game = GameLogic(stats={})
+        game.autosave = False
+        self.assertTrue(game.set_difficulty("cosmic"))
+        self.assertIn("cosmic", GameLogic.DIFFICULTY_LEVELS)
+
+        game.start_new_game(secret_number=5 * 10 ** 11)
+        self.assertEqual(game.get_range(), (1, 10 ** 12))
+
+        result = game.make_guess(1)
+        self.assertIn("Way too low", result["hint"])
+        result = game.make_guess(5 * 10 ** 11 - 500)
+        self.assertIn("A bit low", result["hint"])
+        self.assertTrue(game.make_guess(5 * 10 ** 11)["correct"])
+
+    def test_duplicate_detection_uses_set(self):
+        """Test duplicate guesses across a restored snapshot"""
+        game = GameLogic(stats={})
+        game.set_difficulty("cosmic")
+        game.start_new_game(secret_number=10 ** 11)
+        game.make_guess(7)
+
+        restored = GameLogic(stats={})
+        restored.restore_snapshot(game.snapshot())
+        self.assertIn("already guessed", restored.make_guess(7)["error"])
+
+    def test_expert_bands_scale_with_range(self):
+        """Test that expert hints use wider bands than medium"""
+        game = GameLogic(stats={})
+        game.set_difficulty("expert")
+        game.secret_number = 300
+        self.assertIn("A bit low", game.get_hint(260))
+        self.assertIn("Too low", game.get_hint(200))
+        self.assertIn("Way too low", game.get_hint(100))
+
+
+if __name__ == "__main__":
+    unittest.main()
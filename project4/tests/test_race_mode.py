@@ -0,0 +1,199 @@
+"""
+test_race_mode.py - Unit tests for the shared-secret race mode
+"""
+
+import unittest
+import sys
+import os
+import threading
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from race_mode import EventBroadcaster, RaceEvent, RaceRoom
+
+
+class TestEventBroadcaster(unittest.TestCase):
+    """Test cases for EventBroadcaster"""
+
+    def test_every_subscriber_sees_same_event(self):
+        """Test that events are shared, not copied, across subscribers"""
+        broadcaster = EventBroadcaster()
+        subs = [broadcaster.subscribe() for _ in range(100)]
+
+        event = ("guess", 42)
+        broadcaster.publish(event)
+
+        for sub in subs:
+            events = sub.poll()
+            self.assertEqual(len(events), 1)
+            self.assertIs(events[0], event)
+
+    def test_poll_only_returns_new_events(self):
+        """Test that a subscriber never sees an event twice"""
+        broadcaster = EventBroadcaster()
+        sub = broadcaster.subscribe()
+
+        broadcaster.publish(1)
+        broadcaster.publish(2)
+        self.assertEqual(sub.poll(), [1, 2])
+        self.assertEqual(sub.poll(), [])
+
+        broadcaster.publish(3)
+        self.assertEqual(sub.poll(), [3])
+
+    def test_late_subscriber_skips_history(self):
+        """Test that subscribing starts at the current end of the log"""
+        broadcaster = EventBroadcaster()
+        broadcaster.publish("old")
+        sub = broadcaster.subscribe()
+        broadcaster.publish("new")
+
+        self.assertEqual(sub.poll(), ["new"])
+
+    def test_slow_subscriber_is_bounded(self):
+        """Test that a lagging subscriber drops the oldest events"""
+        broadcaster = EventBroadcaster(capacity=100)
+        slow = broadcaster.subscribe(max_pending=10)
+
+        for i in range(50):
+            broadcaster.publish(i)
+
+        self.assertEqual(slow.poll(), list(range(40, 50)))
+        self.assertEqual(slow.dropped, 40)
+
+    def test_ring_buffer_capacity(self):
+        """Test that the shared log never grows past its capacity"""
+        broadcaster = EventBroadcaster(capacity=5)
+        sub = broadcaster.subscribe(max_pending=1000)
+
+        for i in range(20):
+            broadcaster.publish(i)
+
+        self.assertEqual(sub.poll(), [15, 16, 17, 18, 19])
+        self.assertEqual(sub.dropped, 15)
+
+    def test_poll_wakes_on_publish(self):
+        """Test that a waiting subscriber is woken by a new event"""
+        broadcaster = EventBroadcaster()
+        sub = broadcaster.subscribe()
+        timer = threading.Timer(0.05, broadcaster.publish, args=("ping",))
+        timer.start()
+
+        self.assertEqual(sub.poll(timeout=2), ["ping"])
+        timer.join()
+
+    def test_publish_after_close(self):
+        """Test that a closed broadcaster rejects events"""
+        broadcaster = EventBroadcaster()
+        broadcaster.close()
+
+        self.assertTrue(broadcaster.closed)
+        with self.assertRaises(RuntimeError):
+            broadcaster.publish("late")
+
+
+class TestRaceRoom(unittest.TestCase):
+    """Test cases for RaceRoom"""
+
+    def setUp(self):
+        """Set up a race with a known secret"""
+        self.room = RaceRoom(difficulty="medium", secret_number=42)
+
+    def test_players_share_secret(self):
+        """Test that all racers guess the same number"""
+        self.room.join("alice")
+        self.room.join("bob")
+
+        for game in self.room.players.values():
+            self.assertEqual(game.secret_number, 42)
+            self.assertTrue(game.game_active)
+        self.assertIs(self.room.players["alice"].stats, self.room.players["bob"].stats)
+
+    def test_duplicate_join(self):
+        """Test that a player cannot join twice"""
+        self.room.join("alice")
+        with self.assertRaises(ValueError):
+            self.room.join("alice")
+
+    def test_unknown_difficulty(self):
+        """Test that an invalid difficulty is rejected"""
+        with self.assertRaises(ValueError):
+            RaceRoom(difficulty="impossible")
+
+    def test_guess_is_broadcast(self):
+        """Test that every racer is told about each guess"""
+        alice = self.room.join("alice")
+        bob = self.room.join("bob")
+
+        result = self.room.make_guess("alice", 10)
+
+        self.assertFalse(result["correct"])
+        self.assertIn("low", result["hint"].lower())
+        expected = RaceEvent("alice", 10, False, 1, False)
+        self.assertEqual(alice.poll(), [expected])
+        self.assertEqual(bob.poll(), [expected])
+
+    def test_first_correct_guess_wins(self):
+        """Test that the race ends for everyone when someone wins"""
+        self.room.join("alice")
+        bob = self.room.join("bob")
+
+        self.room.make_guess("bob", 30)
+        result = self.room.make_guess("alice", 42)
+
+        self.assertTrue(result["correct"])
+        self.assertTrue(result["race_over"])
+        self.assertEqual(self.room.winner, "alice")
+        self.assertFalse(self.room.players["bob"].game_active)
+        self.assertEqual(self.room.stats["alice"]["wins"], 1)
+        self.assertEqual(self.room.stats["bob"]["losses"], 1)
+
+        events = bob.poll()
+        self.assertTrue(events[-1].race_over)
+        self.assertTrue(self.room.broadcaster.closed)
+
+        self.assertIn("error", self.room.make_guess("bob", 42))
+        self.assertEqual(self.room.standings()[0]["player"], "alice")
+
+    def test_race_ends_when_everyone_is_out(self):
+        """Test that the race finishes without a winner"""
+        room = RaceRoom(difficulty="expert", secret_number=250)
+        room.join("alice")
+
+        for guess in (1, 2, 3):
+            result = room.make_guess("alice", guess)
+
+        self.assertTrue(result["race_over"])
+        self.assertIsNone(room.winner)
+        self.assertEqual(room.stats["alice"]["losses"], 1)
+
+    def test_unknown_player(self):
+        """Test guessing without joining"""
+        result = self.room.make_guess("mallory", 42)
+        self.assertIn("error", result)
+
+    def test_concurrent_racers(self):
+        """Test many threads racing in one room"""
+        subs = [self.room.join(f"p{i}") for i in range(50)]
+
+        def play(name):
+            for guess in range(1, 8):
+                if self.room.make_guess(name, guess).get("race_over"):
+                    return
+
+        threads = [threading.Thread(target=play, args=(f"p{i}",)) for i in range(50)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertTrue(self.room.finished)
+        total_games = sum(s["total_games"] for s in self.room.stats.values())
+        self.assertEqual(total_games, 50)
+        for sub in subs:
+            self.assertTrue(sub.poll()[-1].race_over)
+
+
+if __name__ == "__main__":
+    unittest.main()
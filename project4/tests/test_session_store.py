@@ -0,0 +1,189 @@
+"""
+test_session_store.py - Unit tests for pause/resume and session checkpoints
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from game_logic import GameLogic
+from session_store import SessionCheckpointer
+
+
+class TestPauseResume(unittest.TestCase):
+    """Test cases for GameLogic.pause/resume"""
+
+    def setUp(self):
+        """Set up a game in progress"""
+        self.game = GameLogic("TestPlayer", stats={})
+        self.game.autosave = False
+        self.game.start_new_game(secret_number=42)
+
+    def test_pause_blocks_guesses(self):
+        """Test that a paused game rejects guesses"""
+        self.assertTrue(self.game.pause())
+        self.assertTrue(self.game.paused)
+        self.assertFalse(self.game.game_active)
+
+        result = self.game.make_guess(10)
+        self.assertIn("paused", result["error"])
+        self.assertEqual(self.game.guesses, [])
+
+    def test_resume(self):
+        """Test resuming a paused game"""
+        self.game.pause()
+        self.assertTrue(self.game.resume())
+        self.assertTrue(self.game.game_active)
+
+        result = self.game.make_guess(42)
+        self.assertTrue(result["correct"])
+
+    def test_pause_finished_game(self):
+        """Test that only active games can be paused"""
+        self.game.make_guess(42)
+        self.assertFalse(self.game.pause())
+        self.assertFalse(self.game.resume())
+
+    def test_new_game_clears_pause(self):
+        """Test that starting a new game unpauses"""
+        self.game.pause()
+        self.game.start_new_game()
+        self.assertFalse(self.game.paused)
+        self.assertTrue(self.game.game_active)
+
+
+class TestSnapshot(unittest.TestCase):
+    """Test cases for GameLogic.snapshot/restore_snapshot"""
+
+    def test_roundtrip(self):
+        """Test that a restored game continues where it left off"""
+        game = GameLogic("Alice", stats={})
+        game.autosave = False
+        game.set_difficulty("hard")
+        game.start_new_game(secret_number=150)
+        game.make_guess(100)
+        game.make_guess(120)
+
+        restored = GameLogic(stats={})
+        restored.autosave = False
+        restored.restore_snapshot(game.snapshot())
+
+        self.assertEqual(restored.player_name, "Alice")
+        self.assertEqual(restored.get_game_state(), game.get_game_state())
+        self.assertIn("error", restored.make_guess(120))
+        self.assertTrue(restored.make_guess(150)["correct"])
+
+    def test_paused_roundtrip(self):
+        """Test that a paused game is restored paused"""
+        game = GameLogic(stats={})
+        game.start_new_game()
+        game.pause()
+
+        restored = GameLogic(stats={})
+        restored.restore_snapshot(game.snapshot())
+
+        self.assertTrue(restored.paused)
+        self.assertFalse(restored.game_active)
+
+    def test_snapshots_that_no_longer_fit(self):
+        """Test that unknown levels and bad shapes are refused without changes"""
+        good = ["Bob", "easy", 5, 10, 9, 5, [1], False, 1000, []]
+        game = GameLogic(stats={})
+        for bad in (["Bob", "renamed"] + good[2:], good[:5], "Bob",
+                    ["Bob", "easy", 500] + good[3:], good[:6] + [["x"]] + good[7:]):
+            with self.subTest(snapshot=bad):
+                self.assertFalse(game.restore_snapshot(bad))
+                self.assertIsNone(game.secret_number)
+        self.assertTrue(game.restore_snapshot(good))
+
+    def test_no_snapshot_without_game(self):
+        """Test that finished or unstarted games have no snapshot"""
+        game = GameLogic(stats={})
+        game.autosave = False
+        self.assertIsNone(game.snapshot())
+
+        game.start_new_game(secret_number=5)
+        game.make_guess(5)
+        self.assertIsNone(game.snapshot())
+
+
+class TestSessionCheckpointer(unittest.TestCase):
+    """Test cases for SessionCheckpointer"""
+
+    def setUp(self):
+        """Write checkpoints into a temporary directory"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "sessions.json")
+        self.checkpointer = SessionCheckpointer(self.path)
+
+    def tearDown(self):
+        self.checkpointer.stop()
+        self.tmp.cleanup()
+
+    def make_game(self, name, secret):
+        game = GameLogic(name, stats={})
+        game.autosave = False
+        game.start_new_game(secret_number=secret)
+        return game
+
+    def test_checkpoint_and_restore(self):
+        """Test saving and restoring several sessions in bulk"""
+        for i in range(10):
+            game = self.make_game(f"p{i}", 50)
+            game.make_guess(i + 1)
+            self.checkpointer.register(game)
+
+        self.assertEqual(self.checkpointer.checkpoint(), 10)
+
+        restored = SessionCheckpointer(self.path).restore()
+        self.assertEqual(len(restored), 10)
+        self.assertEqual(restored["p3"].guesses, [4])
+        self.assertEqual(restored["p3"].secret_number, 50)
+
+    def test_finished_sessions_are_dropped(self):
+        """Test that games which ended are not checkpointed"""
+        done = self.make_game("done", 7)
+        done.make_guess(7)
+        self.checkpointer.register(done)
+        self.checkpointer.register(self.make_game("live", 7))
+
+        self.assertEqual(self.checkpointer.checkpoint(), 1)
+        self.assertIsNone(self.checkpointer.find("done"))
+        self.assertIsNotNone(self.checkpointer.find("live"))
+
+    def test_missing_or_corrupt_file(self):
+        """Test that a bad checkpoint file is ignored"""
+        self.assertEqual(self.checkpointer.load(), [])
+
+        with open(self.path, 'w') as f:
+            f.write("{not json")
+        self.assertEqual(self.checkpointer.load(), [])
+
+        with open(self.path, 'w') as f:
+            f.write("[1, 2]")
+        self.assertEqual(self.checkpointer.load(), [])
+
+    def test_stale_sessions_are_skipped_and_discarded(self):
+        """Test that snapshots on removed levels are not restored"""
+        self.checkpointer.register(self.make_game("live", 7))
+        self.checkpointer.checkpoint()
+        stale = ["old", "legendary", 3, 5, 5, 0, [], False]
+        with open(self.path) as f:
+            data = json.load(f)
+        data["sessions"].append(stale)
+        with open(self.path, 'w') as f:
+            json.dump(data, f)
+
+        self.assertEqual(list(SessionCheckpointer(self.path).restore()), ["live"])
+        self.checkpointer.discard("old")
+        self.assertIsNone(self.checkpointer.find("old"))
+        self.assertIsNotNone(self.checkpointer.find("live"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+"""
+test_stats_memory.py - Memory budgets and API checks for compact game records
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+import time
+
+# Add parent and benchmarks directories to path to import modules
+PROJECT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, PROJECT_DIR)
+sys.path.insert(0, os.path.join(PROJECT_DIR, 'benchmarks'))
+
+from bench_stats_memory import measure_copies, measure_load, measure_plain_load, write_stats
+from compact_stats import GameRecord, compact_stats, json_default
+
+PLAYERS = 200
+GAMES_PER_PLAYER = 50
+# Large enough that per-game overhead, not interpreter noise, dominates
+PLAYERS_AT_SCALE = 2000
+
+# Budgets for the synthetic stats (8 fields + ~4 guess timings per game)
+MAX_BYTES_PER_GAME = 400
+MAX_FRACTION_OF_PLAIN = 0.6
+MAX_BYTES_PER_COPY = 512
+MAX_LOAD_SECONDS = 5.0
+
+
+class TestGameRecord(unittest.TestCase):
+    """Test that GameRecord reads like the old game dicts"""
+
+    def setUp(self):
+        self.data = {
+            "timestamp": "2026-01-18T13:29:27.260307",
+            "difficulty": "medium",
+            "won": False,
+            "score": 23,
+            "attempts_used": 7,
+            "secret_number": 86,
+            "duration_ms": 51234,
+            "guess_ms": [1200, 800, 4000]
+        }
+
+    def test_dict_access(self):
+        """Test item access, get and equality with a dict"""
+        record = GameRecord.from_dict(self.data)
+        self.assertEqual(record["score"], 23)
+        self.assertEqual(record.get("guess_ms"), [1200, 800, 4000])
+        self.assertIsNone(record.get("missing"))
+        self.assertEqual(record, self.data)
+        with self.assertRaises(KeyError):
+            record["missing"]
+
+    def test_old_records_and_extra_keys(self):
+        """Test records without timing fields and with unknown keys"""
+        old = {k: v for k, v in self.data.items() if k not in ("duration_ms", "guess_ms")}
+        old["note"] = "imported"
+        record = GameRecord.from_dict(old)
+
+        self.assertIsNone(record["duration_ms"])
+        self.assertEqual(record["note"], "imported")
+        self.assertIn("note", record.to_dict())
+
+    def test_json_roundtrip(self):
+        """Test saving compact stats and loading them back"""
+        stats = compact_stats({"p": {"total_games": 1, "games": [dict(self.data)]}})
+        self.assertIsInstance(stats["p"]["games"][0], GameRecord)
+
+        text = json.dumps(stats, default=json_default)
+        self.assertEqual(json.loads(text)["p"]["games"][0], self.data)
+
+    def test_interned_difficulty(self):
+        """Test that difficulty strings are shared between records"""
+        a = GameRecord.from_dict(json.loads(json.dumps(self.data)))
+        b = GameRecord.from_dict(json.loads(json.dumps(self.data)))
+        self.assertIs(a.difficulty, b.difficulty)
+
+    def test_no_instance_dict(self):
+        """Test that records are slot-only objects"""
+        record = GameRecord.from_dict(self.data)
+        self.assertFalse(hasattr(record, "__dict__"))
+
+
+class TestStatsMemoryBudget(unittest.TestCase):
+    """Enforce memory budgets for loaded stats"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmp.name, "game_stats.json")
+        write_stats(cls.path, PLAYERS, GAMES_PER_PLAYER)
+        _, cls.plain = measure_plain_load(cls.path, traced=True)
+        cls.game, _, cls.compact = measure_load(cls.path, traced=True)
+        cls.load_time = measure_load(cls.path)[1]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_bytes_per_game(self):
+        """Test the memory cost of each loaded game"""
+        per_game = self.compact / (PLAYERS * GAMES_PER_PLAYER)
+        self.assertLess(per_game, MAX_BYTES_PER_GAME)
+
+    def test_smaller_than_plain_dicts(self):
+        """Test the saving over plain json.load dicts"""
+        self.assertLess(self.compact, self.plain * MAX_FRACTION_OF_PLAIN)
+
+    def test_player_stats_copies_are_shallow(self):
+        """Test that get_player_stats does not duplicate game records"""
+        _, per_copy = measure_copies(self.game, calls=PLAYERS)
+        self.assertLess(per_copy, MAX_BYTES_PER_COPY)
+
+    def test_load_time(self):
+        """Test that loading stays well within budget"""
+        self.assertLess(self.load_time, MAX_LOAD_SECONDS)
+
+    def test_loaded_stats_keep_shape(self):
+        """Test that loaded stats still read like the JSON file"""
+        self.game.player_name = "player0"
+        stats = self.game.get_player_stats()
+        self.assertEqual(stats["total_games"], GAMES_PER_PLAYER)
+        self.assertEqual(len(stats["games"]), GAMES_PER_PLAYER)
+        self.assertIn(stats["games"][0]["difficulty"], ("easy", "medium", "hard", "expert"))
+
+
+class TestStatsMemoryAtScale(unittest.TestCase):
+    """Enforce the same budgets on 100k games, measured in a single load each"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmp.name, "game_stats.json")
+        write_stats(cls.path, PLAYERS_AT_SCALE, GAMES_PER_PLAYER)
+        _, cls.plain = measure_plain_load(cls.path)
+        game, cls.load_time, cls.compact = measure_load(cls.path)
+        cls.players = len(game.stats)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_all_players_loaded(self):
+        """Test that the streamed file loads completely"""
+        self.assertEqual(self.players, PLAYERS_AT_SCALE)
+
+    def test_bytes_per_game(self):
+        """Test the memory cost of each loaded game at scale"""
+        per_game = self.compact / (PLAYERS_AT_SCALE * GAMES_PER_PLAYER)
+        self.assertLess(per_game, MAX_BYTES_PER_GAME)
+
+    def test_smaller_than_plain_dicts(self):
+        """Test the saving over plain dicts at scale"""
+        self.assertLess(self.compact, self.plain * MAX_FRACTION_OF_PLAIN)
+
+    def test_load_time(self):
+        """Test that loading 100k games stays within budget"""
+        self.assertLess(self.load_time, MAX_LOAD_SECONDS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+"""
+test_timing.py - Unit tests for game timing and percentile sketches
+"""
+
+import unittest
+import sys
+import os
+import json
+import random
+from unittest.mock import patch
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from game_logic import GameLogic
+from latency_sketch import LatencySketch
+
+
+class FakeClock:
+    """Stand-in for time.perf_counter_ns advanced by hand"""
+
+    def __init__(self):
+        self.now = 10 ** 12
+
+    def __call__(self):
+        return self.now
+
+    def advance_ms(self, ms):
+        self.now += ms * 1_000_000
+
+
+class TestLatencySketch(unittest.TestCase):
+    """Test cases for LatencySketch"""
+
+    def test_empty(self):
+        """Test percentiles of an empty sketch"""
+        self.assertIsNone(LatencySketch().quantile(0.5))
+
+    def test_relative_accuracy(self):
+        """Test that quantiles are within the configured accuracy"""
+        rng = random.Random(7)
+        values = sorted(rng.lognormvariate(7, 1.5) for _ in range(20000))
+        sketch = LatencySketch(relative_accuracy=0.02)
+        sketch.update(values)
+
+        for q in (0.5, 0.9, 0.99):
+            with self.subTest(q=q):
+                exact = values[int(q * (len(values) - 1))]
+                self.assertAlmostEqual(sketch.quantile(q) / exact, 1, delta=0.03)
+
+    def test_zero_values(self):
+        """Test that zero-length timings are counted"""
+        sketch = LatencySketch()
+        sketch.update([0, 0, 0, 100])
+        self.assertEqual(sketch.quantile(0.5), 0.0)
+
+    def test_bounded_memory(self):
+        """Test that the bucket count never exceeds the cap"""
+        sketch = LatencySketch(max_buckets=32)
+        sketch.update(1.1 ** i for i in range(1, 2000))
+        self.assertLessEqual(len(sketch.buckets), 32)
+        self.assertEqual(sketch.count, 1999)
+        self.assertAlmostEqual(sketch.quantile(1.0) / 1.1 ** 1999, 1, delta=0.03)
+
+    def test_merge_and_roundtrip(self):
+        """Test merging sketches and saving them as JSON"""
+        a, b = LatencySketch(), LatencySketch()
+        a.update(range(1, 501))
+        b.update(range(501, 1001))
+        a.merge(b)
+
+        restored = LatencySketch.from_dict(json.loads(json.dumps(a.to_dict())))
+        self.assertEqual(restored.count, 1000)
+        self.assertAlmostEqual(restored.quantile(0.5), 500, delta=15)
+        self.assertEqual(set(restored.percentiles()), {"p50", "p90", "p99"})
+
+
+class TestGameTiming(unittest.TestCase):
+    """Test monotonic timing of guesses and games"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = patch('game_logic.time.perf_counter_ns', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.game = GameLogic("Timer", stats={})
+        self.game.autosave = False
+
+    def test_guess_and_game_durations(self):
+        """Test that think time and total time land in the game record"""
+        self.game.start_new_game(secret_number=42)
+        self.clock.advance_ms(1500)
+        self.game.make_guess(10)
+        self.clock.advance_ms(700)
+        self.game.make_guess(42)
+
+        record = self.game.stats["Timer"]["games"][-1]
+        self.assertEqual(record["guess_ms"], [1500, 700])
+        self.assertEqual(record["duration_ms"], 2200)
+
+    def test_pause_is_not_counted(self):
+        """Test that paused time is excluded from timings"""
+        self.game.start_new_game(secret_number=42)
+        self.clock.advance_ms(100)
+        self.game.pause()
+        self.clock.advance_ms(60_000)
+        self.game.resume()
+        self.clock.advance_ms(200)
+        self.game.make_guess(42)
+
+        record = self.game.stats["Timer"]["games"][-1]
+        self.assertEqual(record["guess_ms"], [300])
+        self.assertEqual(record["duration_ms"], 300)
+
+    def test_snapshot_keeps_elapsed_time(self):
+        """Test that a restored game keeps its elapsed time"""
+        self.game.start_new_game(secret_number=42)
+        self.clock.advance_ms(4000)
+        self.game.make_guess(10)
+        snap = self.game.snapshot()
+
+        restored = GameLogic("Timer", stats={})
+        restored.autosave = False
+        self.clock.advance_ms(999_999)
+        restored.restore_snapshot(snap)
+        self.clock.advance_ms(1000)
+        restored.make_guess(42)
+
+        record = restored.stats["Timer"]["games"][-1]
+        self.assertEqual(record["guess_ms"], [4000, 1000])
+        self.assertEqual(record["duration_ms"], 5000)
+
+    def test_old_snapshot_format(self):
+        """Test restoring a snapshot without timing fields"""
+        restored = GameLogic(stats={})
+        restored.restore_snapshot(["Old", "easy", 5, 10, 9, 5, [1], False])
+        self.assertEqual(restored.guess_times_ms, [])
+        self.assertTrue(restored.game_active)
+
+    def test_timing_stats_per_difficulty(self):
+        """Test percentile sketches aggregated per difficulty"""
+        for difficulty, seconds in (("easy", 2), ("easy", 4), ("hard", 10)):
+            self.game.set_difficulty(difficulty)
+            self.game.start_new_game(secret_number=1)
+            self.clock.advance_ms(seconds * 1000)
+            self.game.make_guess(1)
+
+        timing = self.game.get_timing_stats()
+        self.assertEqual(set(timing), {"easy", "hard"})
+        self.assertEqual(timing["easy"]["games"], 2)
+        self.assertAlmostEqual(timing["hard"]["game_ms"]["p50"], 10000, delta=200)
+        self.assertAlmostEqual(timing["easy"]["guess_ms"]["p99"], 4000, delta=100)
+
+
+if __name__ == "__main__":
+    unittest.main()
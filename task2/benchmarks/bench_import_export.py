@@ -0,0 +1,72 @@
+"""
+bench_import_export.py - Streaming JSONL/CSV round trip at scale
+
+Fills an SQLite-backed store with N tasks, exports them as JSONL and
+CSV, measures the peak memory of streaming a file through the reader
+and validator, then imports each file into an empty store and checks
+that the tasks came back unchanged.
+
+Usage: python benchmarks/bench_import_export.py [tasks ...]
+"""
+
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from task_io import TaskExporter, TaskImporter, TaskReader, validate
+from todo_storage import SqliteTaskStorage
+from todo_store import TodoStore
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def stream_peak(path):
+    """Peak traced bytes while reading and validating every record"""
+    gc.collect()
+    tracemalloc.start()
+    reader = TaskReader(path)
+    for _, record in reader:
+        validate(record)
+    reader.close()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [1_000_000]
+    for count in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = TodoStore(SqliteTaskStorage(os.path.join(tmp, "source.db")))
+            _, fill = timed(lambda: store.add_many(f"Synthetic task {i}" for i in range(count)))
+            store.set_completed_many(range(1, count + 1, 3))
+
+            print(f"Tasks: {count} (filled in {fill:.1f} s)")
+            for name in ("tasks.jsonl", "tasks.csv"):
+                path = os.path.join(tmp, name)
+                _, export = timed(TaskExporter(store.tasks, path).run)
+                peak = stream_peak(path)
+
+                target = TodoStore(SqliteTaskStorage(os.path.join(tmp, name + ".db")))
+                imported, load = timed(TaskImporter(target, path).run)
+                same = target.tasks == store.tasks
+                target.close()
+
+                print(f"  {name:12s} {os.path.getsize(path) / 2**20:6.0f} MiB  "
+                      f"export {export:5.1f} s  import {load:5.1f} s  "
+                      f"stream peak {peak / 1024:.0f} KiB  "
+                      f"round trip {'ok' if same and imported == count else 'MISMATCH'}")
+            store.close()
+
+
+if __name__ == "__main__":
+    main()
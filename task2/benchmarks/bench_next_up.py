@@ -0,0 +1,87 @@
+"""
+bench_next_up.py - "Next up" from the heap vs sorting every pending task
+
+Builds N tasks (default 100k and 1M) with random priorities and due
+dates, then times the top 10 from the next_up heap against sorting all
+pending tasks by urgency, including a burst of changes in between. Also
+times the renewal heap with thousands of completed repeating tasks.
+
+Usage: python benchmarks/bench_next_up.py [tasks ...]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from bench_store import MemoryStorage
+from recurrence import REPEATS, urgency
+from todo_store import TodoStore
+
+TOP = 10
+ROUNDS = 20
+REPEATING = 5000
+
+
+def build(count):
+    rng = random.Random(42)
+    store = TodoStore(MemoryStorage())
+    store.add_many(f"Task {i}" for i in range(count))
+    for task in store.tasks:
+        task["priority"] = rng.randrange(4)
+        if rng.random() < 0.5:
+            task["due"] = f"2026-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}"
+    return store, rng
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [100_000, 1_000_000]
+    for count in sizes:
+        store, rng = build(count)
+        build_time, _ = timed(lambda: store.next_up(TOP))
+
+        heap_total = sort_total = 0.0
+        for _ in range(ROUNDS):
+            # A few edits between reads, as while someone works the list
+            for task_id in rng.sample(range(1, count + 1), 5):
+                store.set_priority(task_id, rng.randrange(4))
+            store.complete(store.next_up(1)[0].id)
+            heap_time, top = timed(lambda: store.next_up(TOP))
+            sort_time, ranked = timed(
+                lambda: sorted((t for t in store.tasks if not t.completed), key=urgency)[:TOP]
+            )
+            assert top == ranked
+            heap_total += heap_time
+            sort_total += sort_time
+
+        print(f"Tasks: {count}")
+        print(f"  heap build (first use) {build_time * 1000:9.1f} ms")
+        print(f"  next_up({TOP}) from heap  {heap_total / ROUNDS * 1000:9.3f} ms")
+        print(f"  full sort of pending   {sort_total / ROUNDS * 1000:9.1f} ms")
+
+        # Repeating tasks waiting to come back: one heap, one timer target
+        repeating = rng.sample(range(1, count + 1), min(REPEATING, count))
+        for task_id in repeating:
+            task = store.get(task_id)
+            if not task.completed:
+                task["repeat"] = rng.choice(REPEATS)
+                task["due"] = f"2026-01-{rng.randrange(1, 29):02d}"
+        store.set_completed_many(repeating)
+        heap_time, day = timed(store.next_renewal)
+        renew_time, renewed = timed(lambda: store.renew_repeating("2026-01-15"))
+        print(f"  renewal heap ({len(repeating)} repeating) first use {heap_time * 1000:6.1f} ms,"
+              f" next day {day}")
+        print(f"  renewed {len(renewed)} task(s) in {renew_time * 1000:.1f} ms;"
+              f" next renewal {store.next_renewal()}")
+
+
+if __name__ == "__main__":
+    main()
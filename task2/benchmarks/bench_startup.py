@@ -0,0 +1,109 @@
+"""
+bench_startup.py - Time to first paint and to interactive at startup
+
+For each size (default 10k and 100k tasks) writes a task file and
+compares loading everything up front with the progressive load the GUI
+uses: time until the first page is available, time until every task is
+in, and the longest single chunk (how long the window can stall).
+
+With a display it also opens TodoListApp on the file and reports when
+the first page is drawn and when loading has finished.
+
+Usage: python benchmarks/bench_startup.py [tasks ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from task_record import Task
+from todo_storage import JsonTaskStorage, SqliteTaskStorage, migrate_json_to_sqlite
+from todo_store import TodoStore
+
+FIRST_PAGE = 200
+CHUNK = 5000
+
+
+def write_tasks(path, count):
+    tasks = [Task(i, f"Synthetic task number {i}", i % 3 == 0, "2026-01-01 09:00",
+                  "2026-01-02 10:00" if i % 3 == 0 else None, None)
+             for i in range(1, count + 1)]
+    JsonTaskStorage(path).replace_all(tasks, count + 1)
+
+
+def headless(storage_class, path):
+    start = time.perf_counter()
+    TodoStore(storage_class(path))
+    eager = time.perf_counter() - start
+
+    start = time.perf_counter()
+    store = TodoStore(storage_class(path), progressive=True)
+    store.load_step(FIRST_PAGE)
+    first = time.perf_counter() - start
+    longest = 0.0
+    more = True
+    while more:
+        step = time.perf_counter()
+        more = store.load_step(CHUNK)
+        longest = max(longest, time.perf_counter() - step)
+    full = time.perf_counter() - start
+    return eager, first, full, longest
+
+
+def gui(directory):
+    """(first paint, interactive) seconds for the app, or None without a display"""
+    import tkinter as tk
+    from to_do_list_app import TodoListApp
+
+    cwd = os.getcwd()
+    os.chdir(directory)  # the app opens todo_gui.json in the working directory
+    try:
+        start = time.perf_counter()
+        try:
+            app = TodoListApp()
+        except tk.TclError:
+            return None
+        app.root.update()
+        first = time.perf_counter() - start
+        while app.store.loading:
+            app.root.update()
+        interactive = time.perf_counter() - start
+        app.store.close()
+        app.root.destroy()
+        return first, interactive
+    finally:
+        os.chdir(cwd)
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [10_000, 100_000]
+    for count in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path = os.path.join(tmp, "todo_gui.json")
+            db_path = os.path.join(tmp, "todo_gui.db")
+            write_tasks(json_path, count)
+            db = SqliteTaskStorage(db_path)
+            migrate_json_to_sqlite(json_path, db)
+            db.close()
+
+            print(f"Tasks: {count}")
+            for name, storage_class, path in (("JSON", JsonTaskStorage, json_path),
+                                              ("SQLite", SqliteTaskStorage, db_path)):
+                eager, first, full, longest = headless(storage_class, path)
+                print(f"  {name:6s} load all {eager * 1000:7.1f} ms | progressive: "
+                      f"first page {first * 1000:6.1f} ms, all {full * 1000:7.1f} ms, "
+                      f"longest chunk {longest * 1000:5.1f} ms")
+
+            result = gui(tmp)
+            if result is None:
+                print("  GUI    skipped (no display)")
+            else:
+                print(f"  GUI    first paint {result[0] * 1000:7.1f} ms, "
+                      f"interactive {result[1] * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
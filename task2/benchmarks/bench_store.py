@@ -0,0 +1,164 @@
+"""
+bench_store.py - Time each TodoStore operation from 10^3 to 10^6 tasks
+
+Fills a store with N tasks (a third of them completed, some with due
+dates), then times single adds, completes, edits and deletes, searches,
+filter views and clear_completed. Storage is in memory by default so the
+numbers show the store itself; --storage sqlite or json includes the
+cost of writing each change.
+
+Results can be written as JSON with --json and compared against an
+earlier run with --compare, which flags operations that got slower.
+
+Usage: python benchmarks/bench_store.py [--sizes 1000 10000 ...]
+           [--storage memory|sqlite|json] [--json out.json] [--compare base.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from todo_storage import JsonTaskStorage, SqliteTaskStorage
+from todo_store import TodoStore
+
+WORDS = ("buy", "fix", "write", "call", "review", "plan", "clean", "email",
+         "report", "bug", "groceries", "meeting", "invoice", "garden", "car")
+QUERIES = ("fix bug", "rep", "meeting invoice", "gro")
+REPEAT = 200  # single-task operations timed per size
+SLOWER = 1.25  # --compare flags operations at least this much slower
+
+
+class MemoryStorage:
+    """Storage backend that keeps nothing, for timing the store alone"""
+
+    next_id = None
+
+    def load(self):
+        return []
+
+    def insert(self, task, tasks, next_id):
+        pass
+
+    def insert_many(self, new, tasks, next_id):
+        pass
+
+    def update(self, task, tasks):
+        pass
+
+    def update_many(self, changed, tasks):
+        pass
+
+    def delete(self, task_ids, tasks):
+        pass
+
+    def replace_all(self, tasks, next_id=None):
+        pass
+
+    def close(self):
+        pass
+
+
+def open_backend(kind, tmp):
+    if kind == "sqlite":
+        return SqliteTaskStorage(os.path.join(tmp, "bench.db"))
+    if kind == "json":
+        return JsonTaskStorage(os.path.join(tmp, "bench.json"))
+    return MemoryStorage()
+
+
+def task_text(rng):
+    return " ".join(rng.choice(WORDS) for _ in range(4))
+
+
+def timed(fn, repeat=1):
+    """Seconds per call of fn(), averaged over repeat calls"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def bench_size(count, kind):
+    """Return {operation: seconds per operation} for a store of count tasks"""
+    rng = random.Random(count)
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        store = TodoStore(open_backend(kind, tmp))
+        texts = [task_text(rng) for _ in range(count)]
+        results["fill (per task)"] = timed(lambda: store.add_many(texts)) / count
+        store.set_completed_many(range(1, count + 1, 3))
+        for task_id in range(2, count + 1, 7):
+            store.set_due(task_id, f"2026-{task_id % 12 + 1:02d}-{task_id % 28 + 1:02d}")
+
+        repeat = min(REPEAT, count // 10)
+        ids = iter(rng.sample(range(1, count + 1), repeat * 3))
+        results["add"] = timed(lambda: store.add(task_text(rng)), repeat)
+        results["complete"] = timed(lambda: store.complete(next(ids)), repeat)
+        results["edit"] = timed(lambda: store.edit(next(ids), task_text(rng)), repeat)
+        results["delete"] = timed(lambda: store.delete(next(ids)), repeat)
+
+        results["search (index build)"] = timed(lambda: store.search_index)
+        for query in QUERIES:
+            results[f"search '{query}'"] = timed(lambda: store.search(query, 200), 5)
+
+        results["view (index build)"] = timed(lambda: store.date_indexes)
+        for name, sort in (("pending", "added"), ("completed", "completed"),
+                           ("overdue", "due"), ("all", "newest")):
+            results[f"view {name}/{sort}"] = timed(lambda: store.view(name, sort), 3)
+
+        results["clear_completed"] = timed(store.clear_completed)
+        store.close()
+    return results
+
+
+def compare(runs, baseline):
+    """Print operations that are slower than in the baseline run"""
+    old = {(r["tasks"], r["op"]): r["seconds"] for r in baseline["results"]}
+    slower = 0
+    for run in runs:
+        before = old.get((run["tasks"], run["op"]))
+        if before and run["seconds"] >= before * SLOWER:
+            slower += 1
+            print(f"  SLOWER {run['tasks']:>9} {run['op']:28s} "
+                  f"{before * 1e6:10.1f} -> {run['seconds'] * 1e6:10.1f} us")
+    print(f"{slower} operation(s) slower than the baseline by {SLOWER:.2f}x or more")
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--storage", choices=("memory", "sqlite", "json"), default="memory")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--compare", help="earlier --json output to compare against")
+    args = parser.parse_args()
+
+    runs = []
+    for count in args.sizes:
+        print(f"Tasks: {count} ({args.storage} storage)")
+        for op, seconds in bench_size(count, args.storage).items():
+            print(f"  {op:28s} {seconds * 1e6:12.1f} us")
+            runs.append({"tasks": count, "op": op, "seconds": seconds})
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({
+                "python": platform.python_version(),
+                "storage": args.storage,
+                "results": runs
+            }, f, indent=2)
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            sys.exit(1 if compare(runs, json.load(f)) else 0)
+
+
+if __name__ == "__main__":
+    main()
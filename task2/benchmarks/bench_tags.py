@@ -0,0 +1,82 @@
+"""
+bench_tags.py - Tag filters on the bitmap index vs scanning every task
+
+Builds N tasks (default 100k and 1M) carrying a few of 50 tags, then times
+filters like "#work AND NOT completed" on the tag bitmaps against a scan
+of the task list, with a burst of changes between rounds so the index is
+kept up to date incrementally.
+
+Usage: python benchmarks/bench_tags.py [tasks ...]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from bench_store import MemoryStorage
+from task_tags import parse_tags
+from todo_store import TodoStore
+
+TAGS = ["work", "home", "errand"] + [f"tag{i}" for i in range(47)]
+ROUNDS = 10
+# (filter, the same test on one task's tags and completed flag)
+FILTERS = [
+    ("#work AND NOT completed", lambda tags, done: "work" in tags and not done),
+    ("#home OR #errand", lambda tags, done: "home" in tags or "errand" in tags),
+    ("#tag7 AND #work", lambda tags, done: "tag7" in tags and "work" in tags),
+]
+
+
+def build(count):
+    rng = random.Random(42)
+    store = TodoStore(MemoryStorage())
+    # Skewed tag use: the first tags are common, the rest rare
+    store.add_many(
+        f"Task {i} " + " ".join(f"#{t}" for t in
+                                {TAGS[min(int(rng.expovariate(0.3)), 49)] for _ in range(2)})
+        for i in range(count)
+    )
+    store.set_completed_many(rng.sample(range(1, count + 1), count // 3))
+    return store, rng
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [100_000, 1_000_000]
+    for count in sizes:
+        store, rng = build(count)
+        build_time, _ = timed(lambda: store.tag_index)
+        print(f"Tasks: {count}")
+        print(f"  bitmap index build     {build_time * 1000:9.1f} ms")
+
+        for query, test in FILTERS:
+            bitmap_total = scan_total = 0.0
+            for _ in range(ROUNDS):
+                for task_id in rng.sample(range(1, count + 1), 5):
+                    if store.get(task_id) is not None:
+                        store.edit(task_id, f"Edited #{rng.choice(TAGS)}")
+                store.set_completed_many(rng.sample(range(1, count + 1), 5))
+                bitmap_time, found = timed(lambda: store.tagged(query))
+                scan_time, scanned = timed(
+                    lambda: [t for t in store.tasks if test(parse_tags(t.task), t.completed)]
+                )
+                assert found == scanned
+                bitmap_total += bitmap_time
+                scan_total += scan_time
+            print(f"  {query!r:28} {len(found):>8} match(es): bitmaps"
+                  f" {bitmap_total / ROUNDS * 1000:8.1f} ms, scan {scan_total / ROUNDS * 1000:8.1f} ms")
+
+        counts_time, counts = timed(store.tag_counts)
+        print(f"  tag counts for chips   {counts_time * 1000:9.2f} ms ({len(counts)} tags)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+bench_task_list.py - Refresh and scroll cost of the virtualized task list
+
+Fills a VirtualTaskList with N synthetic tasks, then measures a full
+refresh (set_tasks + idle redraw) and the average cost of one scroll
+step through the list. Needs a display.
+
+Usage: python benchmarks/bench_task_list.py [tasks ...]
+"""
+
+import os
+import sys
+import time
+import tkinter as tk
+from tkinter import font
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from task_list_view import VirtualTaskList
+
+SCROLL_STEPS = 200
+
+
+def make_tasks(count):
+    return [
+        {
+            "id": i,
+            "task": f"Synthetic task number {i}",
+            "completed": i % 3 == 0,
+            "created_at": "2026-01-01 09:00",
+            "completed_at": "2026-01-02 09:00" if i % 3 == 0 else None
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def measure(root, view, tasks):
+    """Return (refresh seconds, seconds per scroll step, pooled rows)"""
+    start = time.perf_counter()
+    view.set_tasks(tasks)
+    root.update_idletasks()
+    refresh = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for step in range(SCROLL_STEPS):
+        view.canvas.yview_moveto(step / SCROLL_STEPS)
+        root.update_idletasks()
+    scroll = (time.perf_counter() - start) / SCROLL_STEPS
+    return refresh, scroll, len(view.rows)
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [1_000, 10_000, 100_000]
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Cannot open a window: {e}")
+        sys.exit(1)
+    root.geometry("800x600")
+    view = VirtualTaskList(root, font.Font(family="Arial", size=12),
+                           on_complete=lambda tid: None, on_delete=lambda tid: None)
+    root.update()
+
+    for count in sizes:
+        tasks = make_tasks(count)
+        view.canvas.yview_moveto(0)
+        refresh, scroll, rows = measure(root, view, tasks)
+        print(f"Tasks: {count}")
+        print(f"  refresh:      {refresh * 1000:.1f} ms")
+        print(f"  scroll step:  {scroll * 1000:.2f} ms")
+        print(f"  pooled rows:  {rows}")
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+bench_task_memory.py - Memory per task: plain dicts vs compact Task records
+
+Builds N tasks (default 1M) the way the store holds them (a list plus an
+ID index), once as dicts and once as Task records, and reports the
+traced bytes per task. Tasks are created in bursts that share a
+timestamp, as with imports and pastes, and a third are completed.
+
+Usage: python benchmarks/bench_task_memory.py [tasks ...]
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from task_record import Task
+
+BURST = 100  # tasks created in the same minute
+
+
+def stamp(i):
+    # A fresh string each call, as now_stamp() and the JSON parser return
+    minute = i // BURST
+    return f"2026-{minute // 40000 % 12 + 1:02d}-{minute // 1440 % 28 + 1:02d} " \
+           f"{minute // 60 % 24:02d}:{minute % 60:02d}"
+
+
+def fields(i):
+    completed = i % 3 == 0
+    return (i + 1, f"Synthetic task number {i}", completed, stamp(i),
+            stamp(i + 50) if completed else None, None)
+
+
+def as_dict(i):
+    task_id, text, completed, created_at, completed_at, due = fields(i)
+    return {"id": task_id, "task": text, "completed": completed,
+            "created_at": created_at, "completed_at": completed_at, "due": due}
+
+
+def as_record(i):
+    return Task(*fields(i))
+
+
+def measure(count, make):
+    """Traced bytes per task for a list and ID index of count tasks"""
+    gc.collect()
+    tracemalloc.start()
+    tasks = [make(i) for i in range(count)]
+    index = {t["id"]: t for t in tasks}
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tasks, index
+    return current / count
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [1_000_000]
+    for count in sizes:
+        dicts = measure(count, as_dict)
+        records = measure(count, as_record)
+        print(f"Tasks: {count}")
+        print(f"  dict tasks   {dicts:6.0f} bytes/task  ({dicts * count / 2**20:6.0f} MiB)")
+        print(f"  Task records {records:6.0f} bytes/task  ({records * count / 2**20:6.0f} MiB)")
+        print(f"  saved        {1 - records / dicts:6.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+bench_tree.py - Opening a deep task tree and keeping its counts
+
+Builds N tasks (default 10k and 200k) as one project whose tasks have
+FANOUT subtasks each, so the tree is log(N) / log(FANOUT) levels deep,
+then times building the tree, listing the rows of a
+collapsed tree view, expanding one project, and completing tasks with
+the counts updated up the tree against recounting a subtree.
+
+Usage: python benchmarks/bench_tree.py [tasks ...]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from bench_store import MemoryStorage
+from task_tree import TaskOutline
+from todo_store import TodoStore
+
+FANOUT = 8
+ROUNDS = 100
+
+
+def build(count):
+    rng = random.Random(42)
+    store = TodoStore(MemoryStorage())
+    store.add_many(f"Task {i}" for i in range(count))
+    # Set before the tree is first used, as if loaded from the file
+    for task in store.tasks[1:]:
+        task["parent"] = (task.id - 2) // FANOUT + 1
+    return store, rng
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [10_000, 200_000]
+    for count in sizes:
+        store, rng = build(count)
+        build_time, tree = timed(lambda: store.tree)
+        open_time, outline = timed(lambda: TaskOutline(store))
+        rows = len(outline.tasks)
+        expand_time, _ = timed(lambda: outline.toggle(0))
+        print(f"Tasks: {count}")
+        print(f"  tree build             {build_time * 1000:9.1f} ms")
+        print(f"  tree view opened       {open_time * 1000:9.2f} ms ({rows} row(s))")
+        print(f"  expand the project     {expand_time * 1000:9.2f} ms ({len(outline.tasks)} rows)")
+
+        incremental = recount = 0.0
+        for _ in range(ROUNDS):
+            task_id = rng.randrange(2, count + 1)
+            completed = not store.get(task_id).completed
+            change_time, _ = timed(lambda: store.set_completed_many([task_id], completed))
+            scan_time, counted = timed(
+                lambda: sum(store.get(i).completed for i in tree.descendant_ids(1))
+            )
+            assert store.progress(1) == (counted, count - 1)
+            incremental += change_time
+            recount += scan_time
+        print(f"  complete + counts      {incremental / ROUNDS * 1000:9.3f} ms,"
+              f" recounting the root {recount / ROUNDS * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
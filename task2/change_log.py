@@ -0,0 +1,53 @@
+"""
+change_log.py - Versioned log of changed task IDs
+Lets sync clients ask what changed since the version they last saw
+"""
+
+import uuid
+from bisect import bisect_right
+
+
+class ChangeLog:
+    """Task IDs touched by each change, numbered by a version counter
+
+    Every change to the store gets the next version and logs the IDs it
+    touched; since(version) returns the IDs changed after it. Only the
+    newest MAX_ENTRIES IDs are kept, so a client that fell too far behind
+    (or a log from before a restart, see epoch) gets None and must fetch
+    everything again.
+    """
+
+    MAX_ENTRIES = 100_000
+
+    def __init__(self, max_entries=None):
+        self.max_entries = max_entries or self.MAX_ENTRIES
+        self.epoch = uuid.uuid4().hex[:12]  # tells clients the log was restarted
+        self.version = 0
+        self.oldest = 0      # since() answers for versions >= oldest
+        self._versions = []  # version of each entry, ascending
+        self._ids = []
+
+    def record(self, task_ids):
+        """Log the IDs touched by one change and return its version"""
+        self.version += 1
+        for task_id in task_ids:
+            self._versions.append(self.version)
+            self._ids.append(task_id)
+        if len(self._ids) > 2 * self.max_entries:
+            self._trim()
+        return self.version
+
+    def _trim(self):
+        # Cut on a version boundary so a version is never half logged
+        cut = len(self._ids) - self.max_entries
+        cut = bisect_right(self._versions, self._versions[cut])
+        self.oldest = self._versions[cut - 1]
+        del self._versions[:cut]
+        del self._ids[:cut]
+
+    def since(self, version):
+        """IDs changed after version (oldest first, no repeats), or None if unknown"""
+        if version < self.oldest or version > self.version:
+            return None
+        start = bisect_right(self._versions, version)
+        return list(dict.fromkeys(self._ids[start:]))
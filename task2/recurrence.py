@@ -0,0 +1,95 @@
+"""
+recurrence.py - Priorities and repeat rules for tasks
+Date arithmetic for repeating tasks and the keys that order "next up"
+"""
+
+import calendar
+from datetime import date, timedelta
+
+# Priority names by value; tasks store the number (0 is the default)
+PRIORITIES = ("none", "low", "medium", "high")
+REPEATS = ("daily", "weekly", "monthly", "yearly")
+
+# Sorts after every real "YYYY-MM-DD" date
+NO_DUE = "9999-99-99"
+
+
+def priority_value(name):
+    """Priority number for a name like "high" (or a number as text)"""
+    if name in PRIORITIES:
+        return PRIORITIES.index(name)
+    try:
+        value = int(name)
+    except (TypeError, ValueError):
+        raise ValueError(f"Unknown priority '{name}'") from None
+    if not 0 <= value < len(PRIORITIES):
+        raise ValueError(f"Priority must be 0-{len(PRIORITIES) - 1}")
+    return value
+
+
+def check_repeat(repeat):
+    """Return repeat if it is a known rule or None, else raise ValueError"""
+    if repeat is not None and repeat not in REPEATS:
+        raise ValueError(f"Unknown repeat '{repeat}' (use {', '.join(REPEATS)})")
+    return repeat
+
+
+def _add_months(day, months):
+    month = day.month - 1 + months
+    year = day.year + month // 12
+    month = month % 12 + 1
+    # The 31st repeats on the last day of shorter months
+    return day.replace(year=year, month=month,
+                       day=min(day.day, calendar.monthrange(year, month)[1]))
+
+
+def next_date(day, repeat):
+    """'YYYY-MM-DD' one repeat period after day"""
+    d = date.fromisoformat(day)
+    if repeat == "daily":
+        d += timedelta(days=1)
+    elif repeat == "weekly":
+        d += timedelta(weeks=1)
+    elif repeat == "monthly":
+        d = _add_months(d, 1)
+    elif repeat == "yearly":
+        d = _add_months(d, 12)
+    else:
+        raise ValueError(f"Unknown repeat '{repeat}'")
+    return d.isoformat()
+
+
+def anchor(task):
+    """Day a repeating task's next period is counted from
+
+    The due date when it has one, otherwise the day it was completed.
+    """
+    return task.get("due") or (task["completed_at"] or task["created_at"])[:10]
+
+
+def renewal_date(task):
+    """Day a completed repeating task comes back, or None if it does not"""
+    if not task["completed"] or not task.get("repeat"):
+        return None
+    return next_date(anchor(task), task["repeat"])
+
+
+def next_due(task, today):
+    """Due date of the next occurrence: the first period on or after today
+
+    Periods missed while the app was closed are skipped rather than
+    created one by one.
+    """
+    day = next_date(anchor(task), task["repeat"])
+    while day < today:
+        day = next_date(day, task["repeat"])
+    return day
+
+
+def urgency(task):
+    """Key ordering pending tasks most urgent first
+
+    Higher priority first, then the earliest due date (tasks without one
+    last), then the oldest task.
+    """
+    return (-(task.get("priority") or 0), task.get("due") or NO_DUE, task["id"])
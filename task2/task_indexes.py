@@ -0,0 +1,256 @@
+"""
+task_indexes.py - Sorted date indexes and status buckets over tasks
+Filter views are answered with bisect range scans instead of full scans;
+LazyHeap keeps tasks ordered by a key that changes (e.g. urgency)
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from heapq import heapify, heappop, heappush
+
+
+class SortedIndex:
+    """Task IDs ordered by a sort key (ties ordered by ID)
+
+    Keys and IDs are kept in two parallel lists, so a range of keys is a
+    slice found with bisect. Tasks are mostly added in key order, which
+    makes inserts appends.
+    """
+
+    # Batches this large are merged with one sort instead of inserted one by one
+    MERGE_AT = 64
+
+    def __init__(self, pairs=()):
+        # None keys are left out, as add() does
+        pairs = sorted(p for p in pairs if p[0] is not None)
+        self.keys = [k for k, _ in pairs]
+        self.ids = [i for _, i in pairs]
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _find(self, key, task_id):
+        lo = bisect_left(self.keys, key)
+        hi = bisect_right(self.keys, key, lo)
+        return bisect_left(self.ids, task_id, lo, hi)
+
+    def add(self, key, task_id):
+        if key is None:
+            return
+        pos = self._find(key, task_id)
+        self.keys.insert(pos, key)
+        self.ids.insert(pos, task_id)
+
+    def remove(self, key, task_id):
+        if key is None:
+            return
+        pos = self._find(key, task_id)
+        if pos < len(self.ids) and self.ids[pos] == task_id and self.keys[pos] == key:
+            del self.keys[pos]
+            del self.ids[pos]
+
+    def add_many(self, pairs):
+        """Add (key, id) pairs in one merge instead of one insert each"""
+        pairs = [p for p in pairs if p[0] is not None]
+        if len(pairs) < self.MERGE_AT:
+            for key, task_id in pairs:
+                self.add(key, task_id)
+        else:
+            self.__init__(list(zip(self.keys, self.ids)) + pairs)
+
+    def remove_ids(self, task_ids):
+        """Drop every entry whose ID is in the set task_ids, in one pass"""
+        kept = [(k, i) for k, i in zip(self.keys, self.ids) if i not in task_ids]
+        self.keys = [k for k, _ in kept]
+        self.ids = [i for _, i in kept]
+
+    def range(self, low=None, high=None):
+        """IDs with low <= key < high, in key order (None means unbounded)"""
+        lo = 0 if low is None else bisect_left(self.keys, low)
+        hi = len(self.keys) if high is None else bisect_left(self.keys, high)
+        return self.ids[lo:hi]
+
+
+class LazyHeap:
+    """Min-heap of task IDs by key, where an ID's key can change
+
+    keys maps each ID to its current key. Changing or dropping a key
+    leaves the old heap entry behind; stale entries are skipped when
+    they come to the top, and the heap is rebuilt once they outnumber
+    the live ones. Reading the k smallest costs O(k log n) however many
+    tasks there are.
+    """
+
+    def __init__(self, pairs=()):
+        self.keys = {task_id: key for key, task_id in pairs if key is not None}
+        self._heap = [(key, task_id) for task_id, key in self.keys.items()]
+        heapify(self._heap)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def set(self, task_id, key):
+        """Give task_id a new key, or drop it with None"""
+        if key is None:
+            self.keys.pop(task_id, None)
+        elif self.keys.get(task_id) != key:
+            self.keys[task_id] = key
+            heappush(self._heap, (key, task_id))
+        if len(self._heap) > 2 * len(self.keys) + 64:
+            self.__init__([(k, i) for i, k in self.keys.items()])
+
+    def _live(self, entry):
+        return self.keys.get(entry[1]) == entry[0]
+
+    def peek(self):
+        """(key, id) with the smallest key, or None"""
+        heap = self._heap
+        while heap and not self._live(heap[0]):
+            heappop(heap)
+        return heap[0] if heap else None
+
+    def smallest(self, count):
+        """IDs of the count smallest keys, smallest first"""
+        heap = self._heap
+        taken = []
+        seen = set()
+        while heap and len(taken) < count:
+            entry = heappop(heap)
+            # An ID set back to an earlier key has two live entries
+            if self._live(entry) and entry[1] not in seen:
+                seen.add(entry[1])
+                taken.append(entry)
+        for entry in taken:
+            heappush(heap, entry)
+        return [task_id for _, task_id in taken]
+
+    def pop_upto(self, key):
+        """Remove and return the IDs whose key is <= key, smallest first"""
+        ids = []
+        while True:
+            top = self.peek()
+            if top is None or top[0] > key:
+                return ids
+            heappop(self._heap)
+            del self.keys[top[1]]
+            ids.append(top[1])
+
+
+def day_after(day):
+    """'YYYY-MM-DD' of the day after day"""
+    return (date.fromisoformat(day) + timedelta(days=1)).isoformat()
+
+
+class TaskIndexes:
+    """Sorted indexes over created_at, completed_at and due date
+
+    The pending and completed buckets are themselves sorted indexes (by
+    created and completion time), and due dates are indexed for pending
+    tasks only, so every filter view is a single range slice.
+
+    Timestamps are "YYYY-MM-DD HH:MM" strings and due dates "YYYY-MM-DD",
+    both of which sort correctly as text, so a day is a range bound.
+    """
+
+    def __init__(self, tasks=()):
+        tasks = list(tasks)
+        self.created = SortedIndex((t["created_at"], t["id"]) for t in tasks)
+        self.pending = SortedIndex((t["created_at"], t["id"]) for t in tasks if not t["completed"])
+        self.completed = SortedIndex(
+            (t["completed_at"] or "", t["id"]) for t in tasks if t["completed"]
+        )
+        self.due = SortedIndex(
+            (t["due"], t["id"]) for t in tasks if t.get("due") and not t["completed"]
+        )
+
+    def add(self, task):
+        task_id = task["id"]
+        self.created.add(task["created_at"], task_id)
+        if task["completed"]:
+            self.completed.add(task["completed_at"] or "", task_id)
+        else:
+            self.pending.add(task["created_at"], task_id)
+            self.due.add(task.get("due"), task_id)
+
+    def remove(self, task):
+        task_id = task["id"]
+        self.created.remove(task["created_at"], task_id)
+        if task["completed"]:
+            self.completed.remove(task["completed_at"] or "", task_id)
+        else:
+            self.pending.remove(task["created_at"], task_id)
+            self.due.remove(task.get("due"), task_id)
+
+    def _pairs(self, tasks):
+        """(index, key, id) triples for tasks, as add() would file them"""
+        for task in tasks:
+            task_id = task["id"]
+            yield self.created, task["created_at"], task_id
+            if task["completed"]:
+                yield self.completed, task["completed_at"] or "", task_id
+            else:
+                yield self.pending, task["created_at"], task_id
+                yield self.due, task.get("due"), task_id
+
+    def add_many(self, tasks):
+        """Add many tasks with one merge per index"""
+        pairs = {}
+        for index, key, task_id in self._pairs(tasks):
+            pairs.setdefault(id(index), (index, []))[1].append((key, task_id))
+        for index, new in pairs.values():
+            index.add_many(new)
+
+    def remove_many(self, tasks):
+        """Remove many tasks with one pass over each index"""
+        ids = {t["id"] for t in tasks}
+        for index in (self.created, self.pending, self.completed, self.due):
+            index.remove_ids(ids)
+
+    @staticmethod
+    def _moved(task, old):
+        """True if a change touched a field the indexes are keyed on"""
+        return (old["completed"], old["completed_at"], old.get("due")) != \
+            (task["completed"], task["completed_at"], task.get("due"))
+
+    def update(self, task, old):
+        """Re-index a task after a change; old is a copy from before the change"""
+        if self._moved(task, old):
+            self.remove(old)
+            self.add(task)
+
+    def update_many(self, tasks, olds):
+        """Re-index many changed tasks (see update)"""
+        moved = [(t, o) for t, o in zip(tasks, olds) if self._moved(t, o)]
+        if moved:
+            self.remove_many([o for _, o in moved])
+            self.add_many([t for t, _ in moved])
+
+    def view(self, name="all", start=None, end=None, today=None):
+        """Task IDs for a filter view, in the order of its index
+
+        name is one of "all", "pending", "completed", "completed_today",
+        "overdue" or "due_soon". start/end are inclusive "YYYY-MM-DD"
+        dates applied to the view's own date: created for all/pending,
+        completion for completed and due date for overdue/due_soon.
+        """
+        today = today or date.today().isoformat()
+        high = day_after(end) if end else None
+
+        if name == "all":
+            return self.created.range(start, high)
+        if name == "pending":
+            return self.pending.range(start, high)
+        if name == "completed":
+            return self.completed.range(start, high)
+        if name == "completed_today":
+            return self.completed.range(today, day_after(today))
+        if name == "overdue":
+            low, top = start, today
+        elif name == "due_soon":  # due today or within the next week
+            low = max(start or today, today)
+            top = (date.fromisoformat(today) + timedelta(days=8)).isoformat()
+        else:
+            raise ValueError(f"Unknown view '{name}'")
+        if high is not None:
+            top = min(top, high)
+        return self.due.range(low, top)
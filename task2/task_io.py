@@ -0,0 +1,281 @@
+"""
+task_io.py - Streaming import and export of tasks as JSONL or CSV
+Files are read and written a record at a time, so memory use does not
+grow with the file size
+"""
+
+import csv
+import json
+import os
+import re
+
+from recurrence import check_repeat, priority_value
+from todo_store import now_stamp
+
+FIELDS = ("id", "task", "completed", "created_at", "completed_at", "due", "priority", "repeat",
+          "parent")
+STAMP_RE = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}$")
+DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}$")
+TRUE_WORDS = {"true", "1", "yes", "y"}
+FALSE_WORDS = {"false", "0", "no", "n", ""}
+
+BATCH_SIZE = 5000
+
+
+def file_format(filename):
+    """Return "jsonl" or "csv" from the file extension"""
+    ext = os.path.splitext(filename)[1].lower()
+    if ext in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if ext == ".csv":
+        return "csv"
+    raise ValueError(f"Unsupported file type '{ext}' (use .jsonl or .csv)")
+
+
+def validate(record):
+    """Return a clean task dict from an imported record, or raise ValueError
+
+    The id is kept when it is a positive integer; the store decides
+    whether it can be reused.
+    """
+    if not isinstance(record, dict):
+        raise ValueError("record is not an object")
+
+    text = record.get("task")
+    if not isinstance(text, str) or not text.strip():
+        raise ValueError("missing task text")
+
+    completed = record.get("completed", False)
+    if isinstance(completed, str):
+        word = completed.strip().lower()
+        if word in TRUE_WORDS:
+            completed = True
+        elif word in FALSE_WORDS:
+            completed = False
+        else:
+            raise ValueError(f"bad completed value '{completed}'")
+    elif not isinstance(completed, bool):
+        raise ValueError(f"bad completed value '{completed}'")
+
+    created_at = record.get("created_at") or now_stamp()
+    if not isinstance(created_at, str) or not STAMP_RE.match(created_at):
+        raise ValueError(f"bad created_at '{created_at}'")
+
+    completed_at = record.get("completed_at") or None
+    if completed_at is not None and (not isinstance(completed_at, str)
+                                     or not STAMP_RE.match(completed_at)):
+        raise ValueError(f"bad completed_at '{completed_at}'")
+
+    due = record.get("due") or None
+    if due is not None and (not isinstance(due, str) or not DATE_RE.match(due)):
+        raise ValueError(f"bad due date '{due}'")
+
+    priority = record.get("priority") or 0
+    try:
+        priority = priority_value(priority.strip() if isinstance(priority, str) else priority)
+    except ValueError as e:
+        raise ValueError(f"bad priority '{priority}'") from e
+
+    repeat = record.get("repeat") or None
+    try:
+        check_repeat(repeat)
+    except ValueError:
+        raise ValueError(f"bad repeat '{repeat}'") from None
+
+    task_id = record.get("id")
+    try:
+        task_id = int(task_id) if task_id not in (None, "") else None
+    except (TypeError, ValueError):
+        task_id = None
+    if task_id is not None and task_id < 1:
+        task_id = None
+
+    parent = record.get("parent")
+    try:
+        parent = int(parent) if parent not in (None, "") else None
+    except (TypeError, ValueError):
+        raise ValueError(f"bad parent '{parent}'") from None
+
+    return {
+        "id": task_id,
+        "task": text.strip(),
+        "completed": completed,
+        "created_at": created_at,
+        "completed_at": completed_at if completed else None,
+        "due": due,
+        "priority": priority,
+        "repeat": repeat,
+        "parent": parent
+    }
+
+
+class TaskReader:
+    """Iterates over the records of a JSONL or CSV file
+
+    Yields (line number, record) and tracks bytes_read against size, which
+    the progress bar uses. Lines that are not valid JSON are yielded as
+    ValueError instances so the caller can count them.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.format = file_format(filename)
+        self.size = os.path.getsize(filename)
+        self.bytes_read = 0
+        self._file = open(filename, 'rb')
+
+    def _lines(self):
+        encoding = "utf-8-sig"  # drops a byte order mark on the first line
+        for raw in self._file:
+            self.bytes_read += len(raw)
+            yield raw.decode(encoding)
+            encoding = "utf-8"
+
+    def __iter__(self):
+        if self.format == "jsonl":
+            for line_no, line in enumerate(self._lines(), 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield line_no, json.loads(line)
+                except ValueError as e:
+                    yield line_no, ValueError(f"invalid JSON ({e})")
+        else:
+            reader = csv.DictReader(self._lines())
+            for record in reader:
+                yield reader.line_num, record
+
+    def close(self):
+        self._file.close()
+
+
+class TaskImporter:
+    """Imports a file into a TodoStore one batch at a time
+
+    Call step() until it returns False; each step reads up to batch_size
+    records, validates them and adds the good ones with one store call.
+    """
+
+    MAX_ERRORS_KEPT = 20
+
+    def __init__(self, store, filename, batch_size=BATCH_SIZE):
+        self.store = store
+        self.reader = TaskReader(filename)
+        self.batch_size = batch_size
+        self.imported = 0
+        self.new_ids = {}  # file ID -> task ID, to follow parents
+        self.skipped = 0
+        self.errors = []
+        self.done = False
+        self._records = iter(self.reader)
+
+    @property
+    def progress(self):
+        """Fraction of the file read so far"""
+        if self.done or self.reader.size == 0:
+            return 1.0
+        return self.reader.bytes_read / self.reader.size
+
+    def _skip(self, line_no, error):
+        self.skipped += 1
+        if len(self.errors) < self.MAX_ERRORS_KEPT:
+            self.errors.append(f"line {line_no}: {error}")
+
+    def step(self):
+        """Import the next batch; return True while there is more to read"""
+        if self.done:
+            return False
+        batch = []
+        for line_no, record in self._records:
+            if isinstance(record, ValueError):
+                self._skip(line_no, record)
+                continue
+            try:
+                batch.append(validate(record))
+            except ValueError as e:
+                self._skip(line_no, e)
+                continue
+            if len(batch) >= self.batch_size:
+                break
+        else:
+            self.done = True
+            self.reader.close()
+        if batch:
+            self.imported += len(self.store.import_many(batch, self.new_ids))
+        return not self.done
+
+    def run(self):
+        """Import the whole file; return the number of tasks imported"""
+        while self.step():
+            pass
+        return self.imported
+
+    def cancel(self):
+        if not self.done:
+            self.done = True
+            self.reader.close()
+
+
+class TaskExporter:
+    """Writes tasks to a JSONL or CSV file one batch at a time
+
+    The file is written to a temp name and renamed into place when the
+    export finishes, so a cancelled export leaves no partial file.
+    """
+
+    def __init__(self, tasks, filename, batch_size=BATCH_SIZE):
+        self.tasks = tasks
+        self.filename = filename
+        self.format = file_format(filename)
+        self.batch_size = batch_size
+        self.written = 0
+        self.done = False
+        self._tmp = filename + ".tmp"
+        self._file = open(self._tmp, 'w', newline='', encoding='utf-8')
+        if self.format == "csv":
+            self._csv = csv.writer(self._file)
+            self._csv.writerow(FIELDS)
+
+    @property
+    def progress(self):
+        if self.done or not self.tasks:
+            return 1.0
+        return self.written / len(self.tasks)
+
+    def _write(self, task):
+        if self.format == "jsonl":
+            self._file.write(json.dumps({f: task.get(f) for f in FIELDS}, ensure_ascii=False))
+            self._file.write("\n")
+        else:
+            self._csv.writerow((
+                task["id"], task["task"], "true" if task["completed"] else "false",
+                task["created_at"], task["completed_at"] or "", task.get("due") or "",
+                task.get("priority") or 0, task.get("repeat") or "",
+                "" if task.get("parent") is None else task["parent"]
+            ))
+
+    def step(self):
+        """Write the next batch; return True while there is more to write"""
+        if self.done:
+            return False
+        end = min(self.written + self.batch_size, len(self.tasks))
+        for i in range(self.written, end):
+            self._write(self.tasks[i])
+        self.written = end
+        if end >= len(self.tasks):
+            self._file.close()
+            os.replace(self._tmp, self.filename)
+            self.done = True
+        return not self.done
+
+    def run(self):
+        """Export everything; return the number of tasks written"""
+        while self.step():
+            pass
+        return self.written
+
+    def cancel(self):
+        if not self.done:
+            self.done = True
+            self._file.close()
+            os.remove(self._tmp)
@@ -0,0 +1,315 @@
+"""
+task_list_view.py - Virtualized task list for the to-do GUI
+Only the rows that fit on screen have widgets; they are reused while scrolling.
+Given a TaskOutline, rows are indented and subtasks expand and collapse.
+"""
+
+import tkinter as tk
+from datetime import date
+from tkinter import ttk
+
+from recurrence import PRIORITIES
+
+
+class TaskRow:
+    """One pooled row: a frame placed on the canvas and its labels/buttons"""
+
+    BACKGROUNDS = {"selected": "#D6EAF8", "highlighted": "#FFF3CD", "": "white"}
+    # Colour of the ID by priority (none, low, medium, high)
+    PRIORITY_COLOURS = ("#2C3E50", "#2980B9", "#E67E22", "#C0392B")
+    # Tree view: expander by outline state, and indent per level
+    EXPANDERS = {"open": "▾", "closed": "▸", None: " "}
+    INDENT = 18
+
+    def __init__(self, view):
+        self.view = view
+        self.task_id = None
+        self.index = None
+        self.shown = None
+
+        canvas = view.canvas
+        self.frame = tk.Frame(canvas, bg="white", relief=tk.RAISED, bd=1)
+        self.item = canvas.create_window(0, 0, window=self.frame, anchor="nw",
+                                         height=view.ROW_HEIGHT - 2)
+
+        self.status_label = tk.Label(self.frame, font=view.font, fg="white", width=4)
+        self.status_label.grid(row=0, column=0, sticky="nsew", padx=2, pady=2)
+
+        self.id_label = tk.Label(self.frame, font=view.font, bg="white", fg="#2C3E50", width=5)
+        self.id_label.grid(row=0, column=1, sticky="w", padx=5)
+
+        self.text_frame = tk.Frame(self.frame, bg="white")
+        self.text_frame.grid(row=0, column=2, sticky="we", padx=5)
+        self.toggle_label = tk.Label(self.text_frame, font=view.font, bg="white",
+                                     fg="#34495E", width=2, cursor="hand2")
+        self.toggle_label.bind("<Button-1>", lambda e: view.toggle(self.index))
+        self.text_label = tk.Label(self.text_frame, font=view.font, bg="white", anchor="w")
+        self.text_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        if view.on_edit:
+            self.text_label.bind("<Double-Button-1>", lambda e: view.on_edit(self.task_id))
+
+        self.created_label = tk.Label(self.frame, font=view.font, bg="white", fg="#7F8C8D")
+        self.created_label.grid(row=0, column=3, sticky="w", padx=5)
+
+        action_frame = tk.Frame(self.frame, bg="white")
+        action_frame.grid(row=0, column=4, sticky="e", padx=5)
+
+        self.complete_btn = tk.Button(
+            action_frame,
+            text="✓",
+            font=view.font,
+            bg="#27AE60",
+            fg="white",
+            width=3,
+            command=lambda: view.on_complete(self.task_id)
+        )
+        self.delete_btn = tk.Button(
+            action_frame,
+            text="✗",
+            font=view.font,
+            bg="#E74C3C",
+            fg="white",
+            width=3,
+            command=lambda: view.on_delete(self.task_id)
+        )
+        self.complete_btn.pack(side=tk.LEFT, padx=2)
+        self.delete_btn.pack(side=tk.LEFT, padx=2)
+
+        for i in range(5):
+            self.frame.grid_columnconfigure(i, weight=1 if i == 2 else 0)
+
+        # Click selects, Ctrl-click toggles, Shift-click extends
+        for widget in (self.frame, self.status_label, self.id_label, self.text_frame,
+                       self.text_label, self.created_label):
+            widget.bind("<Button-1>", lambda e: view.select(self.index, "only"))
+            widget.bind("<Control-Button-1>", lambda e: view.select(self.index, "toggle"))
+            widget.bind("<Shift-Button-1>", lambda e: view.select(self.index, "range"))
+        self.hide()
+
+    def show(self, task, index):
+        """Place the row at index and fill it with task, skipping unchanged widgets"""
+        self.view.canvas.coords(self.item, 0, index * self.view.ROW_HEIGHT)
+        self.task_id = task["id"]
+        self.index = index
+
+        if task["id"] in self.view.selected:
+            shade = "selected"
+        elif task["id"] == self.view.highlighted:
+            shade = "highlighted"
+        else:
+            shade = ""
+        due = task.get("due")
+        priority = task.get("priority") or 0
+        repeat = task.get("repeat")
+        outline = self.view.outline
+        if outline is not None:
+            branch = (outline.depths[index], outline.state(index)) + outline.progress(index)
+        else:
+            branch = None
+        key = (task["id"], task["task"], task["completed"], task["created_at"], shade, due,
+               priority, repeat, branch)
+        if key == self.shown:
+            return
+        if self.shown is None or self.shown[4] != shade:
+            bg = self.BACKGROUNDS[shade]
+            for widget in (self.frame, self.id_label, self.text_frame, self.toggle_label,
+                           self.text_label, self.created_label):
+                widget.config(bg=bg)
+        if branch is None:
+            self.toggle_label.pack_forget()
+        else:
+            depth, state, done, total = branch
+            self.toggle_label.config(text=self.EXPANDERS[state])
+            self.toggle_label.pack(side=tk.LEFT, padx=(depth * self.INDENT, 2),
+                                   before=self.text_label)
+        completed = task["completed"]
+        if self.shown is None or self.shown[2] != completed:
+            self.status_label.config(text="✅" if completed else "⏳",
+                                     bg="#27AE60" if completed else "#F39C12")
+            self.text_label.config(fg="#2C3E50" if not completed else "#95A5A6")
+            if completed:
+                self.complete_btn.pack_forget()
+            else:
+                self.complete_btn.pack(side=tk.LEFT, padx=2, before=self.delete_btn)
+
+        text = task["task"]
+        self.id_label.config(text=str(task["id"]), fg=self.PRIORITY_COLOURS[priority])
+        self.text_label.config(text=f"~~{text}~~" if completed else text)
+        info = task["created_at"]
+        if priority:
+            info += f"  ⚑ {PRIORITIES[priority]}"
+        if repeat:
+            info += f"  🔁 {repeat}"
+        if branch is not None and branch[3]:
+            info += f"  ☑ {branch[2]}/{branch[3]}"
+        if due:
+            overdue = not completed and due < date.today().isoformat()
+            self.created_label.config(text=f"{info}  📅 {due}",
+                                      fg="#E74C3C" if overdue else "#7F8C8D")
+        else:
+            self.created_label.config(text=info, fg="#7F8C8D")
+        self.shown = key
+
+    def hide(self):
+        # Park the row above the scroll region, where it is never drawn
+        self.view.canvas.coords(self.item, 0, -2 * self.view.ROW_HEIGHT)
+        self.task_id = None
+        self.index = None
+
+
+class VirtualTaskList:
+    """Canvas that renders a long task list with a fixed pool of rows
+
+    The scroll region is sized from the row count, so scrolling and
+    refreshing cost only as much as the rows that are on screen.
+    """
+
+    ROW_HEIGHT = 36
+
+    def __init__(self, parent, font, on_complete, on_delete, on_edit=None,
+                 on_select=None, on_toggle=None):
+        self.font = font
+        self.on_complete = on_complete
+        self.on_delete = on_delete
+        self.on_edit = on_edit
+        self.on_select = on_select
+        self.on_toggle = on_toggle
+        self.outline = None
+        self.highlighted = None
+        self.selected = set()
+        self.anchor = None
+        self.tasks = []
+        self.rows = []
+        self.width = 1
+
+        self.canvas = tk.Canvas(parent, bg="#F5F7FA", highlightthickness=0,
+                                yscrollincrement=self.ROW_HEIGHT)
+        self.scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_scroll)
+        self.canvas.bind("<Configure>", self._on_resize)
+
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+    def set_tasks(self, tasks, outline=None):
+        """Show a new task list, keeping the scroll position
+
+        With a task_tree.TaskOutline, tasks is its row list and rows are
+        drawn as a tree.
+        """
+        self.tasks = tasks
+        self.outline = outline
+        self._update_scrollregion()
+        self.render()
+
+    def toggle(self, index):
+        """Expand or collapse the subtasks of the row at index (tree view only)"""
+        if self.outline is None or index is None or not self.outline.toggle(index):
+            return
+        # The rows below index moved; the outline changed self.tasks in place
+        self.rows_changed(index)
+        if self.on_toggle:
+            self.on_toggle()
+
+    def _update_scrollregion(self):
+        height = len(self.tasks) * self.ROW_HEIGHT
+        self.canvas.configure(scrollregion=(0, 0, self.width, height))
+
+    def visible_range(self):
+        """Indexes of the first and one past the last row on screen"""
+        top = int(self.canvas.canvasy(0))
+        first = max(0, top // self.ROW_HEIGHT)
+        count = self.canvas.winfo_height() // self.ROW_HEIGHT + 2
+        return first, min(len(self.tasks), first + count)
+
+    def render(self):
+        """Place pooled rows over the visible tasks
+
+        Task i always goes to row i % pool size, so scrolling by one row
+        refills a single row and the others only keep their content.
+        """
+        first, last = self.visible_range()
+        needed = self.canvas.winfo_height() // self.ROW_HEIGHT + 2
+        while len(self.rows) < needed:
+            row = TaskRow(self)
+            self.canvas.itemconfigure(row.item, width=self.width)
+            self.rows.append(row)
+
+        pool = len(self.rows)
+        used = set()
+        for index in range(first, last):
+            slot = index % pool
+            self.rows[slot].show(self.tasks[index], index)
+            used.add(slot)
+        for slot, row in enumerate(self.rows):
+            if slot not in used and row.task_id is not None:
+                row.hide()
+
+    def update_row(self, index):
+        """Redraw one task if it is on screen"""
+        first, last = self.visible_range()
+        if first <= index < last:
+            self.rows[index % len(self.rows)].show(self.tasks[index], index)
+
+    def rows_changed(self, index):
+        """Resize after a task was inserted or removed at index
+
+        Rows above index keep their content; render only refills the
+        rows whose task actually changed.
+        """
+        self._update_scrollregion()
+        first, last = self.visible_range()
+        if index <= last:
+            self.render()
+
+    def scroll_to(self, index):
+        """Scroll so the task at index sits near the top third of the view"""
+        total = len(self.tasks) * self.ROW_HEIGHT
+        if total:
+            top = index * self.ROW_HEIGHT - self.canvas.winfo_height() // 3
+            self.canvas.yview_moveto(max(0, top) / total)
+
+    def highlight(self, task_id):
+        """Mark one task's row (None to clear)"""
+        self.highlighted = task_id
+        self.render()
+
+    def select(self, index, mode="only"):
+        """Change the selection from a click on the row at index
+
+        mode is "only" (select just this row), "toggle" (Ctrl-click) or
+        "range" (Shift-click, from the last clicked row).
+        """
+        if index is None or index >= len(self.tasks):
+            return
+        task_id = self.tasks[index]["id"]
+        if mode == "toggle":
+            self.selected ^= {task_id}
+            self.anchor = index
+        elif mode == "range" and self.anchor is not None:
+            low, high = sorted((min(self.anchor, len(self.tasks) - 1), index))
+            self.selected = {t["id"] for t in self.tasks[low:high + 1]}
+        else:
+            self.selected = {task_id}
+            self.anchor = index
+        self.render()
+        if self.on_select:
+            self.on_select(self.selected)
+
+    def set_selection(self, task_ids):
+        """Replace the selection (e.g. Select All or after a delete)"""
+        self.selected = set(task_ids)
+        self.render()
+        if self.on_select:
+            self.on_select(self.selected)
+
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self.render()
+
+    def _on_resize(self, event):
+        self.width = event.width
+        for row in self.rows:
+            self.canvas.itemconfigure(row.item, width=self.width)
+        self._update_scrollregion()
+        self.render()
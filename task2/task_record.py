@@ -0,0 +1,78 @@
+"""
+task_record.py - Compact in-memory task record
+A task with slots instead of a per-task dict, read and written like a dict
+"""
+
+import sys
+from collections.abc import Mapping
+
+FIELDS = ("id", "task", "completed", "created_at", "completed_at", "due",
+          "priority", "repeat", "parent")
+_FIELD_SET = frozenset(FIELDS)
+
+
+def _intern(value):
+    return sys.intern(value) if value is not None else None
+
+
+class Task(Mapping):
+    """One task, stored in slots and accessed as task["field"]
+
+    A dict per task costs a hash table on top of its values; slots keep
+    just the field references. Timestamps, due dates and repeat rules are
+    interned, so tasks created or completed in the same minute share one
+    string.
+
+    Tasks compare equal to dicts with the same fields, dict(task) gives a
+    plain copy, and only the task fields can be read or assigned.
+    """
+
+    __slots__ = FIELDS
+
+    def __init__(self, id, task, completed=False, created_at=None,
+                 completed_at=None, due=None, priority=0, repeat=None, parent=None):
+        self.id = id
+        self.task = task
+        self.completed = completed
+        self.created_at = _intern(created_at)
+        self.completed_at = _intern(completed_at)
+        self.due = _intern(due)
+        self.priority = priority
+        self.repeat = _intern(repeat)
+        self.parent = parent
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a task from a dict (missing optional fields get their defaults)"""
+        return cls(data["id"], data["task"], data.get("completed", False),
+                   data.get("created_at"), data.get("completed_at"), data.get("due"),
+                   data.get("priority") or 0, data.get("repeat"), data.get("parent"))
+
+    def __getitem__(self, key):
+        if key in _FIELD_SET:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key in _FIELD_SET:
+            return getattr(self, key)
+        return default
+
+    def __setitem__(self, key, value):
+        if key not in _FIELD_SET:
+            raise KeyError(key)
+        if key in ("created_at", "completed_at", "due", "repeat"):
+            value = _intern(value)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in _FIELD_SET
+
+    def __iter__(self):
+        return iter(FIELDS)
+
+    def __len__(self):
+        return len(FIELDS)
+
+    def __repr__(self):
+        return f"Task({dict(self)!r})"
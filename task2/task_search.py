@@ -0,0 +1,185 @@
+"""
+task_search.py - Inverted index for searching task text
+Kept up to date on every add, edit and delete instead of scanning all tasks
+"""
+
+import re
+
+TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.lower())
+
+
+def trigrams(token):
+    return {token[i:i + 3] for i in range(len(token) - 2)}
+
+
+class TaskSearchIndex:
+    """Token, prefix and trigram index over task text
+
+    A query is split into terms and every term must match (AND). Terms
+    match whole words, word prefixes, or any substring of three or more
+    characters; results are ranked by how well the terms match.
+    """
+
+    # Score per term for an exact word, a word prefix and a substring
+    EXACT, PREFIX, SUBSTRING = 3, 2, 1
+    # One- and two-letter terms are looked up through word prefixes
+    SHORT_PREFIX = 2
+
+    def __init__(self):
+        self.words = {}      # word -> set of task IDs
+        self.prefixes = {}   # 1-2 letter word prefix -> set of task IDs
+        self.grams = {}      # trigram -> set of task IDs
+        self.texts = {}      # task ID -> lowercased text
+        self.doc_words = {}  # task ID -> set of words
+
+    def __len__(self):
+        return len(self.texts)
+
+    @staticmethod
+    def _link(table, key, task_id):
+        ids = table.get(key)
+        if ids is None:
+            table[key] = {task_id}
+        else:
+            ids.add(task_id)
+
+    @staticmethod
+    def _unlink(table, key, task_id):
+        ids = table.get(key)
+        if ids is not None:
+            ids.discard(task_id)
+            if not ids:
+                del table[key]
+
+    def _keys(self, words):
+        prefixes = set()
+        grams = set()
+        for word in words:
+            for n in range(1, min(len(word), self.SHORT_PREFIX) + 1):
+                prefixes.add(word[:n])
+            grams |= trigrams(word)
+        return prefixes, grams
+
+    def add(self, task_id, text):
+        """Index the text of a task"""
+        if task_id in self.texts:
+            self.remove(task_id)
+        words = set(tokenize(text))
+        prefixes, grams = self._keys(words)
+        for word in words:
+            self._link(self.words, word, task_id)
+        for prefix in prefixes:
+            self._link(self.prefixes, prefix, task_id)
+        for gram in grams:
+            self._link(self.grams, gram, task_id)
+        self.texts[task_id] = text.lower()
+        self.doc_words[task_id] = words
+
+    def remove(self, task_id):
+        """Drop a task from the index"""
+        words = self.doc_words.pop(task_id, None)
+        if words is None:
+            return
+        del self.texts[task_id]
+        prefixes, grams = self._keys(words)
+        for word in words:
+            self._unlink(self.words, word, task_id)
+        for prefix in prefixes:
+            self._unlink(self.prefixes, prefix, task_id)
+        for gram in grams:
+            self._unlink(self.grams, gram, task_id)
+
+    def _candidates(self, term):
+        """IDs of tasks whose text contains term"""
+        if len(term) <= self.SHORT_PREFIX:
+            return self.prefixes.get(term, set())
+        sets = []
+        for gram in trigrams(term):
+            ids = self.grams.get(gram)
+            if not ids:
+                return set()
+            sets.append(ids)
+        sets.sort(key=len)
+        result = set(sets[0])
+        for ids in sets[1:]:
+            result &= ids
+            if not result:
+                return result
+        texts = self.texts
+        return {i for i in result if term in texts[i]}
+
+    def _scorer(self, terms, matches):
+        """Return (score function for one matching ID, best score any ID can get)
+
+        Set operations settle most terms up front: only tasks sharing a
+        two-letter word prefix with a long term need a word-by-word test.
+        """
+        doc_words = self.doc_words
+        plans = []
+        best = 0
+        for term in terms:
+            exact = matches & self.words.get(term, set())
+            if len(term) <= self.SHORT_PREFIX:
+                maybe_prefix = None  # short terms only match word prefixes
+            else:
+                maybe_prefix = (matches & self.prefixes.get(term[:self.SHORT_PREFIX], set())) - exact
+            plans.append((term, exact, maybe_prefix))
+            if exact:
+                best += self.EXACT
+            elif maybe_prefix is None or maybe_prefix:
+                best += self.PREFIX
+            else:
+                best += self.SUBSTRING
+
+        def score(task_id):
+            total = 0
+            for term, exact, maybe_prefix in plans:
+                if task_id in exact:
+                    total += self.EXACT
+                elif maybe_prefix is None:
+                    total += self.PREFIX
+                elif task_id in maybe_prefix and any(
+                        w.startswith(term) for w in doc_words[task_id]):
+                    total += self.PREFIX
+                else:
+                    total += self.SUBSTRING
+            return total
+
+        return score, best
+
+    def search(self, query, limit=None):
+        """Return (total matches, best matching task IDs)
+
+        Ties are broken by newest task first. With limit, only that many
+        of the best results are returned.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return 0, []
+        matches = None
+        for ids in sorted((self._candidates(t) for t in terms), key=len):
+            matches = set(ids) if matches is None else matches & ids
+            if not matches:
+                return 0, []
+
+        # Walk newest first, grouping by score; once the best possible
+        # score has filled the limit, older tasks cannot make the cut.
+        score, best = self._scorer(terms, matches)
+        buckets = {}
+        for task_id in sorted(matches, reverse=True):
+            value = score(task_id)
+            bucket = buckets.get(value)
+            if bucket is None:
+                bucket = buckets[value] = []
+            bucket.append(task_id)
+            if value == best and limit is not None and len(bucket) >= limit:
+                break
+
+        results = []
+        for value in sorted(buckets, reverse=True):
+            results.extend(buckets[value])
+        return len(matches), results[:limit]
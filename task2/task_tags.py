@@ -0,0 +1,269 @@
+"""
+task_tags.py - #tags in task text and bitmap indexes over them
+Tag filters like "#work AND NOT completed" are answered with bitwise
+operations on per-tag bitmaps instead of a scan over the tasks
+"""
+
+import re
+from collections import defaultdict
+
+TAG_RE = re.compile(r"(?<![\w#])#(\w[\w-]*)")
+_NONZERO_RE = re.compile(rb"[^\x00]")
+# Set bit positions of each byte value
+_BITS = [tuple(b for b in range(8) if value >> b & 1) for value in range(256)]
+
+
+def parse_tags(text):
+    """Lower-case tags in text, without the '#', first occurrence first"""
+    if "#" not in text:
+        return []
+    tags = TAG_RE.findall(text.lower())
+    return list(dict.fromkeys(tags)) if len(tags) > 1 else tags
+
+
+class Bitmap:
+    """Set of task IDs as bits, in chunks of CHUNK_BITS
+
+    Bit i of chunk k stands for ID k * CHUNK_BITS + i. Chunks are Python
+    ints, so &, | and & ~ run in C over a whole chunk at a time, and a
+    tag that only recent tasks carry does not hold bits for old ones.
+    """
+
+    CHUNK_BITS = 1 << 16
+
+    __slots__ = ("chunks",)
+
+    def __init__(self, chunks=None):
+        self.chunks = chunks if chunks is not None else {}
+
+    @classmethod
+    def from_ids(cls, task_ids):
+        """Build a bitmap from many IDs at once"""
+        buffers = defaultdict(lambda: bytearray(cls.CHUNK_BITS // 8))
+        for task_id in task_ids:
+            chunk, bit = divmod(task_id, cls.CHUNK_BITS)
+            buffers[chunk][bit >> 3] |= 1 << (bit & 7)
+        return cls({k: int.from_bytes(b, 'little') for k, b in buffers.items()})
+
+    def add(self, task_id):
+        chunk, bit = divmod(task_id, self.CHUNK_BITS)
+        self.chunks[chunk] = self.chunks.get(chunk, 0) | 1 << bit
+
+    def discard(self, task_id):
+        chunk, bit = divmod(task_id, self.CHUNK_BITS)
+        value = self.chunks.get(chunk, 0) & ~(1 << bit)
+        if value:
+            self.chunks[chunk] = value
+        else:
+            self.chunks.pop(chunk, None)
+
+    def __contains__(self, task_id):
+        chunk, bit = divmod(task_id, self.CHUNK_BITS)
+        return bool(self.chunks.get(chunk, 0) >> bit & 1)
+
+    def __len__(self):
+        return sum(value.bit_count() for value in self.chunks.values())
+
+    def __bool__(self):
+        return bool(self.chunks)
+
+    def __and__(self, other):
+        a, b = self.chunks, other.chunks
+        return Bitmap({k: v for k in a.keys() & b.keys() if (v := a[k] & b[k])})
+
+    def __or__(self, other):
+        chunks = dict(self.chunks)
+        for k, v in other.chunks.items():
+            chunks[k] = chunks.get(k, 0) | v
+        return Bitmap(chunks)
+
+    def __sub__(self, other):
+        b = other.chunks
+        a = self.chunks
+        return Bitmap({k: v for k in a if (v := a[k] & ~b.get(k, 0))})
+
+    def __iter__(self):
+        """IDs in ascending order"""
+        size = self.CHUNK_BITS // 8
+        for chunk in sorted(self.chunks):
+            base = chunk * self.CHUNK_BITS
+            data = self.chunks[chunk].to_bytes(size, 'little')
+            # Skip the zero bytes in C; only set bits cost Python time
+            for match in _NONZERO_RE.finditer(data):
+                pos = match.start()
+                for bit in _BITS[data[pos]]:
+                    yield base + pos * 8 + bit
+
+
+class TagIndex:
+    """A bitmap of task IDs per tag, plus bitmaps of all and completed tasks
+
+    Kept up to date through add/remove/update; query() evaluates a tag
+    filter (see parse_query) with bitmap operations.
+    """
+
+    def __init__(self, tasks=()):
+        ids_by_tag = defaultdict(list)
+        live = []
+        completed = []
+        for task in tasks:
+            task_id = task["id"]
+            live.append(task_id)
+            if task["completed"]:
+                completed.append(task_id)
+            for tag in parse_tags(task["task"]):
+                ids_by_tag[tag].append(task_id)
+        self.tags = {tag: Bitmap.from_ids(ids) for tag, ids in ids_by_tag.items()}
+        self.live = Bitmap.from_ids(live)
+        self.completed = Bitmap.from_ids(completed)
+
+    def add(self, task):
+        task_id = task["id"]
+        self.live.add(task_id)
+        if task["completed"]:
+            self.completed.add(task_id)
+        for tag in parse_tags(task["task"]):
+            self.tags.setdefault(tag, Bitmap()).add(task_id)
+
+    def remove(self, task):
+        task_id = task["id"]
+        self.live.discard(task_id)
+        self.completed.discard(task_id)
+        self._untag(task_id, task["task"])
+
+    def _untag(self, task_id, text):
+        for tag in parse_tags(text):
+            bitmap = self.tags.get(tag)
+            if bitmap is not None:
+                bitmap.discard(task_id)
+                if not bitmap:
+                    del self.tags[tag]
+
+    def update(self, task, old):
+        """Re-file a task after a change; old is a copy from before it"""
+        task_id = task["id"]
+        if old["task"] != task["task"]:
+            self._untag(task_id, old["task"])
+            for tag in parse_tags(task["task"]):
+                self.tags.setdefault(tag, Bitmap()).add(task_id)
+        if old["completed"] != task["completed"]:
+            if task["completed"]:
+                self.completed.add(task_id)
+            else:
+                self.completed.discard(task_id)
+
+    def counts(self):
+        """{tag: number of tasks}"""
+        return {tag: len(bitmap) for tag, bitmap in self.tags.items()}
+
+    def query(self, text):
+        """Bitmap of the task IDs matching a filter (see parse_query)"""
+        return parse_query(text)(self)
+
+
+# Words of the filter language besides #tags
+_STATUS = {
+    "all": lambda index: index.live,
+    "completed": lambda index: index.completed,
+    "done": lambda index: index.completed,
+    "pending": lambda index: index.live - index.completed,
+}
+_TOKEN_RE = re.compile(r"\s*(?:(\()|(\))|#([\w-]+)|([A-Za-z]+))")
+
+
+def parse_query(text):
+    """Compile a tag filter into a function of a TagIndex returning a Bitmap
+
+    Terms are #tags and the words completed (or done), pending and all.
+    They combine with NOT, AND and OR (in that order of precedence, any
+    case) and parentheses; terms side by side are ANDed, so "#work
+    pending" is "#work AND pending". Raises ValueError on bad syntax.
+    """
+    tokens = []
+    pos = 0
+    text = text.strip()
+    while pos < len(text):
+        match = _TOKEN_RE.match(text, pos)
+        if not match:
+            raise ValueError(f"Unexpected '{text[pos:].strip()[:10]}' in filter")
+        pos = match.end()
+        opening, _closing, tag, word = match.groups()
+        if tag:
+            tokens.append(("tag", tag.lower()))
+        elif word:
+            word = word.lower()
+            if word in ("and", "or", "not"):
+                tokens.append((word, None))
+            elif word in _STATUS:
+                tokens.append(("status", word))
+            else:
+                raise ValueError(f"Unknown word '{word}' in filter (tags start with #)")
+        else:
+            tokens.append(("(", None) if opening else (")", None))
+    if not tokens:
+        raise ValueError("Empty filter")
+
+    tokens.append(("end", None))
+    position = 0
+
+    def peek():
+        return tokens[position][0]
+
+    def take(kind):
+        nonlocal position
+        if tokens[position][0] != kind:
+            found = tokens[position][1] or tokens[position][0]
+            raise ValueError(f"Expected {kind} but found '{found}' in filter")
+        position += 1
+        return tokens[position - 1][1]
+
+    def either():
+        terms = [both()]
+        while peek() == "or":
+            take("or")
+            terms.append(both())
+        if len(terms) == 1:
+            return terms[0]
+        return lambda index: _fold(terms, index, lambda a, b: a | b)
+
+    def both():
+        terms = [negated()]
+        while peek() in ("and", "not", "tag", "status", "("):
+            if peek() == "and":
+                take("and")
+            terms.append(negated())
+        if len(terms) == 1:
+            return terms[0]
+        return lambda index: _fold(terms, index, lambda a, b: a & b)
+
+    def negated():
+        if peek() == "not":
+            take("not")
+            inner = negated()
+            return lambda index: index.live - inner(index)
+        return term()
+
+    def term():
+        kind = peek()
+        if kind == "(":
+            take("(")
+            inner = either()
+            take(")")
+            return inner
+        if kind == "tag":
+            tag = take("tag")
+            return lambda index: index.tags.get(tag, Bitmap())
+        if kind == "status":
+            return _STATUS[take("status")]
+        raise ValueError("Filter is incomplete" if kind == "end" else f"Unexpected '{kind}' in filter")
+
+    evaluate = either()
+    take("end")
+    return evaluate
+
+
+def _fold(terms, index, combine):
+    result = terms[0](index)
+    for term in terms[1:]:
+        result = combine(result, term(index))
+    return result
@@ -0,0 +1,261 @@
+"""
+task_tree.py - Projects and subtasks
+Child lists and subtree counts over the tasks' parent pointers, and the
+rows of a tree view that only lists the children of expanded tasks
+"""
+
+from bisect import bisect_left, insort
+
+
+class TaskTree:
+    """Child lists and descendant counts built from task["parent"]
+
+    A task is attached under its parent when the parent exists and the
+    link would not close a loop; other tasks are top level. up holds the
+    attached tasks only, so a flat list costs nothing. children is keyed
+    by the parent pointer, also of deleted parents, so putting a deleted
+    task back (undo) brings its subtasks back under it.
+
+    counts[id] is [subtasks, completed subtasks] at every depth below a
+    task, kept only for tasks that have subtasks. Each change shifts the
+    counts of the ancestors of one task, so it costs the depth of the
+    tree rather than its size.
+
+    index is the store's id -> task mapping. A task must already be in
+    it when add() is called and already gone from it for remove().
+    """
+
+    def __init__(self, index, tasks=()):
+        self.index = index
+        self.up = {}
+        self.children = {}
+        self.counts = {}
+        # Tasks come in ID order, so the child lists come out sorted
+        for task in tasks:
+            parent_id = task.parent
+            if parent_id is not None:
+                self.children.setdefault(parent_id, []).append(task.id)
+                if parent_id in index:
+                    self.up[task.id] = parent_id
+        self._break_loops()
+        self._count_all()
+
+    def _break_loops(self):
+        """Detach one task of every loop of parent pointers"""
+        state = {}  # 1: on the path being walked, 2: walked
+        for start in list(self.up):
+            path = []
+            node = start
+            while node in self.up and node not in state:
+                state[node] = 1
+                path.append(node)
+                node = self.up[node]
+            if state.get(node) == 1:
+                del self.up[node]
+            for node in path:
+                state[node] = 2
+
+    def _count_all(self):
+        """Fill counts bottom up, each attached task added to its parent once"""
+        depth = {}
+        for task_id in self.up:
+            chain = []
+            node = task_id
+            while node in self.up and node not in depth:
+                chain.append(node)
+                node = self.up[node]
+            base = depth.get(node, 0)
+            for node in reversed(chain):
+                base += 1
+                depth[node] = base
+        index = self.index
+        for task_id in sorted(self.up, key=depth.__getitem__, reverse=True):
+            below = self.counts.get(task_id)
+            total, done = below if below else (0, 0)
+            self._add_counts(self.up[task_id], total + 1, done + index[task_id].completed,
+                             walk=False)
+
+    def _add_counts(self, task_id, total, done, walk=True):
+        """Add to the counts of task_id (and, with walk, of its ancestors)"""
+        while task_id is not None:
+            counts = self.counts.get(task_id)
+            if counts is None:
+                counts = self.counts[task_id] = [0, 0]
+            counts[0] += total
+            counts[1] += done
+            if not counts[0]:
+                del self.counts[task_id]
+            if not walk:
+                return
+            task_id = self.up.get(task_id)
+
+    def is_below(self, task_id, ancestor_id):
+        """True if task_id is ancestor_id or one of its subtasks at any depth"""
+        while task_id is not None:
+            if task_id == ancestor_id:
+                return True
+            task_id = self.up.get(task_id)
+        return False
+
+    def _attach(self, task_id, parent_id, completed):
+        if parent_id is None or parent_id not in self.index or self.is_below(parent_id, task_id):
+            return
+        self.up[task_id] = parent_id
+        total, done = self.counts.get(task_id, (0, 0))
+        self._add_counts(parent_id, total + 1, done + completed)
+
+    def _detach(self, task_id, completed):
+        parent_id = self.up.pop(task_id, None)
+        if parent_id is not None:
+            total, done = self.counts.get(task_id, (0, 0))
+            self._add_counts(parent_id, -total - 1, -done - completed)
+
+    def _unlist(self, task_id, parent_id):
+        siblings = self.children[parent_id]
+        del siblings[bisect_left(siblings, task_id)]
+        if not siblings:
+            del self.children[parent_id]
+
+    def add(self, task):
+        task_id = task.id
+        # Subtasks left behind when this task was deleted come back first
+        for child_id in self.children.get(task_id, ()):
+            if child_id not in self.up:
+                self._attach(child_id, task_id, self.index[child_id].completed)
+        if task.parent is not None:
+            insort(self.children.setdefault(task.parent, []), task_id)
+        self._attach(task_id, task.parent, task.completed)
+
+    def remove(self, task):
+        """Drop a task; its subtasks become top level until it comes back"""
+        task_id = task.id
+        self._detach(task_id, task.completed)
+        for child_id in self.children.get(task_id, ()):
+            if self.up.get(child_id) == task_id:
+                del self.up[child_id]
+        self.counts.pop(task_id, None)
+        if task.parent is not None:
+            self._unlist(task_id, task.parent)
+
+    def update(self, task, old):
+        """Re-file a task after a change; old is a copy from before it"""
+        task_id = task.id
+        if old["parent"] != task.parent:
+            self._detach(task_id, old["completed"])
+            if old["parent"] is not None:
+                self._unlist(task_id, old["parent"])
+            if task.parent is not None:
+                insort(self.children.setdefault(task.parent, []), task_id)
+            self._attach(task_id, task.parent, old["completed"])
+        if old["completed"] != task.completed and task_id in self.up:
+            self._add_counts(self.up[task_id], 0, 1 if task.completed else -1)
+
+    def subtask_ids(self, task_id):
+        """IDs of the tasks attached directly under task_id, in ID order"""
+        up = self.up
+        return [c for c in self.children.get(task_id, ()) if up.get(c) == task_id]
+
+    def has_subtasks(self, task_id):
+        return task_id in self.counts
+
+    def progress(self, task_id):
+        """(completed, total) subtasks at every depth below task_id"""
+        total, done = self.counts.get(task_id, (0, 0))
+        return done, total
+
+    def descendant_ids(self, task_id):
+        """IDs of every subtask below task_id, depth first"""
+        found = []
+        stack = list(reversed(self.subtask_ids(task_id)))
+        while stack:
+            child_id = stack.pop()
+            found.append(child_id)
+            stack.extend(reversed(self.subtask_ids(child_id)))
+        return found
+
+
+class TaskOutline:
+    """Rows of a tree view: top-level tasks and the subtasks of expanded ones
+
+    tasks and depths are parallel lists. Collapsed subtrees are never
+    walked, so a deep hierarchy costs only the rows that are shown, and
+    expanding or collapsing splices one task's rows in or out.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.expanded = set()
+        self.tasks = []
+        self.depths = []
+        self.refresh()
+
+    def _rows_below(self, task_id, depth):
+        """(tasks, depths) shown under task_id when it is expanded"""
+        tree = self.store.tree
+        index = self.store.index
+        tasks, depths = [], []
+        stack = [(c, depth) for c in reversed(tree.subtask_ids(task_id))]
+        while stack:
+            child_id, child_depth = stack.pop()
+            tasks.append(index[child_id])
+            depths.append(child_depth)
+            if child_id in self.expanded:
+                stack.extend((c, child_depth + 1) for c in reversed(tree.subtask_ids(child_id)))
+        return tasks, depths
+
+    def refresh(self):
+        """Rebuild the rows after the tasks changed"""
+        self.expanded &= self.store.index.keys()
+        tasks, depths = [], []
+        for task in self.store.top_level():
+            tasks.append(task)
+            depths.append(0)
+            if task.id in self.expanded:
+                below, below_depths = self._rows_below(task.id, 1)
+                tasks += below
+                depths += below_depths
+        # In place, so a list view showing self.tasks sees the new rows
+        self.tasks[:] = tasks
+        self.depths[:] = depths
+
+    def state(self, index):
+        """"open", "closed" or None (no subtasks) for the row at index"""
+        task_id = self.tasks[index].id
+        if not self.store.tree.has_subtasks(task_id):
+            return None
+        return "open" if task_id in self.expanded else "closed"
+
+    def progress(self, index):
+        """(completed, total) subtasks below the row at index"""
+        return self.store.tree.progress(self.tasks[index].id)
+
+    def toggle(self, index):
+        """Expand or collapse the row at index; return False if it has no subtasks"""
+        state = self.state(index)
+        if state is None:
+            return False
+        task_id = self.tasks[index].id
+        depth = self.depths[index]
+        if state == "open":
+            self.expanded.discard(task_id)
+            end = index + 1
+            while end < len(self.depths) and self.depths[end] > depth:
+                end += 1
+            del self.tasks[index + 1:end]
+            del self.depths[index + 1:end]
+        else:
+            self.expanded.add(task_id)
+            below, below_depths = self._rows_below(task_id, depth + 1)
+            self.tasks[index + 1:index + 1] = below
+            self.depths[index + 1:index + 1] = below_depths
+        return True
+
+    def reveal(self, task_id):
+        """Expand the ancestors of a task; return its row index"""
+        tree = self.store.tree
+        parent_id = tree.up.get(task_id)
+        while parent_id is not None:
+            self.expanded.add(parent_id)
+            parent_id = tree.up.get(parent_id)
+        self.refresh()
+        return next(i for i, t in enumerate(self.tasks) if t.id == task_id)
@@ -0,0 +1,194 @@
+"""
+test_multi_instance.py - Unit tests for two instances sharing one task file
+"""
+
+import unittest
+import sys
+import os
+import json
+import sqlite3
+import tempfile
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from todo_storage import (AutosaveJsonStorage, FileChangedError, JsonTaskStorage,
+                          SqliteTaskStorage)
+from todo_store import TodoStore
+
+
+class TestSharedJsonFile(unittest.TestCase):
+    """Test change detection and merging between two stores on one file"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "todo_gui.json")
+        first = TodoStore(JsonTaskStorage(self.path))
+        for text in ("Shared 1", "Shared 2", "Shared 3"):
+            first.add(text)
+        self.a = TodoStore(JsonTaskStorage(self.path))
+        self.b = TodoStore(JsonTaskStorage(self.path))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def saved(self):
+        with open(self.path, encoding='utf-8') as f:
+            return {t["id"]: t for t in json.load(f)["tasks"]}
+
+    def texts(self, store):
+        return [(t["id"], t["task"]) for t in store.tasks]
+
+    def test_unchanged_file_is_not_reread(self):
+        """Test that polling an unchanged file reports nothing"""
+        self.assertFalse(self.a.storage.changed_on_disk())
+        self.assertFalse(self.a.sync())
+        os.utime(self.path)  # touched, but the generation is the same
+        self.assertFalse(self.a.storage.changed_on_disk())
+
+    def test_sync_picks_up_the_other_instances_changes(self):
+        """Test that edits, completions and deletes made elsewhere are merged"""
+        self.b.edit(1, "Edited in B")
+        self.b.complete(2)
+        self.b.delete(3)
+        events = []
+        self.a.subscribe(lambda event, index, task: events.append(event))
+
+        self.assertTrue(self.a.storage.changed_on_disk())
+        self.assertTrue(self.a.sync())
+        self.assertEqual(self.texts(self.a), [(1, "Edited in B"), (2, "Shared 2")])
+        self.assertTrue(self.a.get(2)["completed"])
+        self.assertEqual((self.a.total, self.a.completed), (2, 1))
+        self.assertEqual(events, ["reset"])
+        self.assertEqual(self.a.search("edited")[0], 1)
+
+    def test_writes_do_not_overwrite_each_other(self):
+        """Test that a stale instance merges instead of overwriting"""
+        self.b.edit(1, "From B")
+        self.a.edit(2, "From A")  # A has not seen B's save yet
+
+        saved = self.saved()
+        self.assertEqual((saved[1]["task"], saved[2]["task"]), ("From B", "From A"))
+        self.assertEqual(self.a.get(1)["task"], "From B")
+
+    def test_same_new_id_on_both_sides(self):
+        """Test that clashing new tasks both survive with distinct IDs"""
+        self.b.add("New in B")
+        self.a.add("New in A")
+
+        saved = self.saved()
+        self.assertEqual(saved[4]["task"], "New in B")
+        self.assertEqual(saved[5]["task"], "New in A")
+        self.assertEqual(self.texts(self.a)[3:], [(4, "New in B"), (5, "New in A")])
+
+        self.b.sync()
+        self.assertEqual(self.texts(self.b), self.texts(self.a))
+        self.assertEqual(self.b.add("Next")["id"], 6)
+
+    def test_local_delete_wins_over_a_stale_copy(self):
+        """Test that a delete made here is not undone by the merge"""
+        self.b.edit(3, "Edited in B")
+        self.a.delete(1)
+        self.assertEqual(sorted(self.saved()), [2, 3])
+        self.assertEqual(self.saved()[3]["task"], "Edited in B")
+
+
+class TestSharedAutosaveFile(unittest.TestCase):
+    """Test the background writer stopping on a conflict"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "todo_gui.json")
+        self.other = TodoStore(JsonTaskStorage(self.path))
+        self.other.add("Existing")
+        self.store = TodoStore(AutosaveJsonStorage(self.path, quiet=60))
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_pending_changes_survive_a_conflict(self):
+        """Test that unsaved changes are merged with the other save"""
+        self.store.add("Mine")
+        self.other.add("Theirs")  # takes ID 2 first
+        with self.assertRaises(FileChangedError):
+            self.store.storage.flush()
+        self.assertTrue(self.store.storage.conflict)
+
+        self.assertTrue(self.store.sync())
+        self.assertEqual(self.store.storage.status, "saved")
+        self.other.sync()
+        self.assertEqual([t["task"] for t in self.other.tasks], ["Existing", "Theirs", "Mine"])
+
+
+class RowLevelSqlite(SqliteTaskStorage):
+    """SQLite storage that fails if a conflict rewrites the whole table"""
+
+    BUSY_TIMEOUT = 0.05
+
+    def replace_all(self, tasks, next_id=None):
+        raise AssertionError("conflicts should only write the pending rows")
+
+
+class TestSharedDatabase(unittest.TestCase):
+    """Test change detection between two SQLite connections"""
+
+    def test_commits_from_another_connection(self):
+        """Test that data_version reports the other connection's commits"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "todo_gui.db")
+            a = TodoStore(SqliteTaskStorage(path))
+            b = TodoStore(SqliteTaskStorage(path))
+            self.assertFalse(a.sync())
+            b.add("From B")
+            self.assertTrue(a.sync())
+            self.assertEqual([t["task"] for t in a.tasks], ["From B"])
+            a.close()
+            b.close()
+
+    def test_writes_without_syncing_first(self):
+        """Test that adds on both sides get distinct IDs and nothing is lost"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "todo_gui.db")
+            a = TodoStore(RowLevelSqlite(path))
+            b = TodoStore(RowLevelSqlite(path))
+            a.add("one")
+            b.add("two")  # same new ID as A's task: B's moves
+            a.add("three")
+            b.complete(1)
+            a.delete(2)
+            self.assertEqual([(t.id, t.task) for t in a.tasks], [(1, "one"), (3, "three")])
+            self.assertTrue(a.get(1).completed)
+            b.sync()
+            self.assertEqual([(t.id, t.task) for t in b.tasks], [(1, "one"), (3, "three")])
+            a.close()
+            b.close()
+            fresh = TodoStore(SqliteTaskStorage(path))
+            self.assertEqual([(t.id, t.task, t.completed) for t in fresh.tasks],
+                             [(1, "one", True), (3, "three", False)])
+            fresh.close()
+
+    def test_locked_database(self):
+        """Test that a change refused by a held lock is saved by the next sync"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "todo_gui.db")
+            store = TodoStore(RowLevelSqlite(path))
+            store.add("Before")
+            other = sqlite3.connect(path)
+            other.execute("BEGIN IMMEDIATE")
+            with self.assertRaises(FileChangedError):
+                store.add("While locked")
+            self.assertEqual(store.storage.pending_changes(), {2: "insert"})
+            other.rollback()
+            other.close()
+            self.assertTrue(store.storage.changed_on_disk())
+            store.sync()
+            self.assertEqual(store.storage.pending_changes(), {})
+            store.close()
+            fresh = TodoStore(SqliteTaskStorage(path))
+            self.assertEqual([t.task for t in fresh.tasks], ["Before", "While locked"])
+            fresh.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+test_recurrence.py - Unit tests for priorities, repeating tasks and next up
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from recurrence import next_date, next_due, priority_value
+from task_indexes import LazyHeap
+from todo_storage import JsonTaskStorage, SqliteTaskStorage
+from todo_store import TodoStore
+
+
+class TestRepeatDates(unittest.TestCase):
+    """Test cases for the repeat date arithmetic"""
+
+    def test_periods(self):
+        """Test each rule, including month ends and leap days"""
+        self.assertEqual(next_date("2026-12-31", "daily"), "2027-01-01")
+        self.assertEqual(next_date("2026-03-01", "weekly"), "2026-03-08")
+        self.assertEqual(next_date("2026-01-31", "monthly"), "2026-02-28")
+        self.assertEqual(next_date("2028-02-29", "yearly"), "2029-02-28")
+
+    def test_missed_periods_are_skipped(self):
+        """Test that the next occurrence is never in the past"""
+        task = {"due": "2026-01-01", "repeat": "weekly", "completed": True,
+                "completed_at": "2026-01-01 09:00", "created_at": "2026-01-01 08:00"}
+        self.assertEqual(next_due(task, "2026-01-20"), "2026-01-22")
+
+    def test_priority_names(self):
+        """Test that priorities are read by name or number"""
+        self.assertEqual(priority_value("high"), 3)
+        self.assertEqual(priority_value("1"), 1)
+        with self.assertRaises(ValueError):
+            priority_value("urgent")
+
+
+class TestLazyHeap(unittest.TestCase):
+    """Test cases for the heap with changing keys"""
+
+    def test_changed_and_dropped_keys(self):
+        """Test that stale entries never surface"""
+        heap = LazyHeap([(5, 1), (3, 2), (4, 3)])
+        heap.set(2, 9)
+        heap.set(3, None)
+        heap.set(1, 2)
+        heap.set(1, 5)
+        heap.set(1, 2)  # back to a key it had: two live entries
+        self.assertEqual(heap.smallest(5), [1, 2])
+        self.assertEqual(heap.peek(), (2, 1))
+        self.assertEqual(heap.pop_upto(2), [1])
+        self.assertEqual(heap.smallest(5), [2])
+        self.assertEqual(len(heap), 1)
+
+    def test_rebuilds_when_mostly_stale(self):
+        """Test that the heap does not grow with the number of changes"""
+        heap = LazyHeap()
+        for i in range(1000):
+            heap.set(1, i)
+        self.assertLess(len(heap._heap), 100)
+        self.assertEqual(heap.smallest(1), [1])
+
+
+class TestNextUpAndRenewal(unittest.TestCase):
+    """Test cases for TodoStore.next_up and renew_repeating"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "todo_gui.json")
+        self.store = TodoStore(JsonTaskStorage(self.path))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_next_up_order_follows_changes(self):
+        """Test priority, then due date, then age, kept up to date"""
+        self.store.add("Low", priority=1)
+        self.store.add("High later", "2026-05-01", priority=3)
+        self.store.add("High soon", "2026-04-01", priority=3)
+        self.store.add("None")
+        top = lambda: [t["task"] for t in self.store.next_up(3)]
+        self.assertEqual(top(), ["High soon", "High later", "Low"])
+
+        self.store.complete(3)
+        self.store.set_priority(4, 2)
+        self.assertEqual(top(), ["High later", "None", "Low"])
+        self.store.delete(2)
+        self.assertEqual(top(), ["None", "Low"])
+        self.assertEqual(self.store.view("next_up", "priority"), self.store.next_up(2))
+        self.assertEqual([t["id"] for t in self.store.view("pending", "priority")], [4, 1])
+
+    def test_bad_priority_or_repeat_rejected(self):
+        """Test that add refuses values outside the known ones"""
+        with self.assertRaises(ValueError):
+            self.store.add("A", priority=7)
+        with self.assertRaises(ValueError):
+            self.store.add("A", repeat="hourly")
+        self.assertEqual(self.store.total, 0)
+
+    def test_completed_repeating_task_comes_back(self):
+        """Test that renewal adds the next occurrence once, on its day"""
+        task = self.store.add("Water plants", "2026-03-02", priority=2, repeat="weekly")
+        self.assertIsNone(self.store.next_renewal())
+        self.store.complete(task["id"])
+        self.assertEqual(self.store.next_renewal(), "2026-03-09")
+
+        self.assertEqual(self.store.renew_repeating("2026-03-08"), [])
+        renewed = self.store.renew_repeating("2026-03-09")
+        self.assertEqual([(t["task"], t["due"], t["priority"], t["repeat"], t["completed"])
+                          for t in renewed],
+                         [("Water plants", "2026-03-09", 2, "weekly", False)])
+        self.assertIsNone(self.store.get(task["id"])["repeat"])
+        self.assertIsNone(self.store.next_renewal())
+        self.assertEqual(self.store.renew_repeating("2026-04-01"), [])
+
+        saved = TodoStore(JsonTaskStorage(self.path))
+        self.assertEqual(saved.get(renewed[0]["id"]), renewed[0])
+
+    def test_sqlite_keeps_new_fields(self):
+        """Test that priority and repeat are stored in the database"""
+        path = os.path.join(self.tmp.name, "todo_gui.db")
+        store = TodoStore(SqliteTaskStorage(path))
+        store.add("Pay rent", "2026-03-01", priority=3, repeat="monthly")
+        store.set_repeat(1, "yearly")
+        store.close()
+        task = SqliteTaskStorage(path).load()[0]
+        self.assertEqual((task["priority"], task["repeat"]), (3, "yearly"))
+
+
+if __name__ == '__main__':
+    unittest.main()
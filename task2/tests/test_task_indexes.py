@@ -0,0 +1,213 @@
+"""
+test_task_indexes.py - Unit tests for the sorted date indexes and filter views
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from task_indexes import SortedIndex, TaskIndexes, day_after
+from todo_storage import JsonTaskStorage
+from todo_store import TodoStore
+
+
+def make_task(task_id, created, completed_at=None, due=None):
+    return {
+        "id": task_id,
+        "task": f"Task {task_id}",
+        "completed": completed_at is not None,
+        "created_at": created,
+        "completed_at": completed_at,
+        "due": due
+    }
+
+
+TODAY = "2026-03-10"
+TASKS = [
+    make_task(1, "2026-03-01 09:00", completed_at="2026-03-10 08:00"),
+    make_task(2, "2026-03-02 09:00", due="2026-03-05"),
+    make_task(3, "2026-03-05 09:00", due="2026-03-12"),
+    make_task(4, "2026-03-05 09:00", completed_at="2026-03-06 12:00", due="2026-03-01"),
+    make_task(5, "2026-03-09 09:00", due="2026-03-30"),
+    make_task(6, "2026-03-10 07:00", due="2026-03-10"),
+]
+
+
+class TestSortedIndex(unittest.TestCase):
+    """Test cases for SortedIndex"""
+
+    def test_range_is_half_open(self):
+        """Test that range includes low and excludes high"""
+        index = SortedIndex([("b", 2), ("a", 1), ("c", 3)])
+        self.assertEqual(index.range("a", "c"), [1, 2])
+        self.assertEqual(index.range(None, "b"), [1])
+        self.assertEqual(index.range("b"), [2, 3])
+        self.assertEqual(index.range(), [1, 2, 3])
+
+    def test_ties_are_ordered_by_id_and_removed_exactly(self):
+        """Test that equal keys keep ID order and remove drops only the given ID"""
+        index = SortedIndex()
+        for task_id in (5, 1, 3):
+            index.add("same", task_id)
+        self.assertEqual(index.range(), [1, 3, 5])
+
+        index.remove("same", 3)
+        index.remove("same", 4)  # not present
+        index.remove("other", 1)  # wrong key
+        self.assertEqual(index.range(), [1, 5])
+
+    def test_bulk_add_and_remove(self):
+        """Test that merged batches keep the same order as single inserts"""
+        single = SortedIndex()
+        merged = SortedIndex([("m", 0)])
+        pairs = [(f"k{i % 10}", i) for i in range(1, 200)]
+        for key, task_id in [("m", 0)] + pairs:
+            single.add(key, task_id)
+        merged.add_many(pairs)
+        self.assertEqual((merged.keys, merged.ids), (single.keys, single.ids))
+
+        merged.remove_ids(set(range(0, 200, 2)))
+        self.assertEqual(merged.range(), [i for i in single.range() if i % 2])
+
+    def test_none_keys_are_not_indexed(self):
+        """Test that tasks without a key are left out"""
+        index = SortedIndex()
+        index.add(None, 1)
+        index.remove(None, 1)
+        self.assertEqual(len(index), 0)
+        self.assertEqual(SortedIndex([("b", 2), (None, 1), ("a", 3)]).range(), [3, 2])
+
+    def test_day_after(self):
+        """Test that day_after crosses month ends"""
+        self.assertEqual(day_after("2026-02-28"), "2026-03-01")
+
+
+class TestTaskIndexes(unittest.TestCase):
+    """Test cases for the filter views"""
+
+    def setUp(self):
+        self.indexes = TaskIndexes(TASKS)
+
+    def view(self, name, start=None, end=None):
+        return self.indexes.view(name, start, end, today=TODAY)
+
+    def test_status_views(self):
+        """Test that pending and completed split the tasks"""
+        self.assertEqual(self.view("all"), [1, 2, 3, 4, 5, 6])
+        self.assertEqual(self.view("pending"), [2, 3, 5, 6])
+        self.assertEqual(self.view("completed"), [4, 1])
+        self.assertEqual(self.view("completed_today"), [1])
+
+    def test_due_views(self):
+        """Test overdue and due-this-week against a fixed today"""
+        # Task 4 was due earlier but is done, so it is not overdue
+        self.assertEqual(self.view("overdue"), [2])
+        self.assertEqual(self.view("due_soon"), [6, 3])
+
+    def test_date_ranges_are_inclusive(self):
+        """Test that start and end days are both included"""
+        self.assertEqual(self.view("all", "2026-03-02", "2026-03-05"), [2, 3, 4])
+        self.assertEqual(self.view("pending", end="2026-03-05"), [2, 3])
+        self.assertEqual(self.view("completed", "2026-03-10"), [1])
+        self.assertEqual(self.view("due_soon", end="2026-03-10"), [6])
+
+    def test_unknown_view(self):
+        """Test that an unknown view name raises ValueError"""
+        with self.assertRaises(ValueError):
+            self.view("someday")
+
+    def test_update_moves_a_task_between_buckets(self):
+        """Test that completing a task re-indexes it"""
+        task = dict(TASKS[1])
+        old = dict(task)
+        task["completed"] = True
+        task["completed_at"] = "2026-03-10 09:00"
+        self.indexes.update(task, old)
+
+        self.assertEqual(self.view("pending"), [3, 5, 6])
+        self.assertEqual(self.view("completed_today"), [1, 2])
+        self.assertEqual(self.view("overdue"), [])
+
+
+class TestStoreViews(unittest.TestCase):
+    """Test cases for TodoStore.view"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = TodoStore(JsonTaskStorage(os.path.join(self.tmp.name, "todo_gui.json")))
+        self.store.import_many(TASKS)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def ids(self, *args, **kwargs):
+        return [t["id"] for t in self.store.view(*args, **kwargs)]
+
+    def test_record_without_created_at(self):
+        """Test that a saved task lacking created_at does not stop the store opening"""
+        path = os.path.join(self.tmp.name, "legacy.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([{"id": 1, "task": "Legacy", "completed": False},
+                       {"id": 2, "task": "New", "completed": False,
+                        "created_at": "2026-03-01 09:00"}], f)
+        store = TodoStore(JsonTaskStorage(path))
+        self.assertEqual([t["id"] for t in store.view("pending")], [2])
+
+    def test_default_view_is_the_task_list(self):
+        """Test that the unfiltered view is the store's own list"""
+        self.assertIs(self.store.view(), self.store.tasks)
+
+    def test_sorts(self):
+        """Test each sort order over a filtered view"""
+        self.assertEqual(self.ids("pending", "newest"), [6, 5, 3, 2])
+        self.assertEqual(self.ids("all", "oldest"), [1, 2, 3, 4, 5, 6])
+        self.assertEqual(self.ids("all", "due"), [4, 2, 6, 3, 5, 1])
+        self.assertEqual(self.ids("all", "completed"), [1, 4, 6, 5, 3, 2])
+        self.assertEqual(self.ids("completed", "completed"), [1, 4])
+        self.assertEqual(self.ids("pending", "added"), [2, 3, 5, 6])
+
+    def test_bulk_changes_update_the_views(self):
+        """Test that bulk complete, reopen and delete re-index in one go"""
+        added = self.store.add_many(f"Bulk {i}" for i in range(100))
+        bulk = [t["id"] for t in added]
+        self.assertEqual(len(self.ids("pending")), 104)
+
+        self.store.set_completed_many(bulk)
+        self.assertEqual(self.ids("pending"), [2, 3, 5, 6])
+        self.store.set_completed_many(bulk[:50], completed=False)
+        self.assertEqual(self.ids("pending"), [2, 3, 5, 6] + bulk[:50])
+        self.store.delete_many(bulk)
+        self.assertEqual(self.ids("all", "added"), [1, 2, 3, 4, 5, 6])
+        self.assertEqual(self.ids("completed", "added"), [1, 4])
+
+    def test_unknown_sort(self):
+        """Test that an unknown sort raises ValueError"""
+        with self.assertRaises(ValueError):
+            self.store.view("pending", "alphabetical")
+
+    def test_views_follow_changes(self):
+        """Test that the indexes are kept up to date after they are built"""
+        self.assertEqual(self.ids("pending"), [2, 3, 5, 6])
+
+        self.store.complete(3)
+        self.store.set_due(5, None)
+        self.store.delete(6)
+        added = self.store.add("New", due="2026-01-01")
+
+        self.assertEqual(self.ids("pending"), [2, 5, added["id"]])
+        self.assertEqual(self.ids("pending", "due"), [added["id"], 2, 5])
+        self.assertEqual(self.ids("completed", "oldest"), [1, 3, 4])
+
+        self.store.set_completed_many([1, 3], completed=False)
+        self.store.clear_completed()
+        self.assertEqual(self.ids("completed"), [])
+        self.assertEqual(self.ids("all"), [1, 2, 3, 5, added["id"]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+test_task_io.py - Unit tests for streaming task import and export
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from task_io import TaskExporter, TaskImporter, validate
+from todo_storage import JsonTaskStorage
+from todo_store import TodoStore
+
+
+class TestValidate(unittest.TestCase):
+    """Test cases for record validation"""
+
+    def test_csv_strings_are_converted(self):
+        """Test CSV-style values"""
+        task = validate({"id": "7", "task": " Pay rent ", "completed": "TRUE",
+                         "created_at": "2026-01-02 10:00", "completed_at": "2026-01-03 11:00",
+                         "priority": "2", "repeat": "monthly", "parent": "3"})
+        self.assertEqual(task, {"id": 7, "task": "Pay rent", "completed": True,
+                                "created_at": "2026-01-02 10:00",
+                                "completed_at": "2026-01-03 11:00", "due": None,
+                                "priority": 2, "repeat": "monthly", "parent": 3})
+
+    def test_bad_records(self):
+        """Test that invalid records raise ValueError"""
+        for record in ({"task": ""}, {"task": "A", "completed": "maybe"},
+                       {"task": "A", "created_at": "yesterday"},
+                       {"task": "A", "priority": "urgent"}, {"task": "A", "repeat": "hourly"}, ["A"]):
+            with self.subTest(record=record):
+                with self.assertRaises(ValueError):
+                    validate(record)
+
+
+class TestImportExport(unittest.TestCase):
+    """Test streaming round trips through a store"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = self.new_store("source.json")
+        self.store.add_many([f"Task {i}, with \"quotes\"" for i in range(2500)])
+        self.store.delete_many(range(1, 2500, 7))
+        self.store.set_completed_many(range(1, 2500, 3))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def new_store(self, name):
+        return TodoStore(JsonTaskStorage(self.path(name)))
+
+    def test_round_trip(self):
+        """Test export then import keeps every field and ID"""
+        for name in ("tasks.jsonl", "tasks.csv"):
+            with self.subTest(format=name):
+                self.assertEqual(TaskExporter(self.store.tasks, self.path(name), batch_size=500).run(),
+                                 self.store.total)
+                target = self.new_store(name + ".json")
+                importer = TaskImporter(target, self.path(name), batch_size=500)
+                self.assertEqual(importer.run(), self.store.total)
+                self.assertEqual(importer.skipped, 0)
+                self.assertEqual(target.tasks, self.store.tasks)
+                self.assertEqual(target.completed, self.store.completed)
+
+    def test_batches_and_progress(self):
+        """Test that import goes in batches with rising progress"""
+        TaskExporter(self.store.tasks, self.path("tasks.jsonl")).run()
+        target = self.new_store("target.json")
+        resets = []
+        target.subscribe(lambda event, index, task: resets.append(event))
+
+        importer = TaskImporter(target, self.path("tasks.jsonl"), batch_size=1000)
+        progress = []
+        while importer.step():
+            progress.append(importer.progress)
+        self.assertEqual(resets, ["reset"] * 3)
+        self.assertEqual(progress, sorted(progress))
+        self.assertEqual(importer.progress, 1.0)
+
+    def test_invalid_lines_are_skipped(self):
+        """Test that bad lines are counted and reported"""
+        with open(self.path("mixed.jsonl"), 'w') as f:
+            f.write(json.dumps({"task": "Good"}) + "\n")
+            f.write("{not json\n")
+            f.write(json.dumps({"task": ""}) + "\n")
+        target = self.new_store("target.json")
+        importer = TaskImporter(target, self.path("mixed.jsonl"))
+        self.assertEqual(importer.run(), 1)
+        self.assertEqual(importer.skipped, 2)
+        self.assertTrue(importer.errors[0].startswith("line 2"))
+
+    def test_cancelled_export_leaves_no_file(self):
+        """Test that cancelling removes the partial export"""
+        exporter = TaskExporter(self.store.tasks, self.path("tasks.csv"), batch_size=100)
+        exporter.step()
+        exporter.cancel()
+        self.assertEqual([n for n in os.listdir(self.tmp.name) if n.startswith("tasks")], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+test_task_record.py - Unit tests for the compact task record
+"""
+
+import unittest
+import sys
+import os
+import json
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from task_record import Task
+
+
+class TestTask(unittest.TestCase):
+    """Test cases for Task"""
+
+    def setUp(self):
+        self.data = {
+            "id": 7,
+            "task": "Water plants",
+            "completed": False,
+            "created_at": "2026-03-01 09:00",
+            "completed_at": None,
+            "due": "2026-03-02",
+            "priority": 2,
+            "repeat": "weekly",
+            "parent": 3
+        }
+        self.task = Task.from_dict(self.data)
+
+    def test_reads_like_a_dict(self):
+        """Test subscripting, get, membership and dict() copies"""
+        self.assertEqual(self.task["task"], "Water plants")
+        self.assertEqual(self.task.get("due"), "2026-03-02")
+        self.assertIsNone(self.task.get("colour"))
+        self.assertIn("completed_at", self.task)
+        self.assertEqual(dict(self.task), self.data)
+        self.assertEqual(json.loads(json.dumps(self.task, default=dict)), self.data)
+        with self.assertRaises(KeyError):
+            self.task["keys"]
+
+    def test_equals_dicts_with_the_same_fields(self):
+        """Test that tasks and dicts compare by value both ways"""
+        self.assertEqual(self.task, self.data)
+        self.assertEqual(self.data, self.task)
+        self.assertNotEqual(self.task, dict(self.data, completed=True))
+
+    def test_assignment(self):
+        """Test that fields can be set but no new keys added"""
+        self.task["completed"] = True
+        self.assertTrue(self.task.completed)
+        with self.assertRaises(KeyError):
+            self.task["colour"] = "red"
+        with self.assertRaises(AttributeError):
+            self.task.__dict__
+
+    def test_timestamps_are_shared(self):
+        """Test that equal timestamps end up as one string object"""
+        stamp = "".join(["2026-03-01 ", "09:00"])  # built at run time, not a constant
+        other = Task(8, "Other", created_at=stamp)
+        self.assertIs(other.created_at, self.task.created_at)
+
+    def test_missing_optional_fields(self):
+        """Test that from_dict fills optional fields with defaults"""
+        task = Task.from_dict({"id": 1, "task": "Old format"})
+        self.assertEqual(task, {"id": 1, "task": "Old format", "completed": False,
+                                "created_at": None, "completed_at": None, "due": None,
+                                "priority": 0, "repeat": None, "parent": None})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+test_task_search.py - Unit tests for the task search index
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import time
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from task_search import TaskSearchIndex
+from todo_storage import JsonTaskStorage
+from todo_store import TodoStore
+
+MAX_QUERY_SECONDS = 0.05
+
+
+class TestTaskSearchIndex(unittest.TestCase):
+    """Test cases for matching and ranking"""
+
+    def setUp(self):
+        self.index = TaskSearchIndex()
+        self.index.add(1, "Buy milk and bread")
+        self.index.add(2, "Call the milkman")
+        self.index.add(3, "Write quarterly report")
+        self.index.add(4, "Report bug in billing")
+
+    def test_term_kinds(self):
+        """Test whole word, prefix, substring and short prefix matches"""
+        self.assertEqual(self.index.search("report")[1], [4, 3])
+        self.assertEqual(self.index.search("milk")[1], [1, 2])  # exact before prefix
+        self.assertEqual(self.index.search("ilk")[1], [2, 1])
+        self.assertEqual(self.index.search("bu")[1], [4, 1])
+        self.assertEqual(self.index.search("xyz"), (0, []))
+
+    def test_terms_are_anded(self):
+        """Test that every query term must match"""
+        self.assertEqual(self.index.search("report bug")[1], [4])
+        self.assertEqual(self.index.search("milk report"), (0, []))
+
+    def test_update_and_remove(self):
+        """Test that edits and deletes leave no stale entries"""
+        self.index.add(1, "Buy eggs")
+        self.assertEqual(self.index.search("milk")[1], [2])
+        self.index.remove(2)
+        self.assertEqual(self.index.search("milk"), (0, []))
+        self.assertNotIn("milkman", self.index.words)
+
+    def test_limit(self):
+        """Test that limit keeps the best results and the full count"""
+        total, ids = self.index.search("r", limit=1)
+        self.assertEqual(total, 2)
+        self.assertEqual(ids, [4])
+
+    def test_large_index_is_fast(self):
+        """Test query time over 100k tasks"""
+        words = ["buy", "milk", "call", "write", "report", "fix", "bug", "plan", "trip"]
+        index = TaskSearchIndex()
+        for i in range(100000):
+            index.add(i, f"{words[i % 9]} {words[i // 9 % 9]} item{i}")
+        for query in ("b", "milk", "epo", "fix bug"):
+            with self.subTest(query=query):
+                start = time.perf_counter()
+                total, ids = index.search(query, limit=200)
+                self.assertLess(time.perf_counter() - start, MAX_QUERY_SECONDS)
+                self.assertGreater(total, 0)
+
+
+class TestStoreSearch(unittest.TestCase):
+    """Test the index kept in step with TodoStore"""
+
+    def test_store_changes_reach_index(self):
+        """Test add, edit and delete through the store"""
+        with tempfile.TemporaryDirectory() as tmp:
+            store = TodoStore(JsonTaskStorage(os.path.join(tmp, "todo.json")))
+            store.add("Plan trip")
+            self.assertEqual(store.search("trip")[0], 1)
+
+            task = store.add("Book hotel")
+            store.edit(task["id"], "Book flight for trip")
+            self.assertEqual([t["id"] for t in store.search("trip")[1]], [2, 1])
+
+            store.delete(1)
+            self.assertEqual(store.search("plan"), (0, []))
+
+
+if __name__ == "__main__":
+    unittest.main()
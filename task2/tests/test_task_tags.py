@@ -0,0 +1,147 @@
+"""
+test_task_tags.py - Unit tests for #tags and the tag bitmap index
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from task_tags import Bitmap, TagIndex, parse_query, parse_tags
+from todo_storage import JsonTaskStorage
+from todo_store import TodoStore
+from undo_journal import UndoJournal
+
+
+class TestParseTags(unittest.TestCase):
+    """Test cases for finding tags in task text"""
+
+    def test_tags_in_text(self):
+        """Test that tags are lower-cased, deduplicated and kept in order"""
+        self.assertEqual(parse_tags("Call Bob #Work #home-office, then #work"),
+                         ["work", "home-office"])
+
+    def test_not_tags(self):
+        """Test that '#' inside a word or alone is not a tag"""
+        self.assertEqual(parse_tags("Issue a#b, ## and # alone, C#"), [])
+
+
+class TestBitmap(unittest.TestCase):
+    """Test cases for the chunked ID bitmap"""
+
+    def test_set_operations_across_chunks(self):
+        """Test &, | and - on IDs in different chunks"""
+        far = Bitmap.CHUNK_BITS * 3 + 5
+        a = Bitmap.from_ids([1, 2, far])
+        b = Bitmap()
+        for task_id in (2, 3, far):
+            b.add(task_id)
+        self.assertEqual(list(a & b), [2, far])
+        self.assertEqual(list(a | b), [1, 2, 3, far])
+        self.assertEqual(list(a - b), [1])
+        b.discard(far)
+        self.assertEqual(list(b), [2, 3])
+        self.assertEqual(len(a), 3)
+        self.assertIn(far, a)
+        self.assertNotIn(far, b)
+        self.assertEqual(len(b.chunks), 1)  # empty chunks are dropped
+
+
+class TestTagQuery(unittest.TestCase):
+    """Test cases for evaluating tag filters on a TagIndex"""
+
+    def setUp(self):
+        tasks = [
+            {"id": 1, "task": "Report #work", "completed": False},
+            {"id": 2, "task": "Taxes #home #work", "completed": True},
+            {"id": 3, "task": "Dishes #home", "completed": False},
+            {"id": 4, "task": "No tags", "completed": False},
+        ]
+        self.index = TagIndex(tasks)
+
+    def ids(self, query):
+        return list(self.index.query(query))
+
+    def test_operators(self):
+        """Test AND, OR, NOT, status words, parentheses and precedence"""
+        self.assertEqual(self.ids("#work AND NOT completed"), [1])
+        self.assertEqual(self.ids("#work OR #home"), [1, 2, 3])
+        self.assertEqual(self.ids("#WORK pending"), [1])
+        self.assertEqual(self.ids("NOT #work AND NOT #home"), [4])
+        self.assertEqual(self.ids("#home OR #work AND done"), [2, 3])
+        self.assertEqual(self.ids("(#home OR #work) AND done"), [2])
+        self.assertEqual(self.ids("#nothing"), [])
+
+    def test_bad_filters(self):
+        """Test that bad syntax raises ValueError"""
+        for query in ("", "#work AND", "(#work", "#work )", "work", "#work & #home"):
+            with self.subTest(query=query), self.assertRaises(ValueError):
+                parse_query(query)
+
+
+class TestStoreTags(unittest.TestCase):
+    """Test cases for the tag index kept by TodoStore"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "todo_gui.json")
+        self.store = TodoStore(JsonTaskStorage(self.path), journal=UndoJournal())
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def texts(self, query):
+        return [t["task"] for t in self.store.tagged(query)]
+
+    def test_index_follows_every_change(self):
+        """Test add, edit, complete, delete, undo and clear against the bitmaps"""
+        self.store.tag_index  # built now, so every change below updates it
+        self.store.add("Report #work")
+        self.store.add("Dishes #home")
+        self.store.add_many(["Email #work", "Plan #work #home"])
+        self.assertEqual(self.texts("#work"), ["Report #work", "Email #work", "Plan #work #home"])
+
+        self.store.edit(1, "Report #home")
+        self.store.complete(3)
+        self.assertEqual(self.texts("#work AND NOT completed"), ["Plan #work #home"])
+        self.assertEqual(self.texts("#home"), ["Report #home", "Dishes #home", "Plan #work #home"])
+
+        self.store.delete(4)
+        self.assertEqual(self.texts("#work OR #home"), ["Report #home", "Dishes #home", "Email #work"])
+        for _ in range(3):  # the delete, the completion and the edit
+            self.store.undo()
+        self.assertEqual(self.texts("#work pending"),
+                         ["Report #work", "Email #work", "Plan #work #home"])
+
+        self.store.complete(2)
+        self.store.clear_completed()
+        self.assertEqual(self.store.tag_counts(), [("work", 3), ("home", 1)])
+
+    def test_matches_a_scan(self):
+        """Test that the bitmaps give what scanning the tasks would"""
+        self.store.tag_index
+        tags = ["#a", "#b", "#c"]
+        self.store.add_many(f"Task {i} {tags[i % 3]} {tags[i % 2]}" for i in range(300))
+        self.store.set_completed_many(range(1, 301, 4))
+        self.store.delete_many(range(1, 301, 7))
+        expected = [t for t in self.store.tasks
+                    if ("#a" in t.task or "#c" in t.task) and not t.completed]
+        self.assertEqual(self.store.tagged("(#a OR #c) AND NOT done"), expected)
+
+    def test_view_with_tags(self):
+        """Test that a tag filter narrows views and keeps their sort"""
+        self.store.add("Old #work", "2026-05-01")
+        self.store.add("Other #home", "2026-01-01")
+        self.store.add("New #work", "2026-02-01")
+        self.assertEqual([t["id"] for t in self.store.view("all", "due", tags="#work")], [3, 1])
+        self.assertEqual([t["id"] for t in self.store.view("pending", "newest", tags="#work")],
+                         [3, 1])
+        with self.assertRaises(ValueError):
+            self.store.view(tags="#work AND")
+
+
+if __name__ == '__main__':
+    unittest.main()
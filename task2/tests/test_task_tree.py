@@ -0,0 +1,172 @@
+"""
+test_task_tree.py - Unit tests for subtasks and the tree view rows
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from task_io import TaskImporter
+from task_record import Task
+from task_tree import TaskOutline, TaskTree
+from todo_storage import JsonTaskStorage, SqliteTaskStorage
+from todo_store import TodoStore
+from undo_journal import UndoJournal
+
+
+class TestTaskTree(unittest.TestCase):
+    """Test cases for building a TaskTree from loaded tasks"""
+
+    def build(self, parents):
+        tasks = [Task(i, f"Task {i}", False, "2026-01-01 09:00:00", parent=p)
+                 for i, p in enumerate(parents, 1)]
+        return TaskTree({t.id: t for t in tasks}, tasks)
+
+    def test_counts_at_every_depth(self):
+        """Test that counts cover every level below a task"""
+        tree = self.build([None, 1, 2, 2, None, 9])
+        self.assertEqual(tree.progress(1), (0, 3))
+        self.assertEqual(tree.progress(2), (0, 2))
+        self.assertEqual(tree.subtask_ids(2), [3, 4])
+        self.assertEqual(tree.descendant_ids(1), [2, 3, 4])
+        self.assertNotIn(6, tree.up)  # its parent does not exist
+
+    def test_loops_are_broken(self):
+        """Test that parent pointers forming a loop leave the tree finite"""
+        tree = self.build([3, 1, 2, 4])
+        self.assertEqual(len(tree.up), 2)
+        top = [i for i in (1, 2, 3) if i not in tree.up]
+        self.assertEqual(len(top), 1)
+        self.assertEqual(tree.progress(top[0]), (0, 2))
+
+
+class TestStoreTree(unittest.TestCase):
+    """Test cases for the subtask tree kept by TodoStore"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "todo_gui.json")
+        self.store = TodoStore(JsonTaskStorage(self.path), journal=UndoJournal())
+        self.store.add("Project")
+        self.store.add("Design", parent=1)
+        self.store.add("Build", parent=1)
+        self.store.add("Backend", parent=3)
+        self.store.add("Frontend", parent=3)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_counts_follow_changes(self):
+        """Test that completing, reopening and moving shift the counts up the tree"""
+        self.store.complete(4)
+        self.assertEqual(self.store.progress(1), (1, 4))
+        self.assertEqual(self.store.progress(3), (1, 2))
+        self.store.set_parent(3, None)
+        self.assertEqual(self.store.progress(1), (0, 1))
+        self.assertEqual([t.id for t in self.store.top_level()], [1, 3])
+        self.store.undo()
+        self.assertEqual(self.store.progress(1), (1, 4))
+        self.store.set_completed_many([4], False)
+        self.assertEqual(self.store.progress(1), (0, 4))
+
+    def test_cycles_are_rejected(self):
+        """Test that a task cannot go under itself or one of its subtasks"""
+        for parent in (1, 4, 99):
+            with self.subTest(parent=parent), self.assertRaises(ValueError):
+                self.store.set_parent(1, parent)
+        with self.assertRaises(ValueError):
+            self.store.add("Nowhere", parent=99)
+        self.assertEqual(self.store.progress(1), (0, 4))
+
+    def test_delete_cascades_and_undo_restores(self):
+        """Test that deleting a task takes its subtasks, and undo brings them back"""
+        self.store.delete(3)
+        self.assertEqual([t.id for t in self.store.tasks], [1, 2])
+        self.assertEqual(self.store.progress(1), (0, 1))
+        self.store.undo()
+        self.assertEqual(self.store.progress(1), (0, 4))
+        self.assertEqual([t.id for t in self.store.subtasks(3)], [4, 5])
+
+    def test_clear_completed_keeps_pending_subtasks(self):
+        """Test that subtasks of a cleared task become top level"""
+        self.store.complete(3)
+        self.store.clear_completed()
+        self.assertEqual([t.id for t in self.store.top_level()], [1, 4, 5])
+        self.assertEqual(self.store.progress(1), (0, 1))
+        self.store.undo()
+        self.assertEqual(self.store.progress(1), (1, 4))
+
+    def test_parent_survives_reload_and_sqlite(self):
+        """Test that parent pointers are saved by both storages"""
+        reloaded = TodoStore(JsonTaskStorage(self.path))
+        self.assertEqual(reloaded.progress(1), (0, 4))
+        db = TodoStore(SqliteTaskStorage(os.path.join(self.tmp.name, "todo.db")))
+        db.import_many(dict(t) for t in self.store.tasks)
+        db.set_parent(5, 1)
+        db.close()
+        db = TodoStore(SqliteTaskStorage(os.path.join(self.tmp.name, "todo.db")))
+        self.assertEqual([t.id for t in db.subtasks(1)], [2, 3, 5])
+        db.close()
+
+    def test_import_remaps_parents(self):
+        """Test that imported subtasks point at the new IDs of their parents"""
+        path = os.path.join(self.tmp.name, "trip.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write('{"id": 1, "task": "Trip"}\n'
+                    '{"id": 2, "task": "Book", "parent": 1}\n')
+        # IDs 1 and 2 are taken, and one record per batch puts the parent
+        # in an earlier batch than its subtask
+        self.assertEqual(TaskImporter(self.store, path, batch_size=1).run(), 2)
+        self.assertEqual([t.task for t in self.store.subtasks(6)], ["Book"])
+
+
+class TestTaskOutline(unittest.TestCase):
+    """Test cases for the rows of the tree view"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = TodoStore(JsonTaskStorage(os.path.join(self.tmp.name, "todo_gui.json")))
+        self.store.add_many(["Project", "Design", "Build", "Backend", "Solo"])
+        for task_id, parent_id in ((2, 1), (3, 1), (4, 3)):
+            self.store.set_parent(task_id, parent_id)
+        self.outline = TaskOutline(self.store)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def rows(self):
+        return list(zip((t.id for t in self.outline.tasks), self.outline.depths))
+
+    def test_only_expanded_rows_are_listed(self):
+        """Test that collapsed subtasks have no rows until expanded"""
+        self.assertEqual(self.rows(), [(1, 0), (5, 0)])
+        self.assertEqual(self.outline.state(0), "closed")
+        self.assertEqual(self.outline.state(1), None)
+        self.assertTrue(self.outline.toggle(0))
+        self.assertEqual(self.rows(), [(1, 0), (2, 1), (3, 1), (5, 0)])
+        self.assertFalse(self.outline.toggle(1))  # no subtasks
+        self.outline.toggle(2)
+        self.assertEqual(self.rows(), [(1, 0), (2, 1), (3, 1), (4, 2), (5, 0)])
+        self.assertEqual(self.outline.progress(0), (0, 3))
+        self.outline.toggle(0)
+        self.assertEqual(self.rows(), [(1, 0), (5, 0)])
+        self.outline.toggle(0)  # task 3 stayed expanded
+        self.assertEqual(self.rows(), [(1, 0), (2, 1), (3, 1), (4, 2), (5, 0)])
+
+    def test_reveal_and_refresh(self):
+        """Test that reveal expands the ancestors and refresh drops deleted tasks"""
+        rows = self.outline.tasks
+        self.assertEqual(self.outline.reveal(4), 3)
+        self.assertIs(self.outline.tasks, rows)  # changed in place
+        self.store.delete(3)
+        self.outline.refresh()
+        self.assertEqual(self.rows(), [(1, 0), (2, 1), (5, 0)])
+        self.assertEqual(self.outline.expanded, {1})
+
+
+if __name__ == '__main__':
+    unittest.main()
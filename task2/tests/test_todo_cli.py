@@ -0,0 +1,114 @@
+"""
+test_todo_cli.py - Unit tests for the command line interface
+"""
+
+import unittest
+import sys
+import os
+import io
+import json
+import tempfile
+from contextlib import redirect_stderr
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import todo_cli
+
+
+class TestTodoCli(unittest.TestCase):
+    """Test cases for todo_cli commands"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "todo_gui.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def cli(self, *argv):
+        """Run one command; return (exit status, output)"""
+        args = todo_cli.build_parser().parse_args(["--file", self.path, *argv])
+        store = todo_cli.TodoStore(todo_cli.open_storage(args.file, args.sqlite))
+        out = io.StringIO()
+        try:
+            with redirect_stderr(io.StringIO()):
+                status = todo_cli.run(store, args, out)
+        finally:
+            store.close()
+        return status, out.getvalue()
+
+    def test_commands_change_the_task_file(self):
+        """Test add, complete, list and clear-completed end to end"""
+        self.assertEqual(self.cli("add", "Buy", "milk"), (0, "Added task 1\n"))
+        self.cli("add", "Write report", "--due", "2026-01-31")
+        self.assertEqual(self.cli("complete", "1")[1], "Completed 1 task(s)\n")
+
+        status, out = self.cli("list", "--view", "pending", "--json")
+        tasks = [json.loads(line) for line in out.splitlines()]
+        self.assertEqual([(t["id"], t["task"], t["due"]) for t in tasks],
+                         [(2, "Write report", "2026-01-31")])
+
+        self.assertEqual(self.cli("clear-completed")[1], "Cleared 1 completed task(s)\n")
+        with open(self.path, encoding='utf-8') as f:
+            self.assertEqual([t["id"] for t in json.load(f)["tasks"]], [2])
+
+    def test_search(self):
+        """Test that search prints the matches and their count"""
+        for text in ("Fix login bug", "Buy milk", "Fix typo"):
+            self.cli("add", text)
+        status, out = self.cli("search", "fix")
+        self.assertEqual(out.splitlines()[-1], "2 match(es)")
+        self.assertIn("Fix login bug", out)
+        self.assertNotIn("Buy milk", out)
+
+    def test_tag_filter(self):
+        """Test list --tags and the tag counts"""
+        for text in ("Report #work", "Dishes #home", "Email #work"):
+            self.cli("add", text)
+        self.cli("complete", "3")
+        status, out = self.cli("list", "--tags", "#work AND NOT completed", "--json")
+        self.assertEqual([json.loads(line)["id"] for line in out.splitlines()], [1])
+        self.assertEqual(self.cli("list", "--tags", "#work AND")[0], 2)
+        self.assertEqual(self.cli("tags")[1].split(), ["#work", "2", "#home", "1"])
+
+    def test_subtasks(self):
+        """Test add --parent, move and the indented tree with progress"""
+        self.cli("add", "Launch")
+        self.cli("add", "Write docs", "--parent", "1")
+        self.cli("add", "Ship")
+        self.cli("complete", "2")
+        self.assertEqual(self.cli("move", "3", "--parent", "1"), (0, "Moved task 3\n"))
+        self.assertEqual(self.cli("move", "1", "--parent", "3")[0], 1)  # would make a loop
+        self.assertEqual(self.cli("add", "Orphan", "--parent", "9")[0], 1)
+        lines = self.cli("tree")[1].splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].endswith("[1/2 done]"))
+        self.assertTrue(lines[1].startswith("    ") and "Write docs" in lines[1])
+        self.assertEqual(self.cli("move", "3", "--top")[0], 0)
+        self.assertTrue(self.cli("tree")[1].splitlines()[0].endswith("[1/1 done]"))
+
+    def test_missing_ids_fail(self):
+        """Test that unknown IDs give a non-zero status without blocking the rest"""
+        self.cli("add", "Only task")
+        status, out = self.cli("delete", "1", "7")
+        self.assertEqual((status, out), (1, "Deleted 1 task(s)\n"))
+
+    def test_bad_due_date_is_rejected(self):
+        """Test that --due must be a real date"""
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            self.cli("add", "Task", "--due", "2026-02-30")
+
+    def test_undo_across_runs(self):
+        """Test that undo reverts a change made by an earlier command"""
+        with redirect_stderr(io.StringIO()):
+            todo_cli.main(["--file", self.path, "add", "Keep me"])
+            todo_cli.main(["--file", self.path, "delete", "1"])
+            self.assertEqual(todo_cli.main(["--file", self.path, "undo"]), 0)
+            self.assertIn("Keep me", self.cli("list")[1])
+            self.assertEqual(todo_cli.main(["--file", self.path, "redo"]), 0)
+            self.assertEqual(todo_cli.main(["--file", self.path, "redo"]), 1)
+        self.assertEqual(self.cli("list")[1], "")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+"""
+test_todo_server.py - Unit tests for the HTTP sync API and its client
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from change_log import ChangeLog
+from todo_client import TodoClient
+from todo_server import TaskServer
+from todo_storage import JsonTaskStorage
+from todo_store import TodoStore
+
+
+class TestChangeLog(unittest.TestCase):
+    """Test cases for ChangeLog"""
+
+    def test_since(self):
+        """Test that since returns each changed ID once, oldest first"""
+        log = ChangeLog()
+        log.record([1, 2])
+        version = log.record([3])
+        log.record([1])
+        self.assertEqual(log.since(0), [1, 2, 3])
+        self.assertEqual(log.since(version), [1])
+        self.assertEqual(log.since(log.version), [])
+        self.assertIsNone(log.since(log.version + 1))
+
+    def test_old_versions_are_forgotten(self):
+        """Test that trimming makes old versions unknown but keeps recent ones"""
+        log = ChangeLog(max_entries=10)
+        for task_id in range(1, 31):
+            log.record([task_id])
+        self.assertIsNone(log.since(0))
+        self.assertGreater(log.oldest, 0)
+        self.assertEqual(log.since(log.version - 3), [28, 29, 30])
+
+
+class TestTaskServer(unittest.TestCase):
+    """Test the API with the store owned by the test thread (host mode)"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = TodoStore(JsonTaskStorage(os.path.join(self.tmp.name, "todo_gui.json")))
+        for text in ("Buy milk", "Fix bug", "Call mom"):
+            self.store.add(text)
+        self.server = TaskServer(self.store, port=0, token="secret")
+        self.server.start_thread()
+        self.client = TodoClient(f"http://127.0.0.1:{self.server.port}", token="secret")
+        self.pool = ThreadPoolExecutor(1)
+
+    def tearDown(self):
+        self.pool.shutdown()
+        self.server.stop()
+        self.tmp.cleanup()
+
+    def call(self, fn, *args, **kwargs):
+        """Run a client call on another thread while serving requests here"""
+        future = self.pool.submit(fn, *args, **kwargs)
+        deadline = time.monotonic() + 10
+        while not future.done() and time.monotonic() < deadline:
+            self.server.process_pending()
+            time.sleep(0.001)
+        return future.result(timeout=0)
+
+    def test_paging(self):
+        """Test that pages follow each other and report the total"""
+        status, _, page = self.call(self.client.request, "GET", "/tasks?offset=1&limit=1")
+        self.assertEqual(status, 200)
+        self.assertEqual((page["total"], page["next"]), (3, 2))
+        self.assertEqual([t["task"] for t in page["tasks"]], ["Fix bug"])
+
+    def test_token_is_required(self):
+        """Test that requests without the token are refused"""
+        status, _, _ = self.call(TodoClient(self.client.base_url).request, "GET", "/tasks")
+        self.assertEqual(status, 401)
+
+    def test_etags(self):
+        """Test If-None-Match (304) and If-Match (412) handling"""
+        status, headers, _ = self.call(self.client.request, "GET", "/tasks/2")
+        etag = headers["ETag"]
+        status, _, _ = self.call(self.client.request, "GET", "/tasks/2",
+                                 headers={"If-None-Match": etag})
+        self.assertEqual(status, 304)
+
+        self.store.edit(2, "Fix the other bug")
+        status, _, _ = self.call(self.client.request, "PATCH", "/tasks/2",
+                                 {"completed": True}, headers={"If-Match": etag})
+        self.assertEqual(status, 412)
+        self.assertFalse(self.store.get(2)["completed"])
+
+    def test_client_syncs_deltas(self):
+        """Test that pull downloads only what changed since the last pull"""
+        self.assertEqual(self.call(self.client.pull), 3)
+        self.assertEqual(self.call(self.client.pull), 0)  # 304
+
+        added = self.call(self.client.add, "Water plants", due="2026-05-01")
+        self.call(self.client.update, 1, completed=True)
+        self.store.delete(3)
+        self.assertEqual(self.call(self.client.pull), 3)
+        self.assertEqual(sorted(self.client.tasks), [1, 2, added["id"]])
+        self.assertTrue(self.client.tasks[1]["completed"])
+        self.assertEqual(self.client.tasks[added["id"]]["due"], "2026-05-01")
+        self.assertEqual(self.client.tasks, {t["id"]: dict(t) for t in self.store.tasks})
+
+    def test_unknown_epoch_starts_over(self):
+        """Test that a delta from another server run falls back to a full fetch"""
+        self.call(self.client.pull)
+        self.client.epoch = "restarted"
+        self.store.add("After restart")
+        self.assertEqual(self.call(self.client.pull), 4)
+
+    def test_patch_is_one_change(self):
+        """Test that a PATCH with several fields is one version bump"""
+        version = self.store.changes.version
+        status, _, task = self.call(self.client.request, "PATCH", "/tasks/2",
+                                    {"task": " Fix it ", "due": "2026-05-01", "completed": True})
+        self.assertEqual(status, 200)
+        self.assertEqual((task["task"], task["due"], task["completed"]),
+                         ("Fix it", "2026-05-01", True))
+        self.assertEqual(self.store.changes.version, version + 1)
+
+    def test_bad_requests(self):
+        """Test validation errors and unknown routes"""
+        for method, path, data, expected in (
+                ("POST", "/tasks", {"task": ""}, 400),
+                ("POST", "/tasks", {"task": "X", "due": "31/01/2026"}, 400),
+                ("PATCH", "/tasks/1", {"completed": "yes"}, 400),
+                ("POST", "/tasks", {"task": "X", "parent": 99}, 400),
+                ("PATCH", "/tasks/1", {"parent": 1}, 400),
+                ("GET", "/tasks/99", None, 404),
+                ("GET", "/tasks?tags=%23work%20AND", None, 400),
+                ("GET", "/nowhere", None, 404),
+                ("PUT", "/tasks", {}, 405)):
+            with self.subTest(method=method, path=path):
+                status, _, body = self.call(self.client.request, method, path, data)
+                self.assertEqual(status, expected)
+                self.assertIn("error", body)
+
+
+class ChangingClient(TodoClient):
+    """Client whose server reports a new version on every page"""
+
+    requests = 0
+
+    def request(self, method, path, data=None, headers=None):
+        self.requests += 1
+        return 200, {}, {"epoch": "e", "version": self.requests, "next": 1,
+                         "tasks": [{"id": self.requests}]}
+
+
+class TestTodoClient(unittest.TestCase):
+    """Test the client without a server"""
+
+    def test_fetch_all_gives_up(self):
+        """Test that paging a list that never settles stops after a few attempts"""
+        client = ChangingClient()
+        with self.assertRaises(RuntimeError):
+            client.fetch_all()
+        self.assertEqual(client.requests, 2 * TodoClient.FETCH_ATTEMPTS)
+        self.assertEqual(client.tasks, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
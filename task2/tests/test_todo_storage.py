@@ -0,0 +1,212 @@
+"""
+test_todo_storage.py - Unit tests for the JSON and SQLite task storage
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+import threading
+import time
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from todo_storage import AutosaveJsonStorage, JsonTaskStorage, SqliteTaskStorage, open_storage
+
+
+def make_task(task_id, text, completed=False):
+    return {
+        "id": task_id,
+        "task": text,
+        "completed": completed,
+        "created_at": f"2026-01-{task_id:02d} 10:00",
+        "completed_at": "2026-02-01 09:00" if completed else None,
+        "due": None,
+        "priority": 0,
+        "repeat": None,
+        "parent": None
+    }
+
+
+class TestSqliteTaskStorage(unittest.TestCase):
+    """Test cases for the SQLite backend"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.storage = SqliteTaskStorage(os.path.join(self.tmp.name, "todo.db"))
+
+    def tearDown(self):
+        self.storage.close()
+        self.tmp.cleanup()
+
+    def test_insert_and_update(self):
+        """Test that single changes are written through"""
+        task = make_task(1, "Write report")
+        self.storage.insert(task)
+        task["completed"] = True
+        task["completed_at"] = "2026-02-01 09:00"
+        self.storage.update(task)
+
+        self.assertEqual(self.storage.load(), [task])
+
+    def test_delete_keeps_ids(self):
+        """Test that deleting leaves the other IDs alone"""
+        for i in range(1, 5):
+            self.storage.insert(make_task(i, f"Task {i}"), next_id=i + 1)
+        self.storage.delete([2, 3])
+
+        loaded = self.storage.load()
+        self.assertEqual([t["id"] for t in loaded], [1, 4])
+        self.assertEqual(self.storage.next_id, 5)
+
+    def test_indexes_exist(self):
+        """Test that status and created date are indexed"""
+        names = {row[0] for row in self.storage.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertIn("idx_tasks_status", names)
+        self.assertIn("idx_tasks_created", names)
+
+
+class CountingAutosave(AutosaveJsonStorage):
+    """Autosave storage that counts file writes"""
+
+    writes = 0
+
+    def _write(self, tasks, next_id, upto):
+        self.writes += 1
+        super()._write(tasks, next_id, upto)
+
+
+class BlockingAutosave(AutosaveJsonStorage):
+    """Autosave storage whose writes wait until released"""
+
+    def __init__(self, *args, **kwargs):
+        self.writing = threading.Event()
+        self.release = threading.Event()
+        super().__init__(*args, **kwargs)
+
+    def _write(self, tasks, next_id, upto):
+        self.writing.set()
+        self.release.wait(2.0)
+        super()._write(tasks, next_id, upto)
+
+
+class TestAutosaveJsonStorage(unittest.TestCase):
+    """Test coalesced background saving"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "todo_gui.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def wait_saved(self, storage, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while storage.status != "saved" and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return storage.status
+
+    def test_burst_is_one_write(self):
+        """Test that many quick changes are saved together"""
+        storage = CountingAutosave(self.path, quiet=0.05, max_delay=1.0)
+        tasks = []
+        for i in range(1, 51):
+            tasks.append(dict(make_task(1, f"Task {i}"), id=i))
+            storage.insert(tasks[-1], tasks, next_id=i + 1)
+        self.assertEqual(storage.status, "pending")
+
+        self.assertEqual(self.wait_saved(storage), "saved")
+        self.assertEqual(storage.writes, 1)
+        self.assertEqual(len(JsonTaskStorage(self.path).load()), 50)
+        storage.close()
+        self.assertEqual(storage.writes, 1)
+
+    def test_max_delay_bounds_a_long_burst(self):
+        """Test that steady changes still get written"""
+        storage = CountingAutosave(self.path, quiet=10.0, max_delay=0.05)
+        tasks = [make_task(1, "A")]
+        deadline = time.monotonic() + 0.5
+        while time.monotonic() < deadline and storage.writes == 0:
+            storage.update(tasks[0], tasks)
+            time.sleep(0.005)
+        self.assertGreaterEqual(storage.writes, 1)
+        storage.close()
+
+    def test_change_during_write_stays_pending(self):
+        """Test that a write only forgets the changes it covered"""
+        storage = BlockingAutosave(self.path, quiet=0.01, max_delay=0.05)
+        tasks = [make_task(1, "A")]
+        storage.insert(tasks[0], tasks, next_id=2)
+        self.assertTrue(storage.writing.wait(2.0))
+
+        tasks.append(make_task(2, "B"))
+        storage.insert(tasks[1], tasks, next_id=3)
+        self.assertEqual(storage.pending_changes(), {1: "insert", 2: "insert"})
+        storage.release.set()
+
+        self.assertEqual(self.wait_saved(storage), "saved")
+        self.assertEqual(storage.pending_changes(), {})
+        storage.close()
+        self.assertEqual(JsonTaskStorage(self.path).load(), tasks)
+
+    def test_close_flushes(self):
+        """Test that closing writes pending changes and no temp file is left"""
+        storage = AutosaveJsonStorage(self.path, quiet=60.0, max_delay=60.0)
+        tasks = [make_task(1, "A")]
+        storage.insert(tasks[0], tasks, next_id=2)
+        storage.close()
+
+        reloaded = JsonTaskStorage(self.path)
+        self.assertEqual(reloaded.load(), tasks)
+        self.assertEqual(reloaded.next_id, 2)
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+
+class TestOpenStorage(unittest.TestCase):
+    """Test backend selection and JSON migration"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.json_path = os.path.join(self.tmp.name, "todo_gui.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_json_is_default(self):
+        """Test that the JSON file is used unless SQLite is asked for"""
+        storage = open_storage(self.json_path)
+        self.assertIsInstance(storage, JsonTaskStorage)
+        storage.replace_all([make_task(1, "A")], next_id=7)
+        self.assertEqual(open_storage(self.json_path).load(), [make_task(1, "A")])
+
+    def test_reads_plain_list_files(self):
+        """Test loading a file in the original list format"""
+        with open(self.json_path, 'w') as f:
+            json.dump([make_task(1, "A")], f)
+        storage = open_storage(self.json_path)
+        self.assertEqual(storage.load(), [make_task(1, "A")])
+        self.assertIsNone(storage.next_id)
+
+    def test_migrates_json_once(self):
+        """Test that an empty database is filled from the JSON file"""
+        tasks = [make_task(1, "A"), make_task(2, "B", completed=True)]
+        with open(self.json_path, 'w') as f:
+            json.dump(tasks, f)
+
+        storage = open_storage(self.json_path, use_sqlite=True)
+        self.assertIsInstance(storage, SqliteTaskStorage)
+        self.assertEqual(storage.load(), tasks)
+        storage.delete([1])
+        storage.close()
+
+        # Reopening must not import the JSON tasks a second time
+        storage = open_storage(self.json_path, use_sqlite=True)
+        self.assertEqual(len(storage.load()), 1)
+        storage.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
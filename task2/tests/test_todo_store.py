@@ -0,0 +1,236 @@
+"""
+test_todo_store.py - Unit tests for the task list model
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from todo_storage import JsonTaskStorage
+from todo_store import TodoStore
+from undo_journal import UndoJournal
+
+
+class TestTodoStore(unittest.TestCase):
+    """Test cases for TodoStore changes, events and counters"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "todo_gui.json")
+        self.store = TodoStore(JsonTaskStorage(self.path))
+        self.events = []
+        self.store.subscribe(lambda event, index, task: self.events.append((event, index)))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_events_name_the_affected_row(self):
+        """Test that each change reports its event and index"""
+        for text in ("A", "B", "C"):
+            self.store.add(text)
+        self.store.complete(2)
+        self.store.delete(1)
+
+        self.assertEqual(self.events, [
+            ("add", 0), ("add", 1), ("add", 2), ("update", 1), ("remove", 0)
+        ])
+
+    def test_counters_follow_changes(self):
+        """Test total and completed counters without re-summing"""
+        for text in ("A", "B", "C"):
+            self.store.add(text)
+        self.store.complete(1)
+        self.store.complete(3)
+        self.assertEqual((self.store.total, self.store.completed), (3, 2))
+
+        self.store.delete(1)
+        self.assertEqual((self.store.total, self.store.completed), (2, 1))
+
+        self.assertEqual(self.store.clear_completed(), 1)
+        self.assertEqual((self.store.total, self.store.completed), (1, 0))
+        self.assertEqual(self.events[-1], ("reset", None))
+
+    def test_ids_are_stable_and_never_reused(self):
+        """Test IDs across deletes and reloads"""
+        for text in ("A", "B", "C"):
+            self.store.add(text)
+        self.store.delete(3)
+        self.store.delete(1)
+        self.assertEqual([t["id"] for t in self.store.tasks], [2])
+        self.assertEqual(self.store.get(2)["task"], "B")
+
+        reloaded = TodoStore(JsonTaskStorage(self.path))
+        self.assertEqual(reloaded.add("D")["id"], 4)
+        self.assertEqual(reloaded.position(4), 1)
+
+    def test_complete_twice_is_rejected(self):
+        """Test completing a finished or missing task"""
+        self.store.add("A")
+        self.assertIsNotNone(self.store.complete(1))
+        self.assertIsNone(self.store.complete(1))
+        self.assertIsNone(self.store.complete(99))
+        self.assertEqual(self.store.completed, 1)
+
+    def test_changes_are_saved(self):
+        """Test that a new store sees the saved tasks"""
+        self.store.add("A")
+        self.store.add("B")
+        self.store.complete(2)
+
+        reloaded = TodoStore(JsonTaskStorage(self.path))
+        self.assertEqual(reloaded.tasks, self.store.tasks)
+        self.assertEqual(reloaded.completed, 1)
+
+
+
+class CountingStorage(JsonTaskStorage):
+    """JSON storage that counts full rewrites"""
+
+    writes = 0
+
+    def replace_all(self, tasks, next_id=None):
+        self.writes += 1
+        super().replace_all(tasks, next_id)
+
+
+class TestBulkOperations(unittest.TestCase):
+    """Test that bulk changes are one mutation, one save and one event"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.storage = CountingStorage(os.path.join(self.tmp.name, "todo_gui.json"))
+        self.store = TodoStore(self.storage)
+        self.events = []
+        self.store.subscribe(lambda event, index, task: self.events.append(event))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_add_many(self):
+        """Test adding pasted lines"""
+        added = self.store.add_many(["A", "B", "C"])
+        self.assertEqual([t["id"] for t in added], [1, 2, 3])
+        self.assertEqual(self.store.total, 3)
+        self.assertEqual((self.storage.writes, self.events), (1, ["reset"]))
+
+    def test_complete_and_reopen_many(self):
+        """Test bulk complete and uncomplete, skipping unchanged tasks"""
+        self.store.add_many(["A", "B", "C"])
+        changed = self.store.set_completed_many([1, 2, 99], True)
+        self.assertEqual(len(changed), 2)
+        self.assertEqual(self.store.completed, 2)
+
+        changed = self.store.set_completed_many([2, 3], False)
+        self.assertEqual([t["id"] for t in changed], [2])
+        self.assertEqual(self.store.completed, 1)
+        self.assertIsNone(self.store.get(2)["completed_at"])
+        self.assertEqual(self.storage.writes, 3)
+
+    def test_delete_many(self):
+        """Test bulk delete with counters and search kept in step"""
+        self.store.add_many([f"Task {i}" for i in range(10)])
+        self.store.set_completed_many([1, 2], True)
+        self.assertEqual(self.store.search("task")[0], 10)
+
+        removed = self.store.delete_many([2, 3, 4, 42])
+        self.assertEqual(len(removed), 3)
+        self.assertEqual((self.store.total, self.store.completed), (7, 1))
+        self.assertEqual(self.store.search("task")[0], 7)
+        self.assertEqual(self.storage.writes, 3)
+
+    def test_update_is_one_change(self):
+        """Test that several fields change with one save, event and undo"""
+        self.store = TodoStore(self.storage, journal=UndoJournal())
+        self.store.subscribe(lambda event, index, task: self.events.append(event))
+        self.store.add_many(["A", "B"])
+        self.storage.writes, self.events[:] = 0, []
+        version = self.store.changes.version
+
+        task = self.store.update(2, {"task": "B2", "priority": 3, "parent": 1, "completed": True})
+        self.assertEqual((task["task"], task["priority"], task["parent"]), ("B2", 3, 1))
+        self.assertIsNotNone(task["completed_at"])
+        self.assertEqual(self.store.completed, 1)
+        self.assertEqual(self.store.search("b2")[0], 1)
+        self.assertEqual((self.storage.writes, self.events), (1, ["update"]))
+        self.assertEqual(self.store.changes.version, version + 1)
+
+        self.store.undo()
+        task = self.store.get(2)
+        self.assertEqual((task["task"], task["priority"], task["parent"], task["completed"]),
+                         ("B", 0, None, False))
+
+    def test_update_checks_everything_first(self):
+        """Test that one bad field leaves the task untouched"""
+        self.store.add_many(["A", "B"])
+        for fields in ({"task": "B2", "priority": 9}, {"task": "B2", "parent": 2},
+                       {"task": "B2", "colour": "red"}):
+            with self.subTest(fields=fields):
+                with self.assertRaises(ValueError):
+                    self.store.update(2, fields)
+                self.assertEqual(self.store.get(2)["task"], "B")
+        self.assertEqual(self.storage.writes, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+
+class TestProgressiveLoad(unittest.TestCase):
+    """Test cases for loading the task file a chunk at a time"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "todo_gui.json")
+        store = TodoStore(JsonTaskStorage(self.path))
+        store.add_many([f"Task {i}" for i in range(10)])
+        store.complete(3)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_first_page_then_reset(self):
+        """Test that load_step gives a first page and ends with a reset"""
+        store = TodoStore(JsonTaskStorage(self.path), progressive=True)
+        events = []
+        store.subscribe(lambda event, index, task: events.append(event))
+        self.assertTrue(store.loading)
+        self.assertTrue(store.load_step(4))
+        self.assertEqual([t["id"] for t in store.tasks], [1, 2, 3, 4])
+        while store.load_step(4):
+            pass
+        self.assertFalse(store.loading)
+        self.assertEqual(events, ["reset"])
+        self.assertEqual((store.total, store.completed), (10, 1))
+        self.assertEqual(store.add("New")["id"], 11)
+
+    def test_change_finishes_loading(self):
+        """Test that a change made mid-load reads the rest of the file first"""
+        store = TodoStore(JsonTaskStorage(self.path), progressive=True)
+        store.load_step(2)
+        store.delete(9)
+        self.assertFalse(store.loading)
+        self.assertEqual(len(TodoStore(JsonTaskStorage(self.path)).tasks), 9)
+
+    def test_old_list_format(self):
+        """Test that a plain list of tasks still loads progressively"""
+        with open(self.path, 'w') as f:
+            f.write('[{"id": 5, "task": "Old", "completed": false,'
+                    ' "created_at": "2024-01-01 10:00"}]')
+        store = TodoStore(JsonTaskStorage(self.path), progressive=True)
+        store.finish_loading()
+        self.assertEqual([t["task"] for t in store.tasks], ["Old"])
+        self.assertEqual(store.next_id, 6)
+
+    def test_corrupt_file_loads_nothing(self):
+        """Test that a file broken part way leaves an empty list"""
+        with open(self.path) as f:
+            text = f.read()
+        with open(self.path, 'w') as f:
+            f.write(text[:len(text) // 2] + "#")
+        store = TodoStore(JsonTaskStorage(self.path), progressive=True)
+        store.finish_loading()
+        self.assertEqual((store.tasks, store.total), ([], 0))
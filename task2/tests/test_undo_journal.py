@@ -0,0 +1,128 @@
+"""
+test_undo_journal.py - Unit tests for undo/redo of task changes
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from todo_storage import JsonTaskStorage, SqliteTaskStorage
+from todo_store import TodoStore
+from undo_journal import UndoJournal
+
+
+def snapshot(store):
+    return [dict(t) for t in store.tasks]
+
+
+class TestUndoRedo(unittest.TestCase):
+    """Test cases for TodoStore.undo and TodoStore.redo"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "todo_gui.json")
+        self.store = self.open()
+        self.store.add_many(["Alpha", "Beta", "Gamma", "Delta"])
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def open(self):
+        return TodoStore(JsonTaskStorage(self.path), journal=UndoJournal(self.path + ".undo"))
+
+    def test_undo_delete_restores_task(self):
+        """Test that a deleted task comes back with its ID and fields"""
+        self.store.complete(2)
+        before = snapshot(self.store)
+        self.store.delete(2)
+        self.assertEqual(self.store.undo(), "Delete task 2")
+        self.assertEqual(snapshot(self.store), before)
+        self.assertEqual((self.store.total, self.store.completed), (4, 1))
+        self.assertEqual(self.store.search("beta")[0], 1)
+        self.assertEqual(len(JsonTaskStorage(self.path).load()), 4)
+
+    def test_bulk_change_is_one_entry(self):
+        """Test that clear_completed is undone in one step"""
+        self.store.set_completed_many([1, 3])
+        before = snapshot(self.store)
+        self.store.clear_completed()
+        self.store.undo()
+        self.assertEqual(snapshot(self.store), before)
+        self.assertEqual(self.store.view("completed", "added"), [self.store.get(1), self.store.get(3)])
+
+    def test_redo_repeats_and_new_change_clears_it(self):
+        """Test redo after undo, and that a new change drops the redo history"""
+        self.store.edit(1, "First")
+        after = snapshot(self.store)
+        self.store.undo()
+        self.assertEqual(self.store.get(1)["task"], "Alpha")
+        self.assertEqual(self.store.redo(), "Edit task 1")
+        self.assertEqual(snapshot(self.store), after)
+        self.store.undo()
+        self.store.add("Epsilon")
+        self.assertIsNone(self.store.redo())
+
+    def test_undo_add_keeps_ids_unused(self):
+        """Test that undoing an add does not let its ID be reused"""
+        self.store.undo()
+        self.assertEqual(self.store.tasks, [])
+        self.assertEqual(self.store.add("New")["id"], 5)
+        self.assertIsNone(self.store.redo())
+
+    def test_history_survives_restart(self):
+        """Test that undo and redo work after the store is reopened"""
+        self.store.delete_many([1, 2])
+        self.store.complete(3)
+        self.store.undo()
+        self.store.close()
+
+        self.store = self.open()
+        self.assertEqual(self.store.journal.redo_label, "Complete task 3")
+        self.assertEqual(self.store.undo(), "Delete 2 task(s)")
+        self.assertEqual([t["id"] for t in self.store.tasks], [1, 2, 3, 4])
+        self.store.redo()
+        self.store.redo()
+        self.assertTrue(self.store.get(3)["completed"])
+
+    def test_torn_last_line_is_ignored(self):
+        """Test that a partly written last entry does not lose the others"""
+        self.store.delete(4)
+        self.store.close()
+        with open(self.path + ".undo", 'a') as f:
+            f.write('{"op": "do", "label": "Del')
+
+        self.store = self.open()
+        self.assertEqual(self.store.undo(), "Delete task 4")
+        self.assertEqual(self.store.undo(), "Add 4 task(s)")
+
+    def test_sqlite_storage(self):
+        """Test that undo writes through the SQLite backend too"""
+        path = os.path.join(self.tmp.name, "todo_gui.db")
+        store = TodoStore(SqliteTaskStorage(path), journal=UndoJournal())
+        store.add_many(["One", "Two"])
+        store.delete(1)
+        store.undo()
+        store.close()
+        self.assertEqual([t["task"] for t in SqliteTaskStorage(path).load()], ["One", "Two"])
+
+
+class TestUndoJournal(unittest.TestCase):
+    """Test cases for the journal's memory budget"""
+
+    def test_oldest_entries_dropped_over_budget(self):
+        """Test that the journal stays within max_bytes"""
+        journal = UndoJournal(max_bytes=2000)
+        for i in range(50):
+            journal.record(f"Edit task {i}", [i], [("text", False, "2024-01-01 10:00", None, None)])
+        self.assertLessEqual(journal.size, 2000)
+        self.assertEqual(journal.undo_label, "Edit task 49")
+        labels = []
+        while journal.can_undo:
+            labels.append(journal.undo_label)
+            journal.undone([None])
+        self.assertLess(len(labels), 50)
@@ -1,438 +1,940 @@
-"""
-TO-DO LIST GUI APPLICATION
-For Coding Samurai Python Development Internship - Project 2
-Opens in a new window with graphical interface
-"""
-
-import tkinter as tk
-from tkinter import ttk, messagebox, font
-import json
-import os
-from datetime import datetime
-
-class TodoListApp:
-    def __init__(self):
-        # Create main window
-        self.root = tk.Tk()
-        self.root.title("Coding Samurai - To-Do List")
-        self.root.geometry("800x600")
-        self.root.configure(bg="#F5F7FA")
-        
-        # File for saving tasks
-        self.filename = "todo_gui.json"
-        self.tasks = self.load_tasks()
-        
-        # Custom fonts
-        self.title_font = font.Font(family="Arial", size=24, weight="bold")
-        self.task_font = font.Font(family="Arial", size=12)
-        self.button_font = font.Font(family="Arial", size=11, weight="bold")
-        
-        # Setup the UI
-        self.setup_ui()
-        
-    def load_tasks(self):
-        """Load tasks from JSON file"""
-        if os.path.exists(self.filename):
-            try:
-                with open(self.filename, 'r') as file:
-                    return json.load(file)
-            except:
-                return []
-        return []
-    
-    def save_tasks(self):
-        """Save tasks to JSON file"""
-        with open(self.filename, 'w') as file:
-            json.dump(self.tasks, file, indent=2)
-    
-    def setup_ui(self):
-        # Main container
-        main_frame = tk.Frame(self.root, bg="#F5F7FA")
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
-        # Header
-        header_frame = tk.Frame(main_frame, bg="#F5F7FA")
-        header_frame.pack(fill=tk.X, pady=(0, 20))
-        
-        tk.Label(
-            header_frame,
-            text="📝 To-Do List Application",
-            font=self.title_font,
-            bg="#F5F7FA",
-            fg="#2C3E50"
-        ).pack(side=tk.LEFT)
-        
-        # Stats label
-        self.stats_label = tk.Label(
-            header_frame,
-            text="Tasks: 0 | Completed: 0",
-            font=("Arial", 11),
-            bg="#F5F7FA",
-            fg="#7F8C8D"
-        )
-        self.stats_label.pack(side=tk.RIGHT)
-        
-        # Input section
-        input_frame = tk.Frame(main_frame, bg="#F5F7FA")
-        input_frame.pack(fill=tk.X, pady=(0, 20))
-        
-        tk.Label(
-            input_frame,
-            text="Add New Task:",
-            font=self.button_font,
-            bg="#F5F7FA",
-            fg="#2C3E50"
-        ).pack(anchor=tk.W)
-        
-        # Task entry
-        self.task_entry = tk.Entry(
-            input_frame,
-            font=self.task_font,
-            bg="white",
-            fg="#2C3E50",
-            relief=tk.FLAT,
-            width=50
-        )
-        self.task_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
-        self.task_entry.bind("<Return>", lambda e: self.add_task())
-        
-        # Add button
-        add_btn = tk.Button(
-            input_frame,
-            text="➕ Add Task",
-            font=self.button_font,
-            bg="#27AE60",
-            fg="white",
-            activebackground="#219653",
-            activeforeground="white",
-            relief=tk.FLAT,
-            padx=20,
-            pady=8,
-            command=self.add_task
-        )
-        add_btn.pack(side=tk.RIGHT)
-        
-        # Task list section
-        list_frame = tk.Frame(main_frame, bg="#F5F7FA")
-        list_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # List header
-        list_header = tk.Frame(list_frame, bg="#34495E")
-        list_header.pack(fill=tk.X)
-        
-        headers = ["Status", "ID", "Task", "Created", "Actions"]
-        for i, header in enumerate(headers):
-            tk.Label(
-                list_header,
-                text=header,
-                font=self.button_font,
-                bg="#34495E",
-                fg="white",
-                padx=10,
-                pady=10
-            ).grid(row=0, column=i, sticky="w")
-        
-        # Configure grid weights
-        for i in range(5):
-            list_header.grid_columnconfigure(i, weight=1)
-        
-        # Treeview for tasks
-        self.tree_frame = tk.Frame(list_frame, bg="#F5F7FA")
-        self.tree_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Create canvas and scrollbar
-        self.canvas = tk.Canvas(self.tree_frame, bg="#F5F7FA", highlightthickness=0)
-        scrollbar = ttk.Scrollbar(self.tree_frame, orient="vertical", command=self.canvas.yview)
-        self.scrollable_frame = tk.Frame(self.canvas, bg="#F5F7FA")
-        
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
-        
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=scrollbar.set)
-        
-        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        # Bind mouse wheel for scrolling
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-        
-        # Control buttons
-        control_frame = tk.Frame(main_frame, bg="#F5F7FA")
-        control_frame.pack(fill=tk.X, pady=(20, 0))
-        
-        buttons = [
-            ("✅ Mark Complete", "#2ECC71", self.mark_complete),
-            ("🗑️ Delete", "#E74C3C", self.delete_task),
-            ("🔍 Search", "#3498DB", self.search_tasks),
-            ("🧹 Clear Completed", "#95A5A6", self.clear_completed),
-            ("🔄 Refresh", "#9B59B6", self.refresh_list),
-            ("💾 Save & Exit", "#2C3E50", self.exit_app)
-        ]
-        
-        for text, color, command in buttons:
-            btn = tk.Button(
-                control_frame,
-                text=text,
-                font=self.button_font,
-                bg=color,
-                fg="white",
-                activebackground=color,
-                activeforeground="white",
-                relief=tk.FLAT,
-                padx=15,
-                pady=8,
-                command=command
-            )
-            btn.pack(side=tk.LEFT, padx=5)
-        
-        # Load and display initial tasks
-        self.refresh_list()
-    
-    def _on_mousewheel(self, event):
-        self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-    
-    def add_task(self):
-        """Add a new task"""
-        task_text = self.task_entry.get().strip()
-        if not task_text:
-            messagebox.showwarning("Empty Task", "Please enter a task description!")
-            return
-        
-        new_task = {
-            "id": len(self.tasks) + 1,
-            "task": task_text,
-            "completed": False,
-            "created_at": datetime.now().strftime("%Y-%m-%d %H:%M"),
-            "completed_at": None
-        }
-        
-        self.tasks.append(new_task)
-        self.save_tasks()
-        self.task_entry.delete(0, tk.END)
-        self.refresh_list()
-        messagebox.showinfo("Success", f"Task added successfully! (ID: {new_task['id']})")
-    
-    def refresh_list(self):
-        """Refresh the task list display"""
-        # Clear current display
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        
-        # Display tasks
-        for task in self.tasks:
-            task_frame = tk.Frame(self.scrollable_frame, bg="white", relief=tk.RAISED, bd=1)
-            task_frame.pack(fill=tk.X, pady=2)
-            
-            # Status
-            status = "✅" if task["completed"] else "⏳"
-            status_color = "#27AE60" if task["completed"] else "#F39C12"
-            tk.Label(
-                task_frame,
-                text=status,
-                font=self.task_font,
-                bg=status_color,
-                fg="white",
-                width=4
-            ).grid(row=0, column=0, sticky="nsew", padx=2, pady=2)
-            
-            # ID
-            tk.Label(
-                task_frame,
-                text=str(task["id"]),
-                font=self.task_font,
-                bg="white",
-                fg="#2C3E50",
-                width=5
-            ).grid(row=0, column=1, sticky="w", padx=5)
-            
-            # Task
-            task_text = task["task"]
-            if task["completed"]:
-                task_text = f"~~{task_text}~~"
-            
-            tk.Label(
-                task_frame,
-                text=task_text,
-                font=self.task_font,
-                bg="white",
-                fg="#2C3E50" if not task["completed"] else "#95A5A6",
-                anchor="w",
-                wraplength=300
-            ).grid(row=0, column=2, sticky="w", padx=5)
-            
-            # Created date
-            tk.Label(
-                task_frame,
-                text=task["created_at"],
-                font=self.task_font,
-                bg="white",
-                fg="#7F8C8D"
-            ).grid(row=0, column=3, sticky="w", padx=5)
-            
-            # Action buttons
-            action_frame = tk.Frame(task_frame, bg="white")
-            action_frame.grid(row=0, column=4, sticky="e", padx=5)
-            
-            if not task["completed"]:
-                complete_btn = tk.Button(
-                    action_frame,
-                    text="✓",
-                    font=self.task_font,
-                    bg="#27AE60",
-                    fg="white",
-                    width=3,
-                    command=lambda tid=task["id"]: self.mark_complete_single(tid)
-                )
-                complete_btn.pack(side=tk.LEFT, padx=2)
-            
-            delete_btn = tk.Button(
-                action_frame,
-                text="✗",
-                font=self.task_font,
-                bg="#E74C3C",
-                fg="white",
-                width=3,
-                command=lambda tid=task["id"]: self.delete_single_task(tid)
-            )
-            delete_btn.pack(side=tk.LEFT, padx=2)
-            
-            # Configure grid weights
-            for i in range(5):
-                task_frame.grid_columnconfigure(i, weight=1 if i == 2 else 0)
-        
-        # Update statistics
-        total = len(self.tasks)
-        completed = sum(1 for t in self.tasks if t["completed"])
-        self.stats_label.config(text=f"Tasks: {total} | Completed: {completed}")
-    
-    def mark_complete_single(self, task_id):
-        """Mark a single task as complete"""
-        for task in self.tasks:
-            if task["id"] == task_id and not task["completed"]:
-                task["completed"] = True
-                task["completed_at"] = datetime.now().strftime("%Y-%m-%d %H:%M")
-                self.save_tasks()
-                self.refresh_list()
-                messagebox.showinfo("Success", f"Task {task_id} marked as complete!")
-                return
-        messagebox.showwarning("Warning", f"Task {task_id} not found or already completed!")
-    
-    def delete_single_task(self, task_id):
-        """Delete a single task"""
-        if messagebox.askyesno("Confirm Delete", f"Delete task {task_id}?"):
-            for i, task in enumerate(self.tasks):
-                if task["id"] == task_id:
-                    self.tasks.pop(i)
-                    # Reassign IDs
-                    for idx, t in enumerate(self.tasks, 1):
-                        t["id"] = idx
-                    self.save_tasks()
-                    self.refresh_list()
-                    messagebox.showinfo("Deleted", "Task deleted successfully!")
-                    return
-    
-    def mark_complete(self):
-        """Mark selected task as complete"""
-        if not self.tasks:
-            messagebox.showwarning("No Tasks", "No tasks to mark as complete!")
-            return
-        self.refresh_list()
-    
-    def delete_task(self):
-        """Delete a task dialog"""
-        if not self.tasks:
-            messagebox.showwarning("No Tasks", "No tasks to delete!")
-            return
-        self.refresh_list()
-    
-    def search_tasks(self):
-        """Search for tasks"""
-        search_window = tk.Toplevel(self.root)
-        search_window.title("Search Tasks")
-        search_window.geometry("400x300")
-        search_window.configure(bg="#F5F7FA")
-        
-        tk.Label(
-            search_window,
-            text="🔍 Search Tasks",
-            font=self.title_font,
-            bg="#F5F7FA",
-            fg="#2C3E50"
-        ).pack(pady=20)
-        
-        search_entry = tk.Entry(
-            search_window,
-            font=self.task_font,
-            width=30
-        )
-        search_entry.pack(pady=10)
-        
-        result_text = tk.Text(
-            search_window,
-            height=10,
-            width=40,
-            font=self.task_font
-        )
-        result_text.pack(pady=10)
-        
-        def perform_search():
-            keyword = search_entry.get().strip().lower()
-            result_text.delete(1.0, tk.END)
-            
-            if not keyword:
-                result_text.insert(tk.END, "Please enter a search keyword!")
-                return
-            
-            results = [t for t in self.tasks if keyword in t["task"].lower()]
-            
-            if results:
-                result_text.insert(tk.END, f"Found {len(results)} task(s):\n\n")
-                for task in results:
-                    status = "Completed" if task["completed"] else "Pending"
-                    result_text.insert(tk.END, f"ID {task['id']}: {task['task']} ({status})\n")
-            else:
-                result_text.insert(tk.END, f"No tasks found for '{keyword}'")
-        
-        tk.Button(
-            search_window,
-            text="Search",
-            command=perform_search,
-            bg="#3498DB",
-            fg="white",
-            font=self.button_font,
-            padx=20
-        ).pack(pady=10)
-    
-    def clear_completed(self):
-        """Clear all completed tasks"""
-        completed_count = sum(1 for t in self.tasks if t["completed"])
-        
-        if completed_count == 0:
-            messagebox.showinfo("No Completed Tasks", "No completed tasks to clear!")
-            return
-        
-        if messagebox.askyesno("Confirm Clear", f"Clear {completed_count} completed task(s)?"):
-            self.tasks = [t for t in self.tasks if not t["completed"]]
-            # Reassign IDs
-            for idx, task in enumerate(self.tasks, 1):
-                task["id"] = idx
-            self.save_tasks()
-            self.refresh_list()
-            messagebox.showinfo("Cleared", f"Cleared {completed_count} completed task(s)!")
-    
-    def exit_app(self):
-        """Save and exit the application"""
-        self.save_tasks()
-        self.root.quit()
-    
-    def run(self):
-        """Start the application"""
-        self.root.mainloop()
-
-# Launch the application immediately
-if __name__ == "__main__":
-    app = TodoListApp()
+"""
+TO-DO LIST GUI APPLICATION
+For Coding Samurai Python Development Internship - Project 2
+Opens in a new window with graphical interface
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox, font, simpledialog, filedialog
+import sys
+from datetime import date, datetime, timedelta
+
+from recurrence import PRIORITIES, REPEATS
+from task_io import TaskExporter, TaskImporter
+from task_list_view import VirtualTaskList
+from task_tags import parse_tags
+from task_tree import TaskOutline
+from todo_server import DEFAULT_PORT, TaskServer
+from todo_storage import open_storage
+from todo_store import TodoStore
+from undo_journal import UndoJournal
+
+class TodoListApp:
+    # Search-as-you-type waits this long after the last key press
+    SEARCH_DELAY_MS = 150
+    SEARCH_LIMIT = 200
+    # Filter and sort choices above the task list
+    VIEW_LABELS = {
+        "All tasks": "all",
+        "Pending": "pending",
+        "Completed": "completed",
+        "Completed today": "completed_today",
+        "Overdue": "overdue",
+        "Due this week": "due_soon",
+        "Next up": "next_up",
+        "Projects (tree)": "tree",
+    }
+    SORT_LABELS = {
+        "Order added": "added",
+        "Oldest first": "oldest",
+        "Newest first": "newest",
+        "Due date": "due",
+        "Recently completed": "completed",
+        "Priority": "priority",
+    }
+    NO_REPEAT = "never"
+    # Tag chips shown under the filter controls, most used first
+    MAX_TAG_CHIPS = 12
+    # Tasks shown before the window opens, then loaded per event-loop turn
+    FIRST_PAGE = 200
+    LOAD_CHUNK = 5000
+    # How often the task file is checked for saves by other windows
+    SYNC_MS = 1000
+    # How often requests from the HTTP API are run against the store
+    SERVE_MS = 50
+    # Longest wait of the renewal timer, so a clock change or a suspended
+    # machine delays a repeating task by at most this long
+    RENEW_MAX_MS = 60 * 60 * 1000
+    # How often the save indicator is refreshed
+    SAVE_STATUS_MS = 500
+    SAVE_STATUS_TEXT = {
+        "saved": ("💾 All changes saved", "#27AE60"),
+        "pending": ("✏️ Unsaved changes", "#F39C12"),
+        "saving": ("⏳ Saving...", "#3498DB"),
+    }
+    
+    def __init__(self, use_sqlite=False, serve_port=None):
+        # Create main window
+        self.root = tk.Tk()
+        self.root.title("Coding Samurai - To-Do List")
+        self.root.geometry("800x600")
+        self.root.configure(bg="#F5F7FA")
+        
+        # File for saving tasks
+        self.filename = "todo_gui.json"
+        # Only the first page is read before the window opens; the rest
+        # follows in chunks from the event loop (see load_more)
+        storage = open_storage(self.filename, use_sqlite, autosave=True)
+        self.store = TodoStore(storage, progressive=True,
+                               journal=UndoJournal(storage.filename + ".undo"))
+        self.store.load_step(self.FIRST_PAGE)
+        self.tasks = self.store.tasks
+        
+        # Custom fonts
+        self.title_font = font.Font(family="Arial", size=24, weight="bold")
+        self.task_font = font.Font(family="Arial", size=12)
+        self.button_font = font.Font(family="Arial", size=11, weight="bold")
+        
+        # Setup the UI
+        self.setup_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self.exit_app)
+        self.update_save_status()
+        self.root.after(self.SYNC_MS, self.sync_tasks)
+        # One timer, aimed at the next repeating task to come back
+        self._renew_timer = None
+        self._renew_day = None
+        if self.store.loading:
+            self.root.after(1, self.load_more)
+        else:
+            self.schedule_renewal()
+        
+        # Optionally share the list over HTTP (see todo_server.py); requests
+        # are run here on the Tk thread, which owns the store
+        self.server = None
+        if serve_port is not None:
+            self.server = TaskServer(self.store, port=serve_port)
+            try:
+                self.server.start_thread()
+            except OSError as e:
+                self.server = None
+                messagebox.showwarning("Server Not Started", f"Could not serve on port {serve_port}: {e}")
+            else:
+                self.root.title(f"{self.root.title()} (serving on port {self.server.port})")
+                self.serve_requests()
+    
+    def serve_requests(self):
+        """Answer queued HTTP API requests, then check again shortly"""
+        self.server.process_pending()
+        self.root.after(self.SERVE_MS, self.serve_requests)
+        
+    def save_tasks(self):
+        """Save all tasks to storage"""
+        self.store.save()
+    
+    def setup_ui(self):
+        # Menu bar
+        menubar = tk.Menu(self.root)
+        file_menu = tk.Menu(menubar, tearoff=0)
+        file_menu.add_command(label="Import Tasks...", command=self.import_tasks)
+        file_menu.add_command(label="Export Tasks...", command=self.export_tasks)
+        file_menu.add_separator()
+        file_menu.add_command(label="Save & Exit", command=self.exit_app)
+        menubar.add_cascade(label="File", menu=file_menu)
+        self.root.config(menu=menubar)
+        
+        # Main container
+        main_frame = tk.Frame(self.root, bg="#F5F7FA")
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # Header
+        header_frame = tk.Frame(main_frame, bg="#F5F7FA")
+        header_frame.pack(fill=tk.X, pady=(0, 20))
+        
+        tk.Label(
+            header_frame,
+            text="📝 To-Do List Application",
+            font=self.title_font,
+            bg="#F5F7FA",
+            fg="#2C3E50"
+        ).pack(side=tk.LEFT)
+        
+        # Stats label
+        self.stats_label = tk.Label(
+            header_frame,
+            text="Tasks: 0 | Completed: 0",
+            font=("Arial", 11),
+            bg="#F5F7FA",
+            fg="#7F8C8D"
+        )
+        self.stats_label.pack(side=tk.RIGHT)
+        
+        # Autosave indicator
+        self.save_label = tk.Label(
+            header_frame,
+            text="",
+            font=("Arial", 10),
+            bg="#F5F7FA",
+            fg="#27AE60"
+        )
+        self.save_label.pack(side=tk.RIGHT, padx=15)
+        
+        # Input section
+        input_frame = tk.Frame(main_frame, bg="#F5F7FA")
+        input_frame.pack(fill=tk.X, pady=(0, 20))
+        
+        tk.Label(
+            input_frame,
+            text="Add New Task:",
+            font=self.button_font,
+            bg="#F5F7FA",
+            fg="#2C3E50"
+        ).pack(anchor=tk.W)
+        
+        # Task entry
+        self.task_entry = tk.Entry(
+            input_frame,
+            font=self.task_font,
+            bg="white",
+            fg="#2C3E50",
+            relief=tk.FLAT,
+            width=50
+        )
+        self.task_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
+        self.task_entry.bind("<Return>", lambda e: self.add_task())
+        self.task_entry.bind("<<Paste>>", self._on_paste)
+        
+        # Add button
+        add_btn = tk.Button(
+            input_frame,
+            text="➕ Add Task",
+            font=self.button_font,
+            bg="#27AE60",
+            fg="white",
+            activebackground="#219653",
+            activeforeground="white",
+            relief=tk.FLAT,
+            padx=20,
+            pady=8,
+            command=self.add_task
+        )
+        add_btn.pack(side=tk.RIGHT)
+        
+        # Optional due date
+        self.due_entry = tk.Entry(
+            input_frame,
+            font=self.task_font,
+            bg="white",
+            fg="#2C3E50",
+            relief=tk.FLAT,
+            width=11
+        )
+        self.due_entry.pack(side=tk.RIGHT, padx=(0, 10))
+        self.due_entry.bind("<Return>", lambda e: self.add_task())
+        tk.Label(
+            input_frame,
+            text="Due (YYYY-MM-DD):",
+            font=("Arial", 10),
+            bg="#F5F7FA",
+            fg="#7F8C8D"
+        ).pack(side=tk.RIGHT, padx=(0, 5))
+        
+        # Optional parent, to add the task as a subtask
+        self.parent_entry = tk.Entry(
+            input_frame,
+            font=self.task_font,
+            bg="white",
+            fg="#2C3E50",
+            relief=tk.FLAT,
+            width=6
+        )
+        self.parent_entry.pack(side=tk.RIGHT, padx=(0, 10))
+        self.parent_entry.bind("<Return>", lambda e: self.add_task())
+        tk.Label(
+            input_frame,
+            text="Subtask of ID:",
+            font=("Arial", 10),
+            bg="#F5F7FA",
+            fg="#7F8C8D"
+        ).pack(side=tk.RIGHT, padx=(0, 5))
+        
+        # Optional priority and repeat rule
+        self.priority_var = tk.StringVar(value=PRIORITIES[0])
+        self.repeat_var = tk.StringVar(value=self.NO_REPEAT)
+        for label, var, values in (("Repeat:", self.repeat_var, (self.NO_REPEAT,) + REPEATS),
+                                   ("Priority:", self.priority_var, PRIORITIES)):
+            ttk.Combobox(input_frame, textvariable=var, values=values, state="readonly",
+                         width=8).pack(side=tk.RIGHT, padx=(0, 10))
+            tk.Label(input_frame, text=label, font=("Arial", 10), bg="#F5F7FA",
+                     fg="#7F8C8D").pack(side=tk.RIGHT, padx=(0, 5))
+        
+        # Task list section
+        list_frame = tk.Frame(main_frame, bg="#F5F7FA")
+        list_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Filter controls
+        filter_frame = tk.Frame(list_frame, bg="#F5F7FA")
+        filter_frame.pack(fill=tk.X, pady=(0, 8))
+        
+        self.view_var = tk.StringVar(value="All tasks")
+        self.sort_var = tk.StringVar(value="Order added")
+        for label, var, values in (("Show:", self.view_var, self.VIEW_LABELS),
+                                   ("Sort:", self.sort_var, self.SORT_LABELS)):
+            tk.Label(filter_frame, text=label, font=("Arial", 10), bg="#F5F7FA",
+                     fg="#2C3E50").pack(side=tk.LEFT, padx=(0, 5))
+            combo = ttk.Combobox(filter_frame, textvariable=var, values=list(values),
+                                 state="readonly", width=17)
+            combo.pack(side=tk.LEFT, padx=(0, 15))
+            combo.bind("<<ComboboxSelected>>", lambda e: self.apply_view())
+        
+        self.range_entries = []
+        for label in ("From:", "To:"):
+            tk.Label(filter_frame, text=label, font=("Arial", 10), bg="#F5F7FA",
+                     fg="#2C3E50").pack(side=tk.LEFT, padx=(0, 5))
+            entry = tk.Entry(filter_frame, font=("Arial", 10), width=11, relief=tk.FLAT)
+            entry.pack(side=tk.LEFT, padx=(0, 10))
+            entry.bind("<Return>", lambda e: self.apply_view())
+            self.range_entries.append(entry)
+        
+        tk.Button(
+            filter_frame,
+            text="Reset",
+            font=("Arial", 10),
+            bg="#95A5A6",
+            fg="white",
+            relief=tk.FLAT,
+            padx=10,
+            command=self.reset_view
+        ).pack(side=tk.LEFT)
+        
+        # Tag filter: typed ("#work AND NOT completed") or built by clicking chips
+        tag_frame = tk.Frame(list_frame, bg="#F5F7FA")
+        tag_frame.pack(fill=tk.X, pady=(0, 8))
+        tk.Label(tag_frame, text="Tags:", font=("Arial", 10), bg="#F5F7FA",
+                 fg="#2C3E50").pack(side=tk.LEFT, padx=(0, 5))
+        self.tag_entry = tk.Entry(tag_frame, font=("Arial", 10), width=26, relief=tk.FLAT)
+        self.tag_entry.pack(side=tk.LEFT, padx=(0, 10))
+        self.tag_entry.bind("<Return>", lambda e: self.apply_view())
+        self.chip_frame = tk.Frame(tag_frame, bg="#F5F7FA")
+        self.chip_frame.pack(side=tk.LEFT, fill=tk.X)
+        self._chips_refresh = None
+        
+        # List header
+        list_header = tk.Frame(list_frame, bg="#34495E")
+        list_header.pack(fill=tk.X)
+        
+        headers = ["Status", "ID", "Task", "Created / Due", "Actions"]
+        for i, header in enumerate(headers):
+            tk.Label(
+                list_header,
+                text=header,
+                font=self.button_font,
+                bg="#34495E",
+                fg="white",
+                padx=10,
+                pady=10
+            ).grid(row=0, column=i, sticky="w")
+        
+        # Configure grid weights
+        for i in range(5):
+            list_header.grid_columnconfigure(i, weight=1)
+        
+        # Treeview for tasks
+        self.tree_frame = tk.Frame(list_frame, bg="#F5F7FA")
+        self.tree_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Virtualized list: widgets only for the rows on screen
+        self.task_list = VirtualTaskList(
+            self.tree_frame,
+            self.task_font,
+            on_complete=self.mark_complete_single,
+            on_delete=self.delete_single_task,
+            on_edit=self.edit_task,
+            on_select=lambda selected: self.update_stats(),
+            on_toggle=self.update_stats
+        )
+        self.canvas = self.task_list.canvas
+        
+        # Bind mouse wheel for scrolling
+        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+        
+        # Control buttons
+        control_frame = tk.Frame(main_frame, bg="#F5F7FA")
+        control_frame.pack(fill=tk.X, pady=(20, 0))
+        
+        buttons = [
+            ("✅ Mark Complete", "#2ECC71", self.mark_complete),
+            ("↩️ Reopen", "#F39C12", self.mark_pending),
+            ("🗑️ Delete", "#E74C3C", self.delete_task),
+            ("↶ Undo", "#34495E", self.undo),
+            ("↷ Redo", "#34495E", self.redo),
+            ("🔍 Search", "#3498DB", self.search_tasks),
+            ("🧹 Clear Completed", "#95A5A6", self.clear_completed),
+            ("🔄 Refresh", "#9B59B6", self.refresh_list),
+            ("💾 Save & Exit", "#2C3E50", self.exit_app)
+        ]
+        
+        for text, color, command in buttons:
+            btn = tk.Button(
+                control_frame,
+                text=text,
+                font=self.button_font,
+                bg=color,
+                fg="white",
+                activebackground=color,
+                activeforeground="white",
+                relief=tk.FLAT,
+                padx=15,
+                pady=8,
+                command=command
+            )
+            btn.pack(side=tk.LEFT, padx=5)
+            if command == self.undo:
+                self.undo_btn = btn
+            elif command == self.redo:
+                self.redo_btn = btn
+        
+        # Load and display initial tasks, then follow changes row by row
+        self.visible = self.tasks
+        self.outline = None  # rows of the tree view while it is shown
+        self._view_refresh = None
+        self.refresh_list()
+        self.store.subscribe(self.on_task_event)
+        self.root.bind("<Control-z>", lambda e: self.undo())
+        self.root.bind("<Control-y>", lambda e: self.redo())
+        self.root.bind("<Control-Shift-Z>", lambda e: self.redo())
+    
+    def _on_mousewheel(self, event):
+        self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+    
+    def on_task_event(self, event, index, task):
+        """Update only the rows touched by a change in the store"""
+        if self._chips_refresh is None and not self.store.loading:
+            self._chips_refresh = self.root.after_idle(self.refresh_tag_chips)
+        if self.visible is not self.tasks:
+            # A filtered view is re-queried once the current burst of changes is done
+            if event == "remove":
+                self.task_list.selected.discard(task["id"])
+            elif event == "reset":
+                self.task_list.selected &= self.store.index.keys()
+            if self._view_refresh is None:
+                self._view_refresh = self.root.after_idle(self.apply_view)
+            self.update_stats()
+            self._check_renewal()
+            return
+        if event == "update":
+            self.task_list.update_row(index)
+        elif event == "reset":
+            # Forget selected tasks that no longer exist
+            self.task_list.selected &= self.store.index.keys()
+            self.task_list.set_tasks(self.tasks)
+        else:
+            if event == "remove":
+                self.task_list.selected.discard(task["id"])
+            self.task_list.rows_changed(index)
+        self.update_stats()
+        self._check_renewal()
+    
+    def load_more(self):
+        """Load the next chunk of tasks, then yield to the event loop"""
+        if self.store.load_step(self.LOAD_CHUNK):
+            if self.visible is self.tasks:
+                self.task_list.set_tasks(self.tasks)  # grows the scroll region
+            self.update_stats()
+            self.root.after(1, self.load_more)
+        # The last step sends "reset", which redraws the list
+    
+    def _check_renewal(self):
+        """Re-aim the renewal timer if a change moved the next renewal"""
+        if not self.store.loading and self.store.next_renewal() != self._renew_day:
+            self.schedule_renewal()
+    
+    def schedule_renewal(self):
+        """Set the single timer for the earliest repeating task to come back
+
+        However many tasks repeat, only the earliest renewal has a timer;
+        renew_tasks brings back all that are due and sets the next one.
+        """
+        if self._renew_timer is not None:
+            self.root.after_cancel(self._renew_timer)
+            self._renew_timer = None
+        self._renew_day = self.store.next_renewal()
+        if self._renew_day is None:
+            return
+        start = datetime.combine(date.fromisoformat(self._renew_day), datetime.min.time())
+        wait = (start - datetime.now()) / timedelta(milliseconds=1)
+        self._renew_timer = self.root.after(int(min(max(wait, 0), self.RENEW_MAX_MS)),
+                                            self.renew_tasks)
+    
+    def renew_tasks(self):
+        """Bring back repeating tasks whose day has come"""
+        self._renew_timer = None
+        self.store.renew_repeating()
+        self.schedule_renewal()
+    
+    def sync_tasks(self):
+        """Pick up tasks saved by another window, then check again shortly"""
+        try:
+            self.store.sync()
+        except (OSError, ValueError):
+            pass  # unreadable right now (e.g. mid-copy); try again next time
+        self.root.after(self.SYNC_MS, self.sync_tasks)
+    
+    def update_save_status(self):
+        """Show whether changes are saved, then check again shortly"""
+        status = self.store.storage.status
+        text, color = self.SAVE_STATUS_TEXT[status]
+        if status == "pending" and getattr(self.store.storage, "last_error", None):
+            text, color = "⚠️ Save failed, retrying", "#E74C3C"
+        self.save_label.config(text=text, fg=color)
+        self.root.after(self.SAVE_STATUS_MS, self.update_save_status)
+    
+    def update_stats(self):
+        """Show the store's task counters"""
+        text = f"Tasks: {self.store.total} | Completed: {self.store.completed}"
+        if self.store.loading:
+            text += " | Loading..."
+        if self.visible is not self.tasks:
+            text += f" | Showing: {len(self.visible)}"
+        if self.task_list.selected:
+            text += f" | Selected: {len(self.task_list.selected)}"
+        self.stats_label.config(text=text)
+        journal = self.store.journal
+        self.undo_btn.config(state=tk.NORMAL if journal.can_undo else tk.DISABLED)
+        self.redo_btn.config(state=tk.NORMAL if journal.can_redo else tk.DISABLED)
+    
+    @staticmethod
+    def _parse_date(text, what):
+        """Return a "YYYY-MM-DD" date from an entry, None if empty
+        
+        Raises ValueError with a message for the user if it is not a date.
+        """
+        text = text.strip()
+        if not text:
+            return None
+        try:
+            return datetime.strptime(text, "%Y-%m-%d").strftime("%Y-%m-%d")
+        except ValueError:
+            raise ValueError(f"{what} must be a date like 2026-01-31")
+    
+    def add_task(self):
+        """Add a new task"""
+        task_text = self.task_entry.get().strip()
+        if not task_text:
+            messagebox.showwarning("Empty Task", "Please enter a task description!")
+            return
+        try:
+            due = self._parse_date(self.due_entry.get(), "Due date")
+        except ValueError as e:
+            messagebox.showwarning("Invalid Date", str(e))
+            return
+        parent = self.parent_entry.get().strip()
+        
+        repeat = self.repeat_var.get()
+        try:
+            new_task = self.store.add(task_text, due, PRIORITIES.index(self.priority_var.get()),
+                                      None if repeat == self.NO_REPEAT else repeat,
+                                      int(parent) if parent else None)
+        except ValueError as e:
+            messagebox.showwarning("Invalid Parent", str(e) if parent.isdigit()
+                                   else "Subtask of ID must be a task ID")
+            return
+        self.task_entry.delete(0, tk.END)
+        self.due_entry.delete(0, tk.END)
+        self.parent_entry.delete(0, tk.END)
+        self.priority_var.set(PRIORITIES[0])
+        self.repeat_var.set(self.NO_REPEAT)
+        messagebox.showinfo("Success", f"Task added successfully! (ID: {new_task['id']})")
+    
+    def _on_paste(self, event):
+        """Pasting several lines into the entry adds one task per line"""
+        try:
+            text = self.root.clipboard_get()
+        except tk.TclError:
+            return None
+        lines = [line.strip() for line in text.splitlines() if line.strip()]
+        if len(lines) < 2:
+            return None
+        if messagebox.askyesno("Bulk Add", f"Add {len(lines)} tasks from the pasted lines?"):
+            added = self.store.add_many(lines)
+            self.task_list.scroll_to(len(self.visible) - 1)
+            messagebox.showinfo("Success", f"Added {len(added)} task(s)!")
+        return "break"
+    
+    def refresh_list(self):
+        """Refresh the task list display"""
+        self.apply_view()
+    
+    def apply_view(self):
+        """Show the tasks picked by the filter controls"""
+        self._view_refresh = None
+        try:
+            start, end = (self._parse_date(e.get(), label)
+                          for e, label in zip(self.range_entries, ("From", "To")))
+        except ValueError as e:
+            messagebox.showwarning("Invalid Date", str(e))
+            return
+        name = self.VIEW_LABELS[self.view_var.get()]
+        if name == "tree":
+            # Expanded tasks stay expanded; sort, dates and tags do not apply
+            if self.outline is None:
+                self.outline = TaskOutline(self.store)
+            else:
+                self.outline.refresh()
+            self.visible = self.outline.tasks
+            self.task_list.set_tasks(self.visible, self.outline)
+            self.update_stats()
+            self.refresh_tag_chips()
+            return
+        self.outline = None
+        try:
+            self.visible = self.store.view(
+                name,
+                self.SORT_LABELS[self.sort_var.get()],
+                start, end, self.tag_entry.get().strip() or None
+            )
+        except ValueError as e:
+            messagebox.showwarning("Invalid Tag Filter", str(e))
+            return
+        self.task_list.set_tasks(self.visible)
+        self.update_stats()
+        self.refresh_tag_chips()
+    
+    def reset_view(self):
+        """Go back to all tasks in the order they were added"""
+        self.view_var.set("All tasks")
+        self.sort_var.set("Order added")
+        for entry in self.range_entries:
+            entry.delete(0, tk.END)
+        self.tag_entry.delete(0, tk.END)
+        self.apply_view()
+    
+    def refresh_tag_chips(self):
+        """Redraw the chips of the most used tags; those in the filter are lit"""
+        self._chips_refresh = None
+        if self.store.loading:
+            return  # the tag index is built in one go once every task is in
+        for chip in self.chip_frame.winfo_children():
+            chip.destroy()
+        active = set(parse_tags(self.tag_entry.get()))
+        for tag, count in self.store.tag_counts()[:self.MAX_TAG_CHIPS]:
+            lit = tag in active
+            tk.Button(
+                self.chip_frame,
+                text=f"#{tag} {count}",
+                font=("Arial", 9),
+                bg="#3498DB" if lit else "#ECF0F1",
+                fg="white" if lit else "#2C3E50",
+                relief=tk.FLAT,
+                padx=6,
+                command=lambda t=tag: self.toggle_tag(t)
+            ).pack(side=tk.LEFT, padx=(0, 4))
+    
+    def toggle_tag(self, tag):
+        """Chip click: AND the tag into the filter, or take it back out"""
+        query = self.tag_entry.get().strip()
+        chip = f"#{tag}"
+        if tag in parse_tags(query):
+            # Drop the tag along with the AND that joined it; a tag deeper
+            # inside a typed filter clears the filter instead
+            terms = query.split(" AND ")
+            kept = [t for t in terms if t.strip().lower() != chip]
+            query = " AND ".join(kept) if len(kept) < len(terms) else ""
+        else:
+            query = f"{query} AND {chip}" if query else chip
+        self.tag_entry.delete(0, tk.END)
+        self.tag_entry.insert(0, query)
+        self.apply_view()
+    
+    def edit_task(self, task_id):
+        """Edit the text of a task (double-click its text)"""
+        task = self.store.get(task_id)
+        if task is None:
+            return
+        text = simpledialog.askstring(
+            "Edit Task", "Task description:", initialvalue=task["task"], parent=self.root
+        )
+        if text and text.strip():
+            self.store.edit(task_id, text.strip())
+    
+    def show_task(self, task_id):
+        """Scroll the list to a task and highlight its row"""
+        if self.store.get(task_id) is None:
+            messagebox.showwarning("Warning", f"Task {task_id} no longer exists!")
+            return
+        if self.visible is self.tasks:
+            index = self.store.position(task_id)
+        elif self.outline is not None:
+            index = self.outline.reveal(task_id)
+            self.task_list.set_tasks(self.visible, self.outline)
+        else:
+            index = next((i for i, t in enumerate(self.visible) if t["id"] == task_id), None)
+            if index is None:
+                # Not in the current filter: show everything instead
+                self.reset_view()
+                index = self.store.position(task_id)
+        self.task_list.scroll_to(index)
+        self.task_list.highlight(task_id)
+    
+    def mark_complete_single(self, task_id):
+        """Mark a single task as complete"""
+        if self.store.complete(task_id):
+            messagebox.showinfo("Success", f"Task {task_id} marked as complete!")
+            return
+        messagebox.showwarning("Warning", f"Task {task_id} not found or already completed!")
+    
+    def delete_single_task(self, task_id):
+        """Delete a single task"""
+        if messagebox.askyesno("Confirm Delete", f"Delete task {task_id}?"):
+            if self.store.delete(task_id):
+                messagebox.showinfo("Deleted", "Task deleted successfully!")
+    
+    def _selected_ids(self, action):
+        """Selected task IDs, warning if there are none"""
+        if not self.tasks:
+            messagebox.showwarning("No Tasks", f"No tasks to {action}!")
+            return None
+        if not self.task_list.selected:
+            messagebox.showwarning(
+                "No Selection",
+                f"Select tasks to {action} first (click, Ctrl-click or Shift-click rows)!"
+            )
+            return None
+        return list(self.task_list.selected)
+    
+    def mark_complete(self):
+        """Mark selected tasks as complete"""
+        task_ids = self._selected_ids("mark as complete")
+        if task_ids:
+            self.store.set_completed_many(task_ids, True)
+    
+    def mark_pending(self):
+        """Mark selected tasks as not completed"""
+        task_ids = self._selected_ids("reopen")
+        if task_ids:
+            self.store.set_completed_many(task_ids, False)
+    
+    def delete_task(self):
+        """Delete selected tasks"""
+        task_ids = self._selected_ids("delete")
+        if task_ids and messagebox.askyesno("Confirm Delete", f"Delete {len(task_ids)} selected task(s)?"):
+            self.store.delete_many(task_ids)
+    
+    def undo(self):
+        """Revert the last change (also one made before a restart)"""
+        if self.store.undo() is None:
+            self.root.bell()
+    
+    def redo(self):
+        """Repeat the last undone change"""
+        if self.store.redo() is None:
+            self.root.bell()
+    
+    def search_tasks(self):
+        """Search for tasks"""
+        search_window = tk.Toplevel(self.root)
+        search_window.title("Search Tasks")
+        search_window.geometry("500x420")
+        search_window.configure(bg="#F5F7FA")
+        
+        tk.Label(
+            search_window,
+            text="🔍 Search Tasks",
+            font=self.title_font,
+            bg="#F5F7FA",
+            fg="#2C3E50"
+        ).pack(pady=20)
+        
+        search_entry = tk.Entry(
+            search_window,
+            font=self.task_font,
+            width=30
+        )
+        search_entry.pack(pady=10)
+        search_entry.focus_set()
+        
+        count_label = tk.Label(
+            search_window,
+            text="Type to search, click a result to show it",
+            font=("Arial", 10),
+            bg="#F5F7FA",
+            fg="#7F8C8D"
+        )
+        count_label.pack()
+        
+        result_list = tk.Listbox(
+            search_window,
+            height=10,
+            width=50,
+            font=self.task_font,
+            activestyle="none"
+        )
+        result_list.pack(pady=10, padx=10, fill=tk.BOTH, expand=True)
+        result_ids = []
+        pending = [None]
+        
+        def perform_search():
+            pending[0] = None
+            keyword = search_entry.get().strip()
+            result_list.delete(0, tk.END)
+            result_ids.clear()
+            
+            if not keyword:
+                count_label.config(text="Please enter a search keyword!")
+                return
+            
+            total, results = self.store.search(keyword, limit=self.SEARCH_LIMIT)
+            
+            if results:
+                shown = f", showing best {len(results)}" if total > len(results) else ""
+                count_label.config(text=f"Found {total} task(s){shown}")
+                for task in results:
+                    status = "Completed" if task["completed"] else "Pending"
+                    result_list.insert(tk.END, f"ID {task['id']}: {task['task']} ({status})")
+                    result_ids.append(task["id"])
+            else:
+                count_label.config(text=f"No tasks found for '{keyword}'")
+        
+        def schedule_search(event=None):
+            # Debounce: only search once typing pauses
+            if pending[0] is not None:
+                search_window.after_cancel(pending[0])
+            pending[0] = search_window.after(self.SEARCH_DELAY_MS, perform_search)
+        
+        def open_result(event=None):
+            selection = result_list.curselection()
+            if selection:
+                self.show_task(result_ids[selection[0]])
+        
+        search_entry.bind("<KeyRelease>", schedule_search)
+        result_list.bind("<<ListboxSelect>>", open_result)
+        
+        tk.Button(
+            search_window,
+            text="Search",
+            command=perform_search,
+            bg="#3498DB",
+            fg="white",
+            font=self.button_font,
+            padx=20
+        ).pack(pady=10)
+    
+    def run_with_progress(self, title, job, on_done):
+        """Run an import/export job in small steps with a progress window
+        
+        Each step handles one batch and then yields back to Tk, so the
+        window stays responsive during long jobs.
+        """
+        window = tk.Toplevel(self.root)
+        window.title(title)
+        window.geometry("380x150")
+        window.configure(bg="#F5F7FA")
+        window.transient(self.root)
+        
+        label = tk.Label(window, text=f"{title}...", font=self.task_font, bg="#F5F7FA", fg="#2C3E50")
+        label.pack(pady=(15, 5))
+        bar = ttk.Progressbar(window, length=320, maximum=100)
+        bar.pack(pady=5)
+        
+        def cancel():
+            job.cancel()
+            window.destroy()
+        
+        tk.Button(
+            window,
+            text="Cancel",
+            command=cancel,
+            bg="#95A5A6",
+            fg="white",
+            font=self.button_font,
+            padx=15
+        ).pack(pady=10)
+        window.protocol("WM_DELETE_WINDOW", cancel)
+        
+        def step():
+            if job.done:  # cancelled
+                return
+            try:
+                more = job.step()
+            except (OSError, ValueError) as e:
+                job.cancel()
+                window.destroy()
+                messagebox.showerror(title, f"{title} failed: {e}")
+                return
+            bar["value"] = job.progress * 100
+            label.config(text=f"{title}... {job.progress:.0%}")
+            if more:
+                self.root.after(1, step)
+            else:
+                window.destroy()
+                on_done(job)
+        
+        self.root.after(1, step)
+    
+    def import_tasks(self):
+        """Import tasks from a JSONL or CSV file"""
+        filename = filedialog.askopenfilename(
+            title="Import Tasks",
+            filetypes=[("Task files", "*.jsonl *.csv"), ("JSON Lines", "*.jsonl"), ("CSV", "*.csv")]
+        )
+        if not filename:
+            return
+        try:
+            job = TaskImporter(self.store, filename)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Import", f"Cannot import: {e}")
+            return
+        
+        def done(job):
+            message = f"Imported {job.imported} task(s)!"
+            if job.skipped:
+                message += f"\n\nSkipped {job.skipped} invalid record(s):\n" + "\n".join(job.errors[:5])
+            messagebox.showinfo("Import", message)
+        
+        self.run_with_progress("Importing", job, done)
+    
+    def export_tasks(self):
+        """Export all tasks to a JSONL or CSV file"""
+        filename = filedialog.asksaveasfilename(
+            title="Export Tasks",
+            defaultextension=".jsonl",
+            filetypes=[("JSON Lines", "*.jsonl"), ("CSV", "*.csv")]
+        )
+        if not filename:
+            return
+        self.store.finish_loading()  # export every task, not just those loaded
+        try:
+            job = TaskExporter(list(self.tasks), filename)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Export", f"Cannot export: {e}")
+            return
+        self.run_with_progress(
+            "Exporting", job,
+            lambda job: messagebox.showinfo("Export", f"Exported {job.written} task(s)!")
+        )
+    
+    def clear_completed(self):
+        """Clear all completed tasks"""
+        self.store.finish_loading()  # count every completed task, not just those loaded
+        completed_count = self.store.completed
+        
+        if completed_count == 0:
+            messagebox.showinfo("No Completed Tasks", "No completed tasks to clear!")
+            return
+        
+        if messagebox.askyesno("Confirm Clear", f"Clear {completed_count} completed task(s)?"):
+            self.store.clear_completed()
+            messagebox.showinfo("Cleared", f"Cleared {completed_count} completed task(s)!")
+    
+    def exit_app(self):
+        """Save and exit the application"""
+        try:
+            # Writes out any change the autosave has not flushed yet
+            self.store.close()
+        except OSError as e:
+            if not messagebox.askyesno("Save Failed", f"Could not save tasks: {e}\n\nExit anyway?"):
+                return
+        if self.server:
+            self.server.stop()
+        self.root.quit()
+    
+    def run(self):
+        """Start the application"""
+        self.root.mainloop()
+
+# Launch the application immediately
+if __name__ == "__main__":
+    # --serve or --serve=PORT also shares the list over HTTP
+    serve = next((a for a in sys.argv if a.startswith("--serve")), None)
+    port = int(serve.partition("=")[2] or DEFAULT_PORT) if serve else None
+    app = TodoListApp(use_sqlite="--sqlite" in sys.argv, serve_port=port)
     app.run()
\ No newline at end of file
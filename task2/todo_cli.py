@@ -0,0 +1,208 @@
+"""
+todo_cli.py - Command line interface to the to-do list
+Works on the same task file as the GUI, without opening a window
+
+Usage: python todo_cli.py [--file todo_gui.json] [--sqlite] COMMAND ...
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime
+
+from recurrence import PRIORITIES, REPEATS, priority_value
+from todo_storage import open_storage
+from todo_store import TodoStore
+from undo_journal import UndoJournal
+
+
+def due_date(text):
+    """argparse type for a "YYYY-MM-DD" date"""
+    try:
+        return datetime.strptime(text, "%Y-%m-%d").strftime("%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{text}' is not a date like 2026-01-31")
+
+
+def format_task(task):
+    mark = "x" if task["completed"] else " "
+    line = f"{task['id']:>6} [{mark}] {task['task']}  ({task['created_at']}"
+    if task.get("due"):
+        line += f", due {task['due']}"
+    if task.get("priority"):
+        line += f", {PRIORITIES[task['priority']]} priority"
+    if task.get("repeat"):
+        line += f", repeats {task['repeat']}"
+    if task.get("parent") is not None:
+        line += f", subtask of {task['parent']}"
+    return line + ")"
+
+
+def print_tasks(tasks, as_json, out):
+    for task in tasks:
+        if as_json:
+            out.write(json.dumps(dict(task), ensure_ascii=False) + "\n")
+        else:
+            out.write(format_task(task) + "\n")
+
+
+def print_tree(store, out):
+    """Every task, subtasks indented under their parent with their progress"""
+    stack = [(task, 0) for task in reversed(store.top_level())]
+    while stack:
+        task, depth = stack.pop()
+        line = "    " * depth + format_task(task)
+        done, total = store.progress(task["id"])
+        if total:
+            line += f"  [{done}/{total} done]"
+        out.write(line + "\n")
+        stack.extend((child, depth + 1) for child in reversed(store.subtasks(task["id"])))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="todo_cli.py", description="Manage the to-do list")
+    parser.add_argument("--file", default="todo_gui.json", help="task file (default: %(default)s)")
+    parser.add_argument("--sqlite", action="store_true", help="use the SQLite database next to the file")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    add = commands.add_parser("add", help="add a task")
+    add.add_argument("text", nargs="+", help="task description")
+    add.add_argument("--due", type=due_date, help="due date (YYYY-MM-DD)")
+    add.add_argument("--priority", type=priority_value, default=0, metavar="{" + ",".join(PRIORITIES) + "}")
+    add.add_argument("--repeat", choices=REPEATS, help="bring the task back after it is done")
+    add.add_argument("--parent", type=int, metavar="ID", help="add as a subtask of this task")
+
+    move = commands.add_parser("move", help="put a task (and its subtasks) under another")
+    move.add_argument("id", type=int, metavar="ID")
+    target = move.add_mutually_exclusive_group(required=True)
+    target.add_argument("--parent", type=int, metavar="ID", help="the new parent task")
+    target.add_argument("--top", action="store_true", help="make it a top-level task")
+
+    for name, help_text in (("complete", "mark tasks complete"),
+                            ("reopen", "mark tasks pending again"),
+                            ("delete", "delete tasks")):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument("ids", nargs="+", type=int, metavar="ID")
+
+    search = commands.add_parser("search", help="search task text")
+    search.add_argument("query", nargs="+")
+    search.add_argument("--limit", type=int, default=20, help="most results shown (default: %(default)s)")
+    search.add_argument("--json", action="store_true", help="print one JSON object per task")
+
+    commands.add_parser("clear-completed", help="remove all completed tasks")
+    commands.add_parser("undo", help="revert the last change")
+    commands.add_parser("redo", help="repeat the last undone change")
+
+    next_up = commands.add_parser("next", help="show the most urgent pending tasks")
+    next_up.add_argument("-n", type=int, default=10, help="how many (default: %(default)s)")
+    next_up.add_argument("--json", action="store_true", help="print one JSON object per task")
+
+    listing = commands.add_parser("list", help="list tasks")
+    listing.add_argument("--view", choices=TodoStore.VIEWS, default="all")
+    listing.add_argument("--sort", choices=TodoStore.SORTS, default="added")
+    listing.add_argument("--from", dest="start", type=due_date, help="first day (inclusive)")
+    listing.add_argument("--to", dest="end", type=due_date, help="last day (inclusive)")
+    listing.add_argument("--tags", metavar="FILTER", help='tag filter, e.g. "#work AND NOT completed"')
+    listing.add_argument("--json", action="store_true", help="print one JSON object per task")
+
+    commands.add_parser("tags", help="list tags with their number of tasks")
+    commands.add_parser("tree", help="show tasks with their subtasks indented")
+    return parser
+
+
+def run(store, args, out=sys.stdout):
+    """Run one parsed command against store; return the exit status"""
+    if args.command == "add":
+        try:
+            task = store.add(" ".join(args.text), args.due, args.priority, args.repeat, args.parent)
+        except ValueError as e:
+            sys.stderr.write(f"{e}\n")
+            return 1
+        out.write(f"Added task {task['id']}\n")
+        return 0
+
+    if args.command == "move":
+        try:
+            task = store.set_parent(args.id, None if args.top else args.parent)
+        except ValueError as e:
+            sys.stderr.write(f"{e}\n")
+            return 1
+        if task is None:
+            sys.stderr.write(f"No task with ID {args.id}\n")
+            return 1
+        out.write(f"Moved task {args.id}\n")
+        return 0
+
+    if args.command == "tree":
+        print_tree(store, out)
+        return 0
+
+    if args.command in ("complete", "reopen", "delete"):
+        missing = [i for i in args.ids if store.get(i) is None]
+        ids = [i for i in args.ids if i not in missing]
+        if args.command == "delete":
+            changed = store.delete_many(ids)
+            verb = "Deleted"
+        else:
+            changed = store.set_completed_many(ids, args.command == "complete")
+            verb = "Completed" if args.command == "complete" else "Reopened"
+        out.write(f"{verb} {len(changed)} task(s)\n")
+        if missing:
+            sys.stderr.write(f"No task with ID {', '.join(map(str, missing))}\n")
+            return 1
+        return 0
+
+    if args.command == "search":
+        total, tasks = store.search(" ".join(args.query), args.limit)
+        print_tasks(tasks, args.json, out)
+        if not args.json:
+            out.write(f"{total} match(es)\n")
+        return 0
+
+    if args.command == "clear-completed":
+        out.write(f"Cleared {store.clear_completed()} completed task(s)\n")
+        return 0
+
+    if args.command in ("undo", "redo"):
+        label = store.undo() if args.command == "undo" else store.redo()
+        if label is None:
+            sys.stderr.write(f"Nothing to {args.command}\n")
+            return 1
+        out.write(f"{'Undid' if args.command == 'undo' else 'Redid'}: {label}\n")
+        return 0
+
+    if args.command == "next":
+        print_tasks(store.next_up(args.n), args.json, out)
+        return 0
+
+    if args.command == "list":
+        try:
+            tasks = store.view(args.view, args.sort, args.start, args.end, args.tags)
+        except ValueError as e:
+            sys.stderr.write(f"{e}\n")
+            return 2
+        print_tasks(tasks, args.json, out)
+        return 0
+
+    if args.command == "tags":
+        for tag, count in store.tag_counts():
+            out.write(f"#{tag:<20} {count}\n")
+        return 0
+
+    raise ValueError(f"Unknown command '{args.command}'")
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    storage = open_storage(args.file, args.sqlite)
+    # The history file next to the tasks is shared with the GUI
+    store = TodoStore(storage, journal=UndoJournal(storage.filename + ".undo"))
+    try:
+        store.renew_repeating()  # as the GUI would have done by now
+        return run(store, args)
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""
+todo_client.py - Client for the to-do list HTTP API (see todo_server.py)
+Keeps a local copy of the tasks and updates it from the change log
+"""
+
+import json
+import urllib.error
+import urllib.request
+
+from todo_server import DEFAULT_PORT, MAX_PAGE_SIZE
+
+
+class TodoClient:
+    """Mirror of a served task list, synced incrementally
+
+    pull() asks for the changes since the version it last saw and only
+    downloads those; the first pull, or one after the server lost track
+    (410), pages through the whole list instead.
+    """
+
+    def __init__(self, base_url=f"http://127.0.0.1:{DEFAULT_PORT}", token=None, timeout=10):
+        self.base_url = base_url.rstrip("/")
+        self.token = token
+        self.timeout = timeout
+        self.tasks = {}        # task ID -> task dict
+        self.epoch = None
+        self.version = None
+        self._changes_etag = None
+
+    def request(self, method, path, data=None, headers=None):
+        """Send one request; return (status, headers, decoded JSON or None)"""
+        body = None if data is None else json.dumps(data).encode('utf-8')
+        request = urllib.request.Request(self.base_url + path, data=body, method=method)
+        if body is not None:
+            request.add_header("Content-Type", "application/json")
+        if self.token:
+            request.add_header("Authorization", f"Bearer {self.token}")
+        for name, value in (headers or {}).items():
+            request.add_header(name, value)
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                status, reply_headers, raw = response.status, response.headers, response.read()
+        except urllib.error.HTTPError as e:
+            status, reply_headers, raw = e.code, e.headers, e.read()
+        return status, reply_headers, json.loads(raw) if raw else None
+
+    def _check(self, status, payload, *ok):
+        if status not in ok:
+            message = payload.get("error") if isinstance(payload, dict) else None
+            raise RuntimeError(f"HTTP {status}: {message or 'unexpected response'}")
+
+    # Times fetch_all starts over when the list changes while paging
+    FETCH_ATTEMPTS = 5
+
+    def fetch_all(self):
+        """Replace the local copy with every task, a page at a time
+
+        Raises RuntimeError if the list changed under every attempt.
+        """
+        tasks, offset, seen = {}, 0, None
+        attempts = 1
+        while True:
+            status, _, page = self.request("GET", f"/tasks?offset={offset}&limit={MAX_PAGE_SIZE}")
+            self._check(status, page, 200)
+            if seen is not None and (page["epoch"], page["version"]) != seen:
+                if attempts >= self.FETCH_ATTEMPTS:
+                    raise RuntimeError("task list kept changing while paging")
+                # Changed while paging: start over, earlier pages may be stale
+                tasks, offset, seen = {}, 0, None
+                attempts += 1
+                continue
+            seen = (page["epoch"], page["version"])
+            for task in page["tasks"]:
+                tasks[task["id"]] = task
+            if page["next"] is None:
+                break
+            offset = page["next"]
+        self.epoch, self.version = seen
+        self.tasks = tasks
+        self._changes_etag = None
+        return len(tasks)
+
+    def pull(self):
+        """Bring the local copy up to date; return how many tasks changed"""
+        if self.version is None:
+            return self.fetch_all()
+        headers = {"If-None-Match": self._changes_etag} if self._changes_etag else {}
+        status, reply_headers, delta = self.request(
+            "GET", f"/changes?since={self.version}&epoch={self.epoch}", headers=headers)
+        if status == 304:
+            return 0
+        if status == 410:
+            return self.fetch_all()
+        self._check(status, delta, 200)
+        for task in delta["changed"]:
+            self.tasks[task["id"]] = task
+        for task_id in delta["deleted"]:
+            self.tasks.pop(task_id, None)
+        self.epoch, self.version = delta["epoch"], delta["version"]
+        self._changes_etag = reply_headers.get("ETag")
+        return len(delta["changed"]) + len(delta["deleted"])
+
+    def add(self, text, due=None):
+        status, _, task = self.request("POST", "/tasks", {"task": text, "due": due})
+        self._check(status, task, 201)
+        return task
+
+    def update(self, task_id, **fields):
+        """Change task, completed and/or due of a task"""
+        status, _, task = self.request("PATCH", f"/tasks/{task_id}", fields)
+        self._check(status, task, 200)
+        return task
+
+    def delete(self, task_id):
+        status, _, payload = self.request("DELETE", f"/tasks/{task_id}")
+        self._check(status, payload, 204)
@@ -0,0 +1,460 @@
+"""
+todo_server.py - HTTP/JSON sync API for the to-do list
+A small asyncio server (standard library only) in front of a TodoStore
+
+Endpoints (all JSON; lists and deltas carry the store's epoch/version):
+    GET    /tasks?offset=0&limit=100&view=all&sort=added   a page of tasks
+                            (&tags=#work AND NOT completed: tag filter)
+    GET    /tasks/<id>                                     one task
+    POST   /tasks           {"task": ..., "due": ...}      add a task
+    PATCH  /tasks/<id>      {"task", "completed", "due"}   change a task
+                            (both also take "priority" 0-3, "repeat" and
+                            "parent", the ID of the task it is under)
+    DELETE /tasks/<id>                                     delete a task and its subtasks
+    GET    /search?q=...&limit=20                          search task text
+    GET    /tags                                           tags and task counts
+    GET    /changes?since=<version>&epoch=<epoch>          what changed since
+
+Responses carry an ETag; send it back in If-None-Match to get 304 when
+nothing changed, or in If-Match on PATCH/DELETE to get 412 if the task
+was changed by someone else meanwhile.
+
+Usage: python todo_server.py [--file todo_gui.json] [--sqlite]
+           [--host 127.0.0.1] [--port 8765] [--token SECRET]
+"""
+
+import argparse
+import asyncio
+import json
+import queue
+import threading
+import zlib
+from datetime import datetime
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+from recurrence import PRIORITIES, check_repeat
+from todo_storage import open_storage
+from todo_store import TodoStore
+
+DEFAULT_PORT = 8765
+PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+# Larger deltas are refused with 410; the client pages through /tasks instead
+MAX_DELTA = 5000
+MAX_BODY = 1 << 20
+# How often a standalone server checks the task file for saves by the GUI
+SYNC_SECONDS = 1.0
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def task_etag(task):
+    """ETag of one task, from its content"""
+    data = json.dumps(dict(task), sort_keys=True).encode('utf-8')
+    return f'"{zlib.crc32(data):08x}"'
+
+
+def check_date(value):
+    if value is not None:
+        try:
+            datetime.strptime(value, "%Y-%m-%d")
+        except (TypeError, ValueError):
+            raise HttpError(400, "due must be a date like 2026-01-31 or null")
+    return value
+
+
+def check_schedule(data):
+    """(priority, repeat) from a request body, defaulting to 0 and None"""
+    priority = data.get("priority", 0)
+    if type(priority) is not int or not 0 <= priority < len(PRIORITIES):
+        raise HttpError(400, f"priority must be 0-{len(PRIORITIES) - 1}")
+    try:
+        repeat = check_repeat(data.get("repeat"))
+    except ValueError as e:
+        raise HttpError(400, str(e))
+    return priority, repeat
+
+
+def check_parent(store, task_id, data):
+    """The parent ID from a request body (None if absent), checked against the store"""
+    parent = data.get("parent")
+    if parent is not None and type(parent) is not int:
+        raise HttpError(400, "parent must be a task ID or null")
+    try:
+        store.check_parent(task_id, parent)
+    except ValueError as e:
+        raise HttpError(400, str(e))
+    return parent
+
+
+class TaskServer:
+    """Serves a TodoStore over HTTP
+
+    With inline=True (the default, for a standalone server) requests use
+    the store directly on the event loop's thread. An app that owns the
+    store on another thread (the Tk window) starts the server with
+    start_thread() and calls process_pending() from its own thread, which
+    runs the queued requests there.
+    """
+
+    def __init__(self, store, host="127.0.0.1", port=DEFAULT_PORT, token=None, inline=True):
+        self.store = store
+        self.host = host
+        self.port = port
+        self.token = token
+        self.inline = inline
+        self._queue = queue.Queue()
+        self._loop = None
+        self._server = None
+        self._thread = None
+
+    # ---- running --------------------------------------------------------
+
+    async def start(self):
+        """Start listening (self.port is updated if it was 0)"""
+        self._loop = asyncio.get_running_loop()
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        await self.start()
+        poll = asyncio.create_task(self._sync_forever())
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        finally:
+            poll.cancel()
+
+    async def _sync_forever(self):
+        """Pick up tasks saved by other instances (the GUI, the CLI)
+
+        Repeating tasks due to come back are renewed on the same beat.
+        """
+        while True:
+            await asyncio.sleep(SYNC_SECONDS)
+            try:
+                self.store.sync()
+                self.store.renew_repeating()
+            except (OSError, ValueError):
+                pass  # unreadable right now; try again next time
+
+    def start_thread(self):
+        """Serve from a background thread; returns once the port is open"""
+        self.inline = False
+        ready = threading.Event()
+        failure = []
+
+        def run():
+            loop = asyncio.new_event_loop()
+            try:
+                loop.run_until_complete(self.start())
+            except OSError as e:
+                failure.append(e)
+                ready.set()
+                return
+            ready.set()
+            loop.run_forever()
+            loop.close()
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        ready.wait()
+        if failure:
+            raise failure[0]
+
+    def stop(self):
+        """Stop a server started with start_thread()"""
+        if self._thread is None:
+            return
+
+        def shutdown():
+            self._server.close()
+            self._loop.stop()
+        self._loop.call_soon_threadsafe(shutdown)
+        self._thread.join()
+        self._thread = None
+
+    def process_pending(self):
+        """Run queued requests against the store on the calling thread"""
+        while True:
+            try:
+                call, future = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                result, error = call(), None
+            except Exception as e:
+                result, error = None, e
+            self._loop.call_soon_threadsafe(self._settle, future, result, error)
+
+    @staticmethod
+    def _settle(future, result, error):
+        if future.cancelled():
+            return
+        if error is None:
+            future.set_result(result)
+        else:
+            future.set_exception(error)
+
+    async def _call(self, call):
+        """Run call() where the store lives and return its result"""
+        if self.inline:
+            return call()
+        future = self._loop.create_future()
+        self._queue.put((call, future))
+        return await future
+
+    # ---- HTTP -----------------------------------------------------------
+
+    async def _handle(self, reader, writer):
+        """Serve requests on one connection (HTTP/1.1 keep-alive)"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    writer.write(self._response(400, {}, {"error": "bad request line"}, False))
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode('latin-1').partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = (version == "HTTP/1.1"
+                              and headers.get("connection", "").lower() != "close")
+                length = int(headers.get("content-length") or 0)
+                if length > MAX_BODY:
+                    writer.write(self._response(413, {}, {"error": "body too large"}, False))
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                try:
+                    status, extra, payload = await self._call(
+                        lambda: self._route(method, target, headers, body))
+                except HttpError as e:
+                    status, extra, payload = e.status, {}, {"error": str(e)}
+                except Exception as e:
+                    status, extra, payload = 500, {}, {"error": f"internal error: {e}"}
+                writer.write(self._response(status, extra, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _response(status, headers, payload, keep_alive):
+        body = b"" if payload is None else json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        lines = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}"]
+        if payload is not None:
+            lines.append("Content-Type: application/json; charset=utf-8")
+        lines.append(f"Content-Length: {len(body)}")
+        lines.append("Connection: " + ("keep-alive" if keep_alive else "close"))
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        return ("\r\n".join(lines) + "\r\n\r\n").encode('latin-1') + body
+
+    # ---- routes (run where the store lives) -----------------------------
+
+    def _route(self, method, target, headers, body):
+        if self.token and headers.get("authorization") != f"Bearer {self.token}":
+            raise HttpError(401, "missing or wrong token")
+        url = urlsplit(target)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        parts = [p for p in url.path.split("/") if p]
+
+        if parts == ["tasks"]:
+            if method == "GET":
+                return self._list(query, headers)
+            if method == "POST":
+                return self._add(self._json(body))
+        elif len(parts) == 2 and parts[0] == "tasks":
+            try:
+                task_id = int(parts[1])
+            except ValueError:
+                raise HttpError(404, "no such task")
+            if method == "GET":
+                return self._get(task_id, headers)
+            if method == "PATCH":
+                return self._patch(task_id, self._json(body), headers)
+            if method == "DELETE":
+                return self._delete(task_id, headers)
+        elif parts == ["search"] and method == "GET":
+            return self._search(query)
+        elif parts == ["changes"] and method == "GET":
+            return self._changes(query, headers)
+        elif parts == ["tags"] and method == "GET":
+            return self._tags(headers)
+        else:
+            raise HttpError(404, "not found")
+        raise HttpError(405, f"{method} not allowed here")
+
+    @staticmethod
+    def _json(body):
+        try:
+            data = json.loads(body or b"{}")
+        except ValueError:
+            raise HttpError(400, "body is not valid JSON")
+        if not isinstance(data, dict):
+            raise HttpError(400, "body must be a JSON object")
+        return data
+
+    @staticmethod
+    def _int(query, name, default, low=0, high=None):
+        try:
+            value = int(query.get(name, default))
+        except ValueError:
+            raise HttpError(400, f"{name} must be a number")
+        if value < low or (high is not None and value > high):
+            raise HttpError(400, f"{name} out of range")
+        return value
+
+    def _version_tag(self):
+        return f'"{self.store.changes.epoch}-{self.store.changes.version}"'
+
+    def _stamp(self, payload):
+        payload["epoch"] = self.store.changes.epoch
+        payload["version"] = self.store.changes.version
+        return payload
+
+    def _list(self, query, headers):
+        etag = self._version_tag()
+        if headers.get("if-none-match") == etag:
+            return 304, {"ETag": etag}, None
+        view = query.get("view", "all")
+        sort = query.get("sort", "added")
+        if view not in TodoStore.VIEWS or sort not in TodoStore.SORTS:
+            raise HttpError(400, "unknown view or sort")
+        offset = self._int(query, "offset", 0)
+        limit = self._int(query, "limit", PAGE_SIZE, 1, MAX_PAGE_SIZE)
+        try:
+            tasks = self.store.view(view, sort, tags=query.get("tags"))
+        except ValueError as e:
+            raise HttpError(400, str(e))
+        page = [dict(t) for t in tasks[offset:offset + limit]]
+        more = offset + limit < len(tasks)
+        return 200, {"ETag": etag}, self._stamp({
+            "total": len(tasks), "offset": offset, "limit": limit,
+            "next": offset + limit if more else None, "tasks": page
+        })
+
+    def _task(self, task_id):
+        task = self.store.get(task_id)
+        if task is None:
+            raise HttpError(404, "no such task")
+        return task
+
+    def _check_match(self, task, headers):
+        expected = headers.get("if-match")
+        if expected and expected != "*" and expected != task_etag(task):
+            raise HttpError(412, "task was changed since it was read")
+
+    def _get(self, task_id, headers):
+        task = self._task(task_id)
+        etag = task_etag(task)
+        if headers.get("if-none-match") == etag:
+            return 304, {"ETag": etag}, None
+        return 200, {"ETag": etag}, dict(task)
+
+    def _add(self, data):
+        text = data.get("task")
+        if not isinstance(text, str) or not text.strip():
+            raise HttpError(400, "task text is required")
+        task = self.store.add(text.strip(), check_date(data.get("due")), *check_schedule(data),
+                              check_parent(self.store, None, data))
+        return 201, {"ETag": task_etag(task), "Location": f"/tasks/{task.id}"}, dict(task)
+
+    def _patch(self, task_id, data, headers):
+        task = self._task(task_id)
+        self._check_match(task, headers)
+        if "task" in data:
+            text = data["task"]
+            if not isinstance(text, str) or not text.strip():
+                raise HttpError(400, "task text cannot be empty")
+        if "completed" in data and not isinstance(data["completed"], bool):
+            raise HttpError(400, "completed must be true or false")
+        due = check_date(data.get("due"))
+        priority, repeat = check_schedule(data)
+        parent = check_parent(self.store, task_id, data)
+
+        values = {"task": data["task"].strip() if "task" in data else None, "due": due,
+                  "priority": priority, "repeat": repeat, "parent": parent,
+                  "completed": data.get("completed")}
+        self.store.update(task_id, {k: v for k, v in values.items() if k in data})
+        return 200, {"ETag": task_etag(task)}, dict(task)
+
+    def _delete(self, task_id, headers):
+        self._check_match(self._task(task_id), headers)
+        self.store.delete(task_id)
+        return 204, {}, None
+
+    def _search(self, query):
+        text = query.get("q", "")
+        limit = self._int(query, "limit", 20, 1, MAX_PAGE_SIZE)
+        total, tasks = self.store.search(text, limit)
+        return 200, {}, self._stamp({"total": total, "tasks": [dict(t) for t in tasks]})
+
+    def _tags(self, headers):
+        etag = self._version_tag()
+        if headers.get("if-none-match") == etag:
+            return 304, {"ETag": etag}, None
+        tags = [{"tag": tag, "count": count} for tag, count in self.store.tag_counts()]
+        return 200, {"ETag": etag}, self._stamp({"tags": tags})
+
+    def _changes(self, query, headers):
+        changes = self.store.changes
+        etag = self._version_tag()
+        if headers.get("if-none-match") == etag:
+            return 304, {"ETag": etag}, None
+        since = self._int(query, "since", 0)
+        ids = None
+        if query.get("epoch", changes.epoch) == changes.epoch:
+            ids = changes.since(since)
+        if ids is None or len(ids) > MAX_DELTA:
+            # Too old, from before a restart, or too big: start over from /tasks
+            raise HttpError(410, "changes not available; fetch /tasks again")
+        changed, deleted = [], []
+        for task_id in ids:
+            task = self.store.get(task_id)
+            if task is None:
+                deleted.append(task_id)
+            else:
+                changed.append(dict(task))
+        return 200, {"ETag": etag}, self._stamp({"changed": changed, "deleted": deleted})
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the to-do list over HTTP")
+    parser.add_argument("--file", default="todo_gui.json", help="task file (default: %(default)s)")
+    parser.add_argument("--sqlite", action="store_true", help="use the SQLite database next to the file")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="address to listen on; 0.0.0.0 for the LAN (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--token", help="require 'Authorization: Bearer TOKEN'")
+    args = parser.parse_args(argv)
+
+    store = TodoStore(open_storage(args.file, args.sqlite, autosave=True))
+    server = TaskServer(store, args.host, args.port, args.token)
+    print(f"Serving {args.file} on http://{args.host}:{args.port}/tasks")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
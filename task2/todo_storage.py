@@ -0,0 +1,726 @@
+"""
+todo_storage.py - Storage backends for the to-do list
+Tasks can be kept in the original JSON file or in an SQLite database
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from task_record import Task
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileChangedError(OSError):
+    """The task file was saved by another instance since it was last read"""
+
+
+@contextmanager
+def file_lock(filename):
+    """Hold an advisory lock on filename + ".lock" while writing
+
+    Other instances using the same file wait for the lock, so a check that
+    the file is unchanged and the write that follows happen as one step.
+    """
+    with open(filename + ".lock", 'a+b') as lock:
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        else:
+            lock.seek(0)
+            msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+            else:
+                lock.seek(0)
+                msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def write_json_atomic(filename, data):
+    """Write JSON to a temp file, fsync it and rename it over filename
+
+    A crash mid-write leaves the old file intact instead of a truncated one.
+    """
+    tmp = filename + ".tmp"
+    with open(tmp, 'w') as file:
+        json.dump(data, file, indent=2, default=dict)  # Task records are mappings
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp, filename)
+
+
+class JsonTaskStorage:
+    """Stores every task in one JSON file, rewritten on each change
+
+    The file holds {"generation": ..., "next_id": ..., "tasks": [...]};
+    files holding just the task list (the original format) are still read.
+
+    Several instances can share the file. Each write bumps the generation
+    and happens under file_lock, and raises FileChangedError instead of
+    overwriting a file another instance saved since this one read it.
+    changed_on_disk() is a cheap check (file size and mtime, then the
+    generation at the top of the file) for polling; the store then merges
+    reload() with pending_changes(), the IDs changed here but not saved.
+    """
+
+    # Writes happen before each call returns
+    status = "saved"
+
+    GENERATION_RE = re.compile(rb'"generation":\s*(\d+)')
+
+    def __init__(self, filename="todo_gui.json"):
+        self.filename = filename
+        self.next_id = None
+        self.generation = 0
+        self._seen = None          # _stat() of the file as last read or written
+        self._io_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._pending = {}         # task ID -> (kind, change number)
+        self._changed = 0          # number of the latest change
+
+    def _stat(self):
+        try:
+            st = os.stat(self.filename)
+        except FileNotFoundError:
+            return None
+        # Saves replace the file, so the inode changes even when the
+        # size does and the mtime is too coarse to tell
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def _read(self):
+        """Parse the file and return its tasks; errors are raised"""
+        with self._io_lock:
+            seen = self._stat()
+            with open(self.filename, 'r') as file:
+                data = json.load(file)
+            if isinstance(data, dict):
+                self.next_id = data.get("next_id")
+                self.generation = data.get("generation", 0)
+                tasks = data.get("tasks", [])
+            else:
+                self.generation = 0
+                tasks = data
+            self._seen = seen
+            return tasks
+
+    def load(self):
+        """Load all tasks; the saved ID counter is left in self.next_id"""
+        if os.path.exists(self.filename):
+            try:
+                return self._read()
+            except:
+                # Unreadable: start empty and let the next save replace it
+                self._seen = self._stat()
+                return []
+        return []
+
+    def reload(self):
+        """Read the tasks again after changed_on_disk() returned True"""
+        return self._read()
+
+    _SPACE_RE = re.compile(r"\s*")
+    _AFTER_ITEM_RE = re.compile(r"\s*([,\]])\s*")
+
+    def iter_load(self):
+        """Yield the tasks one at a time, for showing the first ones early
+
+        The file is read in one go but decoded task by task. next_id and
+        the generation are set as they are met (before the tasks in files
+        this class wrote). Raises ValueError if the file is not valid.
+        """
+        with self._io_lock:
+            seen = self._stat()
+            if seen is None:
+                return
+            with open(self.filename, 'r') as file:
+                text = file.read()
+            self._seen = seen
+        decode = json.JSONDecoder().raw_decode
+        space = self._SPACE_RE
+
+        def skip(pos, expected=None):
+            pos = space.match(text, pos).end()
+            if expected is not None:
+                if text[pos:pos + 1] not in expected:
+                    raise ValueError(f"expected {expected!r} at {pos}")
+                pos += 1
+            return space.match(text, pos).end()
+
+        def items(pos):
+            """Yield the elements of the array starting at pos; then its end"""
+            pos = skip(pos, "[")
+            if text[pos:pos + 1] == "]":
+                return pos + 1
+            after = self._AFTER_ITEM_RE.match
+            while True:
+                task, pos = decode(text, pos)
+                yield task
+                match = after(text, pos)
+                if match is None:
+                    raise ValueError(f"expected ',' or ']' at {pos}")
+                pos = match.end()
+                if match.group(1) == "]":
+                    return pos
+
+        pos = skip(0)
+        self.generation = 0
+        if text[pos:pos + 1] == "[":
+            yield from items(pos)  # original format: just the task list
+            return
+        pos = skip(pos, "{")
+        while text[pos:pos + 1] != "}":
+            key, pos = decode(text, pos)
+            pos = skip(pos, ":")
+            if key == "tasks":
+                pos = yield from items(pos)
+            else:
+                value, pos = decode(text, pos)
+                if key == "next_id":
+                    self.next_id = value
+                elif key == "generation":
+                    self.generation = value
+            pos = skip(pos)
+            if text[pos:pos + 1] == ",":
+                pos = skip(pos + 1)
+            elif text[pos:pos + 1] != "}":
+                raise ValueError(f"expected ',' or '}}' at {pos}")
+
+    def _changed_on_disk(self):
+        stat = self._stat()
+        if stat is None or stat == self._seen:
+            return False  # a deleted file is simply written again
+        try:
+            with open(self.filename, 'rb') as file:
+                match = self.GENERATION_RE.search(file.read(64))
+        except OSError:
+            return True
+        if match and int(match.group(1)) == self.generation:
+            self._seen = stat  # touched or copied, but not saved by anyone
+            return False
+        return True
+
+    def changed_on_disk(self):
+        """True if another instance has saved the file since it was read"""
+        if not self._io_lock.acquire(blocking=False):
+            return False  # a save of ours is in progress; look again later
+        try:
+            return self._changed_on_disk()
+        finally:
+            self._io_lock.release()
+
+    def _track(self, kind, task_ids):
+        """Remember task IDs changed here until they are written"""
+        with self._pending_lock:
+            self._changed += 1
+            for task_id in task_ids:
+                previous = self._pending.get(task_id)
+                if previous and previous[0] == "insert":
+                    if kind == "delete":
+                        del self._pending[task_id]  # never reached the file
+                    else:
+                        self._pending[task_id] = ("insert", self._changed)
+                else:
+                    self._pending[task_id] = (kind, self._changed)
+            return self._changed
+
+    def pending_changes(self):
+        """{task ID: "insert", "update" or "delete"} for unsaved changes"""
+        with self._pending_lock:
+            return {task_id: kind for task_id, (kind, _) in self._pending.items()}
+
+    def renumber(self, old_id, new_id):
+        """Move an unsaved insert to a new ID (after an ID clash in a merge)"""
+        with self._pending_lock:
+            entry = self._pending.pop(old_id, None)
+            if entry:
+                self._pending[new_id] = entry
+
+    def _save(self, tasks, next_id, upto):
+        """Write tasks unless another instance saved first
+
+        Pending changes numbered up to upto are then forgotten.
+        """
+        with self._io_lock, file_lock(self.filename):
+            if self._changed_on_disk():
+                raise FileChangedError(f"{self.filename} was saved by another instance")
+            generation = self.generation + 1
+            write_json_atomic(self.filename, {
+                "generation": generation, "next_id": next_id, "tasks": tasks
+            })
+            self.generation = generation
+            self._seen = self._stat()
+            with self._pending_lock:
+                self._pending = {i: e for i, e in self._pending.items() if e[1] > upto}
+
+    def replace_all(self, tasks, next_id=None):
+        """Write the full task list"""
+        if next_id is not None:
+            self.next_id = next_id
+        self._save(tasks, self.next_id, self._changed)
+
+    def save_merged(self, tasks, index, next_id=None):
+        """Write the pending changes after a merge (the whole file, as always)"""
+        self.replace_all(tasks, next_id)
+
+    # The JSON file can only be rewritten as a whole, so every change
+    # falls back to replace_all with the current task list.
+    def insert(self, task, tasks, next_id=None):
+        self._track("insert", [task["id"]])
+        self.replace_all(tasks, next_id)
+
+    def insert_many(self, new_tasks, tasks, next_id=None):
+        self._track("insert", [t["id"] for t in new_tasks])
+        self.replace_all(tasks, next_id)
+
+    def update(self, task, tasks):
+        self._track("update", [task["id"]])
+        self.replace_all(tasks)
+
+    def update_many(self, changed, tasks):
+        self._track("update", [t["id"] for t in changed])
+        self.replace_all(tasks)
+
+    def delete(self, task_ids, tasks):
+        self._track("delete", task_ids)
+        self.replace_all(tasks)
+
+    def close(self):
+        pass
+
+
+class AutosaveJsonStorage(JsonTaskStorage):
+    """JSON storage that coalesces changes into background writes
+
+    Changes only mark the file dirty. A writer thread saves once no change
+    has come in for QUIET_SECONDS, or MAX_DELAY_SECONDS after the first
+    unsaved change, so a burst of edits costs one write. replace_all and
+    close write synchronously; status is "saved", "pending" or "saving".
+
+    If another instance saved the file first, the writer stops with
+    conflict set until the store merges the file (reload) and saves again.
+    """
+
+    QUIET_SECONDS = 1.0
+    MAX_DELAY_SECONDS = 5.0
+
+    def __init__(self, filename="todo_gui.json", quiet=None, max_delay=None):
+        super().__init__(filename)
+        self.quiet = self.QUIET_SECONDS if quiet is None else quiet
+        self.max_delay = self.MAX_DELAY_SECONDS if max_delay is None else max_delay
+        self.last_error = None
+        self.conflict = False
+        self._cond = threading.Condition()
+        self._tasks = None
+        self._generation = 0   # autosave generation of the latest change
+        self._saved = 0        # autosave generation written to disk
+        self._first_change = None
+        self._last_change = None
+        self._saving = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    @property
+    def status(self):
+        with self._cond:
+            if self._saving:
+                return "saving"
+            return "pending" if self._generation != self._saved else "saved"
+
+    def _mark_dirty(self, tasks, next_id=None):
+        now = time.monotonic()
+        with self._cond:
+            if next_id is not None:
+                self.next_id = next_id
+            self._tasks = tasks
+            self._generation += 1
+            self._last_change = now
+            if self._first_change is None:
+                self._first_change = now
+            self._cond.notify_all()
+
+    def insert(self, task, tasks, next_id=None):
+        self._track("insert", [task["id"]])
+        self._mark_dirty(tasks, next_id)
+
+    def insert_many(self, new_tasks, tasks, next_id=None):
+        self._track("insert", [t["id"] for t in new_tasks])
+        self._mark_dirty(tasks, next_id)
+
+    def update(self, task, tasks):
+        self._track("update", [task["id"]])
+        self._mark_dirty(tasks)
+
+    def update_many(self, changed, tasks):
+        self._track("update", [t["id"] for t in changed])
+        self._mark_dirty(tasks)
+
+    def delete(self, task_ids, tasks):
+        self._track("delete", task_ids)
+        self._mark_dirty(tasks)
+
+    def reload(self):
+        """Read the tasks again and let the writer resume after a conflict"""
+        tasks = self._read()
+        with self._cond:
+            self.conflict = False
+            self._cond.notify_all()
+        return tasks
+
+    def _take_job(self):
+        """Claim the pending change for writing (call with the lock held)
+
+        Returns the autosave generation, the change number the write
+        covers (for forgetting pending changes), the tasks and next_id.
+        """
+        self._saving = True
+        self._first_change = None
+        with self._pending_lock:
+            upto = self._changed
+        return self._generation, upto, self._tasks, self.next_id
+
+    def _write(self, tasks, next_id, upto):
+        # Copy the list and each task so the Tk thread can keep editing
+        snapshot = [Task.from_dict(t) for t in list(tasks)]
+        self._save(snapshot, next_id, upto)
+
+    def _finish_job(self, generation, error):
+        with self._cond:
+            self._saving = False
+            if error is None:
+                self._saved = max(self._saved, generation)
+                self.last_error = None
+            elif isinstance(error, FileChangedError):
+                # Wait for the store to merge the other instance's changes
+                self.conflict = True
+            else:
+                # Keep the change pending and retry after the next delay
+                self.last_error = error
+                if self._first_change is None:
+                    self._first_change = time.monotonic()
+            self._cond.notify_all()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        return
+                    if self._saving or self._generation == self._saved or self.conflict:
+                        self._cond.wait()
+                        continue
+                    now = time.monotonic()
+                    due = min(self._last_change + self.quiet,
+                              (self._first_change or now) + self.max_delay)
+                    if now < due:
+                        self._cond.wait(due - now)
+                        continue
+                    generation, upto, tasks, next_id = self._take_job()
+                    break
+            error = None
+            try:
+                self._write(tasks, next_id, upto)
+            except OSError as e:
+                error = e
+            self._finish_job(generation, error)
+
+    def flush(self):
+        """Write any pending change now, on the calling thread"""
+        with self._cond:
+            while self._saving:
+                self._cond.wait()
+            if self._generation == self._saved or self._tasks is None:
+                return
+            generation, upto, tasks, next_id = self._take_job()
+        error = None
+        try:
+            self._write(tasks, next_id, upto)
+        except OSError as e:
+            error = e
+        self._finish_job(generation, error)
+        if error is not None:
+            raise error
+
+    def replace_all(self, tasks, next_id=None):
+        """Write the full task list now"""
+        self._mark_dirty(tasks, next_id)
+        self.flush()
+
+    def close(self):
+        """Flush pending changes and stop the writer thread"""
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+
+class SqliteTaskStorage:
+    """Stores tasks in an SQLite table, one transaction per change
+
+    Changes are written row by row. Several instances can share the
+    database: each write takes the write lock first and raises
+    FileChangedError instead of writing if another connection committed
+    since this one loaded (PRAGMA data_version), or if the lock stays
+    taken for BUSY_TIMEOUT seconds. The refused change is kept in
+    pending_changes() for the store to merge, and save_merged() then
+    writes just those rows.
+    """
+
+    # Every change is committed before the call returns
+    status = "saved"
+
+    # Seconds a write waits for another connection's write lock
+    BUSY_TIMEOUT = 5.0
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY,
+            task TEXT NOT NULL,
+            completed INTEGER NOT NULL DEFAULT 0,
+            created_at TEXT NOT NULL,
+            completed_at TEXT,
+            due TEXT,
+            priority INTEGER NOT NULL DEFAULT 0,
+            repeat TEXT,
+            parent INTEGER
+        );
+        CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(completed);
+        CREATE INDEX IF NOT EXISTS idx_tasks_created ON tasks(created_at);
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value INTEGER
+        );
+    """
+
+    def __init__(self, filename="todo_gui.db"):
+        self.filename = filename
+        self.next_id = None
+        self.conn = sqlite3.connect(filename, timeout=self.BUSY_TIMEOUT)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self.SCHEMA)
+        self._upgrade()
+        self._data_version = self._version()
+        self._pending = {}  # task ID -> kind, for writes refused by _writing
+
+    def _upgrade(self):
+        """Add columns that databases from older versions lack"""
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(tasks)")}
+        with self.conn:
+            if "due" not in columns:
+                self.conn.execute("ALTER TABLE tasks ADD COLUMN due TEXT")
+            if "priority" not in columns:
+                self.conn.execute("ALTER TABLE tasks ADD COLUMN priority INTEGER NOT NULL DEFAULT 0")
+                self.conn.execute("ALTER TABLE tasks ADD COLUMN repeat TEXT")
+            if "parent" not in columns:
+                self.conn.execute("ALTER TABLE tasks ADD COLUMN parent INTEGER")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_due ON tasks(due)")
+
+    @staticmethod
+    def _row(task):
+        return (task["id"], task["task"], int(task["completed"]),
+                task["created_at"], task["completed_at"], task.get("due"),
+                task.get("priority") or 0, task.get("repeat"), task.get("parent"))
+
+    def _set_next_id(self, next_id):
+        if next_id is not None:
+            self.next_id = next_id
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('next_id', ?)", (next_id,)
+            )
+
+    def load(self):
+        """Load all tasks in ID order; the saved ID counter is left in self.next_id"""
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'next_id'").fetchone()
+        self.next_id = row[0] if row else None
+        rows = self.conn.execute(
+            "SELECT id, task, completed, created_at, completed_at, due, priority, repeat, parent"
+            " FROM tasks ORDER BY id"
+        )
+        tasks = [Task(r[0], r[1], bool(r[2]), r[3], r[4], r[5], r[6], r[7], r[8]) for r in rows]
+        self._data_version = self._version()
+        return tasks
+
+    def _version(self):
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def changed_on_disk(self):
+        """True if another connection has committed since the last load
+
+        Also true while refused changes wait to be merged and saved.
+        """
+        return bool(self._pending) or self._version() != self._data_version
+
+    def reload(self):
+        return self.load()
+
+    def iter_load(self):
+        """Yield the tasks in ID order one at a time"""
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'next_id'").fetchone()
+        self.next_id = row[0] if row else None
+        self._data_version = self._version()
+        rows = self.conn.execute(
+            "SELECT id, task, completed, created_at, completed_at, due, priority, repeat, parent"
+            " FROM tasks ORDER BY id"
+        )
+        for r in rows:
+            yield Task(r[0], r[1], bool(r[2]), r[3], r[4], r[5], r[6], r[7], r[8])
+
+    def _track(self, kind, task_ids):
+        for task_id in task_ids:
+            if self._pending.get(task_id) == "insert":
+                if kind == "delete":
+                    del self._pending[task_id]  # never reached the database
+            else:
+                self._pending[task_id] = kind
+
+    @contextmanager
+    def _writing(self, kind=None, task_ids=()):
+        """Transaction holding the write lock, refused if another connection committed"""
+        with self.conn:
+            try:
+                self.conn.execute("BEGIN IMMEDIATE")
+            except sqlite3.OperationalError as e:
+                # Locked by another connection for longer than BUSY_TIMEOUT
+                refused = f"{self.filename} is busy: {e}"
+            else:
+                refused = None
+                if self._version() != self._data_version:
+                    refused = f"{self.filename} was changed by another instance"
+            if refused is not None:
+                if kind is not None:
+                    self._track(kind, task_ids)
+                raise FileChangedError(refused)
+            yield
+
+    def pending_changes(self):
+        """{task ID: "insert", "update" or "delete"} for refused changes"""
+        return dict(self._pending)
+
+    def renumber(self, old_id, new_id):
+        """Move an unsaved insert to a new ID (after an ID clash in a merge)"""
+        kind = self._pending.pop(old_id, None)
+        if kind:
+            self._pending[new_id] = kind
+
+    def save_merged(self, tasks, index, next_id=None):
+        """Write the refused changes after the store merged them in
+
+        Only the pending rows are written (index is the store's ID ->
+        task mapping), so a conflict costs the changes made here, not
+        the size of the table.
+        """
+        upserts, deletes = [], []
+        for task_id, kind in self._pending.items():
+            task = index.get(task_id)
+            if kind == "delete" or task is None:
+                deletes.append((task_id,))
+            else:
+                upserts.append(self._row(task))
+        with self._writing():
+            self.conn.executemany("DELETE FROM tasks WHERE id = ?", deletes)
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", upserts
+            )
+            self._set_next_id(next_id)
+        self._pending.clear()
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+    def insert(self, task, tasks=None, next_id=None):
+        """Insert one task"""
+        with self._writing("insert", [task["id"]]):
+            self.conn.execute("INSERT INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", self._row(task))
+            self._set_next_id(next_id)
+
+    def insert_many(self, new_tasks, tasks=None, next_id=None):
+        """Insert several tasks in one transaction"""
+        with self._writing("insert", [t["id"] for t in new_tasks]):
+            self.conn.executemany(
+                "INSERT INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", (self._row(t) for t in new_tasks)
+            )
+            self._set_next_id(next_id)
+
+    def update(self, task, tasks=None):
+        """Update one task"""
+        self.update_many([task])
+
+    def update_many(self, changed, tasks=None):
+        """Update several tasks in one transaction"""
+        with self._writing("update", [t["id"] for t in changed]):
+            self.conn.executemany(
+                "UPDATE tasks SET task = ?, completed = ?, completed_at = ?, due = ?,"
+                " priority = ?, repeat = ?, parent = ? WHERE id = ?",
+                ((t["task"], int(t["completed"]), t["completed_at"], t.get("due"),
+                  t.get("priority") or 0, t.get("repeat"), t.get("parent"), t["id"])
+                 for t in changed)
+            )
+
+    def delete(self, task_ids, tasks=None):
+        """Delete tasks by ID"""
+        task_ids = list(task_ids)
+        with self._writing("delete", task_ids):
+            self.conn.executemany("DELETE FROM tasks WHERE id = ?", ((i,) for i in task_ids))
+
+    def replace_all(self, tasks, next_id=None):
+        """Replace the whole table in one transaction (pending changes included)"""
+        with self._writing():
+            self.conn.execute("DELETE FROM tasks")
+            self.conn.executemany(
+                "INSERT INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", (self._row(t) for t in tasks)
+            )
+            self._set_next_id(next_id)
+        self._pending.clear()
+
+    def close(self):
+        if self._pending:
+            raise FileChangedError(f"{self.filename} has refused changes to merge first")
+        self.conn.close()
+
+
+def migrate_json_to_sqlite(json_filename, storage):
+    """Copy tasks from a JSON file into an empty SQLite storage
+
+    Returns the number of tasks migrated. The JSON file is left untouched.
+    """
+    if storage.count() > 0 or not os.path.exists(json_filename):
+        return 0
+    source = JsonTaskStorage(json_filename)
+    tasks = source.load()
+    storage.replace_all(tasks, source.next_id)
+    return len(tasks)
+
+
+def open_storage(filename="todo_gui.json", use_sqlite=False, autosave=False):
+    """Open the JSON file, or an SQLite database next to it
+
+    With use_sqlite, tasks live in <name>.db and are migrated from the
+    JSON file the first time the database is created. With autosave, JSON
+    changes are written in the background (SQLite commits each change).
+    """
+    if not use_sqlite and not filename.endswith((".db", ".sqlite")):
+        if autosave:
+            return AutosaveJsonStorage(filename)
+        return JsonTaskStorage(filename)
+
+    if filename.endswith(".json"):
+        json_filename = filename
+        filename = os.path.splitext(filename)[0] + ".db"
+    else:
+        json_filename = os.path.splitext(filename)[0] + ".json"
+    storage = SqliteTaskStorage(filename)
+    migrate_json_to_sqlite(json_filename, storage)
+    return storage
@@ -0,0 +1,951 @@
+"""
+todo_store.py - Task list model for the to-do app
+Owns the tasks, writes changes through the storage backend and tells
+listeners which task changed
+"""
+
+import functools
+from bisect import insort
+from datetime import date, datetime
+from itertools import islice
+
+from change_log import ChangeLog
+from recurrence import PRIORITIES, check_repeat, next_due, renewal_date, urgency
+from task_indexes import LazyHeap, TaskIndexes
+from task_record import Task
+from todo_storage import FileChangedError
+from task_search import TaskSearchIndex
+from task_tags import TagIndex
+from task_tree import TaskTree
+from undo_journal import STATE_FIELDS, task_state
+
+
+def now_stamp():
+    return datetime.now().strftime("%Y-%m-%d %H:%M")
+
+
+def _needs_all_tasks(method):
+    """Decorator: finish a progressive load before a change
+
+    New IDs and saves then take every task into account.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._loading is not None:
+            self.finish_loading()
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _check_schedule(priority, repeat):
+    if priority not in range(len(PRIORITIES)):
+        raise ValueError(f"Priority must be 0-{len(PRIORITIES) - 1}")
+    check_repeat(repeat)
+
+
+class TodoStore:
+    """Task list with change events and maintained counters
+
+    Tasks keep the ID they were created with; IDs come from a counter that
+    is saved with the tasks, so they are never reused. tasks is ordered by
+    ID and holds compact Task records (read like dicts, see task_record);
+    index maps each ID to its task. The search index and the date
+    indexes behind view() and the heaps behind next_up() and
+    renew_repeating() are built on first use and then kept up to date.
+    changes logs the IDs each change touched, for sync clients.
+
+    Listeners are called as listener(event, index, task) with event one of
+    "add", "update", "remove" (index/task of the affected task) or "reset"
+    (index and task None) after changes that touch many tasks.
+
+    With progressive=True the constructor loads nothing: load_step() adds
+    tasks a chunk at a time (so a window can show the first ones at once)
+    and a "reset" is sent when the last chunk is in. Any change first
+    finishes the load.
+
+    With an UndoJournal, each change logs the previous state of the tasks
+    it touched, and undo()/redo() step back and forth through them.
+    """
+
+    def __init__(self, storage, progressive=False, journal=None):
+        self.storage = storage
+        self.journal = journal
+        self.tasks = []
+        self.index = {}
+        self.next_id = 1
+        self.listeners = []
+        self.total = 0
+        self.completed = 0
+        self._search_index = None
+        self._date_indexes = None
+        self._tag_index = None
+        self._tree = None
+        self._heaps = {}
+        self.changes = ChangeLog()
+        self._in_order = True
+        self._loading = None
+        if progressive:
+            loader = getattr(storage, "iter_load", None)
+            self._loading = loader() if loader else iter(storage.load())
+            return
+
+        try:
+            tasks = storage.load()
+        except:
+            tasks = []
+        # Drop each loaded dict once it is converted, so the dicts and the
+        # compact records are not all held at the same time
+        for i in range(len(tasks)):
+            self._adopt(tasks[i])
+            tasks[i] = None
+        self._loaded()
+
+    def _adopt(self, task):
+        """Append one loaded task"""
+        if type(task) is not Task:
+            task = Task.from_dict(task)
+        tasks = self.tasks
+        if tasks and task.id <= tasks[-1].id:
+            self._in_order = False
+        tasks.append(task)
+        self.index[task.id] = task
+        if task.completed:
+            self.completed += 1
+        self._indexed(task)
+
+    def _loaded(self):
+        """Settle the order, counters and next ID once every task is in"""
+        if not self._in_order:
+            self.tasks.sort(key=lambda t: t.id)
+            self._in_order = True
+        self.total = len(self.tasks)
+        last_id = self.tasks[-1].id if self.tasks else 0
+        self.next_id = max(self.storage.next_id or 1, last_id + 1)
+
+    @property
+    def loading(self):
+        """True while a progressive load has tasks left to read"""
+        return self._loading is not None
+
+    def load_step(self, count):
+        """Load up to count more tasks; return True while more remain
+
+        The first call after a progressive constructor gives the first page
+        quickly. When the file turns out to be unreadable part way, the
+        tasks read so far are dropped, as a normal load would do.
+        """
+        if self._loading is None:
+            return False
+        start = len(self.tasks)
+        try:
+            for task in islice(self._loading, count):
+                self._adopt(task)
+        except (OSError, ValueError):
+            self.tasks.clear()
+            self.index.clear()
+            self.completed = 0
+            self._search_index = self._date_indexes = self._tag_index = self._tree = None
+            self._heaps.clear()
+            self._loading = iter(())
+        if len(self.tasks) - start == count:
+            self.total = len(self.tasks)
+            return True
+        self._loading = None
+        self._loaded()
+        self._emit("reset")
+        return False
+
+    def finish_loading(self):
+        """Load whatever a progressive load has left"""
+        while self.load_step(50_000):
+            pass
+
+    def subscribe(self, listener):
+        self.listeners.append(listener)
+
+    def _emit(self, event, index=None, task=None):
+        for listener in self.listeners:
+            listener(event, index, task)
+
+    def get(self, task_id):
+        """Return the task with task_id, or None"""
+        return self.index.get(task_id)
+
+    def position(self, task_id):
+        """Index of task_id in self.tasks (binary search over the ordered IDs)"""
+        tasks = self.tasks
+        lo, hi = 0, len(tasks)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if tasks[mid].id < task_id:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    @property
+    def search_index(self):
+        """Search index over task text, built on first use"""
+        if self._search_index is None:
+            index = TaskSearchIndex()
+            for task in self.tasks:
+                index.add(task.id, task.task)
+            self._search_index = index
+        return self._search_index
+
+    def search(self, query, limit=None):
+        """Return (total matches, best matching tasks) for a query"""
+        total, ids = self.search_index.search(query, limit)
+        return total, [self.index[i] for i in ids]
+
+    @property
+    def date_indexes(self):
+        """Sorted created/completed/due indexes, built on first use"""
+        if self._date_indexes is None:
+            self._date_indexes = TaskIndexes(self.tasks)
+        return self._date_indexes
+
+    @property
+    def tag_index(self):
+        """Bitmaps of the tasks carrying each #tag, built on first use"""
+        if self._tag_index is None:
+            self._tag_index = TagIndex(self.tasks)
+        return self._tag_index
+
+    def tagged(self, query):
+        """Tasks matching a tag filter such as "#work AND NOT completed"
+
+        See task_tags.parse_query for the syntax (ValueError if it is
+        bad). The filter is worked out on the tag bitmaps, so the cost
+        follows the number of matches rather than the number of tasks.
+        Tasks come in ID order.
+        """
+        return [self.index[i] for i in self.tag_index.query(query)]
+
+    def tag_counts(self):
+        """[(tag, number of tasks)], most used first"""
+        return sorted(self.tag_index.counts().items(), key=lambda item: (-item[1], item[0]))
+
+    @property
+    def tree(self):
+        """Subtasks and their counts (see task_tree.TaskTree), built on first use"""
+        if self._tree is None:
+            self._tree = TaskTree(self.index, self.tasks)
+        return self._tree
+
+    def top_level(self):
+        """Tasks that are not under another task, in ID order"""
+        up = self.tree.up
+        if not up:
+            return self.tasks
+        return [t for t in self.tasks if t.id not in up]
+
+    def subtasks(self, task_id):
+        """The tasks directly under task_id, in ID order"""
+        return [self.index[i] for i in self.tree.subtask_ids(task_id)]
+
+    def progress(self, task_id):
+        """(completed, total) subtasks at every depth below task_id"""
+        return self.tree.progress(task_id)
+
+    def check_parent(self, task_id, parent_id):
+        """Raise ValueError unless task_id can go under parent_id (None: top level)"""
+        if parent_id is None:
+            return
+        if parent_id not in self.index:
+            raise ValueError(f"No task with ID {parent_id}")
+        if task_id is not None and self.tree.is_below(parent_id, task_id):
+            raise ValueError(f"Task {parent_id} is task {task_id} or one of its subtasks")
+
+    # Filter views and sort orders offered by view()
+    VIEWS = ("all", "pending", "completed", "completed_today", "overdue", "due_soon", "next_up")
+    SORTS = ("added", "oldest", "newest", "due", "completed", "priority")
+    # The order each view comes out of its index in
+    _NATURAL_SORT = {"all": "oldest", "pending": "oldest", "overdue": "due", "due_soon": "due",
+                     "next_up": "priority"}
+    # Tasks in the next_up view
+    NEXT_UP_LIMIT = 100
+
+    def view(self, name="all", sort="added", start=None, end=None, tags=None):
+        """Tasks in a filter view, in a sort order
+
+        The default (all tasks in the order they were added) is self.tasks
+        itself. Other views are range slices of the date indexes; start and
+        end are inclusive "YYYY-MM-DD" dates (see TaskIndexes.view). The
+        next_up view is the NEXT_UP_LIMIT most urgent pending tasks (see
+        next_up) and takes no dates. tags narrows any view to a tag filter
+        (see tagged).
+        """
+        whole = name == "all" and not start and not end
+        if whole and not tags and sort == "added":
+            return self.tasks
+        natural = self._NATURAL_SORT.get(name, "completed_asc")
+        if whole and tags:
+            tasks = self.tagged(tags)
+            natural = "added"
+        else:
+            if name == "next_up":
+                tasks = self.next_up(self.NEXT_UP_LIMIT)
+            else:
+                ids = self.date_indexes.view(name, start, end)
+                tasks = [self.index[i] for i in ids]
+            if tags:
+                matched = set(self.tag_index.query(tags))
+                tasks = [t for t in tasks if t.id in matched]
+
+        if sort == natural:
+            return tasks
+        if sort == "newest" and natural == "oldest":
+            tasks.reverse()
+        elif sort == "completed" and natural == "completed_asc":
+            tasks.reverse()
+        elif sort == "added":
+            tasks.sort(key=lambda t: t.id)
+        elif sort in ("oldest", "newest"):
+            tasks.sort(key=lambda t: (t.created_at, t.id), reverse=sort == "newest")
+        elif sort == "due":
+            tasks.sort(key=lambda t: (t.due is None, t.due or "", t.id))
+        elif sort == "completed":
+            # Most recently completed first, pending tasks last
+            tasks.sort(key=lambda t: (t.completed, t.completed_at or "", t.id),
+                       reverse=True)
+        elif sort == "priority":
+            tasks.sort(key=urgency)
+        else:
+            raise ValueError(f"Unknown sort '{sort}'")
+        return tasks
+
+    def next_up(self, count=10):
+        """The count most urgent pending tasks, most urgent first
+
+        Urgency is priority, then due date, then age (recurrence.urgency).
+        The tasks come off a heap kept up to date with every change, so
+        this does not sort the task list.
+        """
+        return [self.index[i] for i in self._heap("next_up").smallest(count)]
+
+    def next_renewal(self):
+        """Day ("YYYY-MM-DD") the next repeating task comes back, or None"""
+        top = self._heap("renewals").peek()
+        return top[0] if top else None
+
+    # Heaps kept by the store: name -> key of a task in it (None leaves it out)
+    _HEAP_KEYS = {
+        "next_up": lambda t: None if t.completed else urgency(t),
+        "renewals": lambda t: renewal_date(t) if t.repeat and t.completed else None,
+    }
+
+    def _heap(self, name):
+        """One of the _HEAP_KEYS heaps, built on first use"""
+        heap = self._heaps.get(name)
+        if heap is None:
+            key = self._HEAP_KEYS[name]
+            heap = self._heaps[name] = LazyHeap((key(t), t.id) for t in self.tasks)
+        return heap
+
+    def _reheaped(self, tasks, removed=False):
+        """File tasks in the built heaps by their current fields (or drop them)"""
+        for name, heap in self._heaps.items():
+            key = self._HEAP_KEYS[name]
+            for task in tasks:
+                heap.set(task.id, None if removed else key(task))
+
+    def _indexed(self, task):
+        """Add a task to the indexes that have been built"""
+        if self._search_index is not None:
+            self._search_index.add(task["id"], task["task"])
+        if self._date_indexes is not None:
+            self._date_indexes.add(task)
+        if self._tag_index is not None:
+            self._tag_index.add(task)
+        if self._tree is not None:
+            self._tree.add(task)
+        if self._heaps:
+            self._reheaped([task])
+
+    def _unindexed(self, task):
+        """Remove a task from the indexes that have been built"""
+        if self._search_index is not None:
+            self._search_index.remove(task["id"])
+        if self._date_indexes is not None:
+            self._date_indexes.remove(task)
+        if self._tag_index is not None:
+            self._tag_index.remove(task)
+        if self._tree is not None:
+            self._tree.remove(task)
+        if self._heaps:
+            self._reheaped([task], removed=True)
+
+    def _reindexed(self, tasks, olds):
+        """Refile changed tasks (olds: copies from before) in the built indexes"""
+        if self._date_indexes is not None:
+            if len(tasks) == 1:
+                self._date_indexes.update(tasks[0], olds[0])
+            else:
+                self._date_indexes.update_many(tasks, olds)
+        if self._tag_index is not None:
+            for task, old in zip(tasks, olds):
+                self._tag_index.update(task, old)
+        if self._tree is not None:
+            for task, old in zip(tasks, olds):
+                self._tree.update(task, old)
+        if self._heaps:
+            self._reheaped(tasks)
+
+    def _new_task(self, text, due=None, priority=0, repeat=None, parent=None):
+        task = Task(self.next_id, text, False, now_stamp(), None, due, priority, repeat, parent)
+        self.next_id += 1
+        self.tasks.append(task)
+        self.index[task["id"]] = task
+        self.total += 1
+        self._indexed(task)
+        return task
+
+    @_needs_all_tasks
+    def add(self, text, due=None, priority=0, repeat=None, parent=None):
+        """Append a new pending task and return it
+
+        priority is 0 (none) to 3 (high), repeat one of recurrence.REPEATS
+        or None, and parent the ID of the task it is a subtask of.
+        """
+        _check_schedule(priority, repeat)
+        self.check_parent(None, parent)
+        task = self._new_task(text, due, priority, repeat, parent)
+        self._journal(f"Add task {task.id}", [task.id], [None])
+        self.changes.record([task.id])
+        self._persist(self.storage.insert, task, self.tasks, self.next_id)
+        self._emit("add", len(self.tasks) - 1, task)
+        return task
+
+    @_needs_all_tasks
+    def add_many(self, texts):
+        """Append one pending task per text with a single save; return them"""
+        added = [self._new_task(text) for text in texts]
+        if added:
+            ids = [t.id for t in added]
+            self._journal(f"Add {len(added)} task(s)", ids, [None] * len(ids))
+            self.changes.record(ids)
+            self._persist(self.storage.insert_many, added, self.tasks, self.next_id)
+            self._emit("reset")
+        return added
+
+    @_needs_all_tasks
+    def import_many(self, records, new_ids=None):
+        """Append validated records (see task_io.validate) with a single save
+
+        A record keeps its id when that id is above every existing one, so
+        a file exported from a list imports back with the same IDs; other
+        records get new IDs. A parent is followed to the ID its record got
+        when that record came earlier, otherwise dropped; new_ids (file ID
+        -> task ID) carries this across the batches of one import. Returns
+        the added tasks.
+        """
+        added = []
+        if new_ids is None:
+            new_ids = {}
+        for record in records:
+            task_id = record["id"]
+            if task_id is None or task_id < self.next_id:
+                task_id = self.next_id
+            if record["id"] is not None:
+                new_ids[record["id"]] = task_id
+            task = Task(task_id, record["task"], record["completed"],
+                        record["created_at"], record["completed_at"], record.get("due"),
+                        record.get("priority") or 0, record.get("repeat"),
+                        new_ids.get(record.get("parent")))
+            self.next_id = task_id + 1
+            self.tasks.append(task)
+            self.index[task_id] = task
+            if task["completed"]:
+                self.completed += 1
+            self._indexed(task)
+            added.append(task)
+        if added:
+            self.total += len(added)
+            ids = [t.id for t in added]
+            self._journal(f"Import {len(added)} task(s)", ids, [None] * len(ids))
+            self.changes.record(ids)
+            self._persist(self.storage.insert_many, added, self.tasks, self.next_id)
+            self._emit("reset")
+        return added
+
+    @_needs_all_tasks
+    def edit(self, task_id, text):
+        """Change the text of a task; return it, or None if not found"""
+        task = self.index.get(task_id)
+        if task is None:
+            return None
+        self._journal(f"Edit task {task_id}", [task_id], [task_state(task)])
+        old_text = task["task"]
+        task["task"] = text
+        if self._search_index is not None:
+            self._search_index.add(task_id, text)
+        if self._tag_index is not None:
+            self._tag_index.update(task, {"task": old_text, "completed": task["completed"]})
+        self.changes.record([task_id])
+        self._persist(self.storage.update, task, self.tasks)
+        self._emit("update", self.position(task_id), task)
+        return task
+
+    @_needs_all_tasks
+    def set_due(self, task_id, due):
+        """Set or clear ("YYYY-MM-DD" or None) a task's due date"""
+        return self._set_field(task_id, "due", due, f"Set due date of task {task_id}")
+
+    @_needs_all_tasks
+    def set_priority(self, task_id, priority):
+        """Set a task's priority (0 none to 3 high)"""
+        _check_schedule(priority, None)
+        return self._set_field(task_id, "priority", priority, f"Set priority of task {task_id}")
+
+    @_needs_all_tasks
+    def set_repeat(self, task_id, repeat):
+        """Set or clear a task's repeat rule (see recurrence.REPEATS)"""
+        check_repeat(repeat)
+        return self._set_field(task_id, "repeat", repeat, f"Set repeat of task {task_id}")
+
+    @_needs_all_tasks
+    def set_parent(self, task_id, parent_id):
+        """Move a task (with its subtasks) under parent_id, or to the top level with None"""
+        self.check_parent(task_id, parent_id)
+        return self._set_field(task_id, "parent", parent_id, f"Move task {task_id}")
+
+    # Fields update() can change, in the order they are applied
+    UPDATE_FIELDS = ("task", "due", "priority", "repeat", "parent", "completed")
+
+    @_needs_all_tasks
+    def update(self, task_id, fields):
+        """Change several fields of a task as one change; return it, or None
+
+        fields maps names from UPDATE_FIELDS to new values. Everything is
+        checked before anything changes, and the fields that differ are
+        then saved together with a single undo entry.
+        """
+        task = self.index.get(task_id)
+        if task is None:
+            return None
+        unknown = set(fields) - set(self.UPDATE_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown task field(s): {', '.join(sorted(unknown))}")
+        changed = {name: fields[name] for name in self.UPDATE_FIELDS
+                   if name in fields and fields[name] != task[name]}
+        _check_schedule(changed.get("priority", task["priority"]), changed.get("repeat"))
+        if "parent" in changed:
+            self.check_parent(task_id, changed["parent"])
+        if not changed:
+            return task
+
+        self._journal(f"Change task {task_id}", [task_id], [task_state(task)])
+        old = dict(task)
+        for name, value in changed.items():
+            task[name] = value
+        if "completed" in changed:
+            task["completed_at"] = now_stamp() if changed["completed"] else None
+            self.completed += 1 if changed["completed"] else -1
+        if "task" in changed and self._search_index is not None:
+            self._search_index.add(task_id, task["task"])
+        self._reindexed([task], [old])
+        self.changes.record([task_id])
+        self._persist(self.storage.update, task, self.tasks)
+        self._emit("update", self.position(task_id), task)
+        return task
+
+    def _set_field(self, task_id, field, value, label):
+        task = self.index.get(task_id)
+        if task is None:
+            return None
+        self._journal(label, [task_id], [task_state(task)])
+        old = dict(task)
+        task[field] = value
+        self._reindexed([task], [old])
+        self.changes.record([task_id])
+        self._persist(self.storage.update, task, self.tasks)
+        self._emit("update", self.position(task_id), task)
+        return task
+
+    @_needs_all_tasks
+    def complete(self, task_id):
+        """Mark a pending task complete; return it, or None if not found/done"""
+        task = self.index.get(task_id)
+        if task is None or task["completed"]:
+            return None
+        self._journal(f"Complete task {task_id}", [task_id], [task_state(task)])
+        old = dict(task)
+        task["completed"] = True
+        task["completed_at"] = now_stamp()
+        self.completed += 1
+        self._reindexed([task], [old])
+        self.changes.record([task_id])
+        self._persist(self.storage.update, task, self.tasks)
+        self._emit("update", self.position(task_id), task)
+        return task
+
+    @_needs_all_tasks
+    def set_completed_many(self, task_ids, completed=True):
+        """Complete (or reopen) several tasks with a single save
+
+        Returns the tasks that changed; missing IDs and tasks already in
+        the requested state are skipped.
+        """
+        stamp = now_stamp() if completed else None
+        changed = []
+        olds = []
+        for task_id in task_ids:
+            task = self.index.get(task_id)
+            if task is not None and task["completed"] != completed:
+                olds.append(dict(task))
+                task["completed"] = completed
+                task["completed_at"] = stamp
+                changed.append(task)
+        if changed:
+            if self.journal is not None:
+                verb = "Complete" if completed else "Reopen"
+                self._journal(f"{verb} {len(changed)} task(s)", [t.id for t in changed],
+                              [task_state(old) for old in olds])
+            self._reindexed(changed, olds)
+            self.completed += len(changed) if completed else -len(changed)
+            self.changes.record([t.id for t in changed])
+            self._persist(self.storage.update_many, changed, self.tasks)
+            self._emit("reset")
+        return changed
+
+    @_needs_all_tasks
+    def delete(self, task_id):
+        """Delete a task and its subtasks; return it, or None if not found"""
+        below = self.tree.descendant_ids(task_id) if task_id in self.index else None
+        if below:
+            task = self.index[task_id]
+            self._remove_many([task] + [self.index[i] for i in below],
+                              f"Delete task {task_id} and {len(below)} subtask(s)")
+            return task
+        task = self.index.pop(task_id, None)
+        if task is None:
+            return None
+        index = self.position(task_id)
+        del self.tasks[index]
+        self.total -= 1
+        if task["completed"]:
+            self.completed -= 1
+        self._unindexed(task)
+        self._journal(f"Delete task {task_id}", [task_id], [task_state(task)])
+        self.changes.record([task_id])
+        self._persist(self.storage.delete, [task_id], self.tasks)
+        self._emit("remove", index, task)
+        return task
+
+    def _remove_many(self, doomed, label):
+        """Drop tasks in one pass over the list, then save once"""
+        ids = {t.id for t in doomed}
+        self.tasks[:] = [t for t in self.tasks if t.id not in ids]
+        for task in doomed:
+            del self.index[task["id"]]
+            if self._search_index is not None:
+                self._search_index.remove(task["id"])
+            if self._tag_index is not None:
+                self._tag_index.remove(task)
+            if self._tree is not None:
+                self._tree.remove(task)
+        if self._date_indexes is not None:
+            self._date_indexes.remove_many(doomed)
+        if self._heaps:
+            self._reheaped(doomed, removed=True)
+        self.total = len(self.tasks)
+        self.completed -= sum(1 for t in doomed if t.completed)
+        if self.journal is not None:
+            self._journal(label, [t.id for t in doomed], [task_state(t) for t in doomed])
+        self.changes.record(ids)
+        self._persist(self.storage.delete, list(ids), self.tasks)
+        self._emit("reset")
+
+    @_needs_all_tasks
+    def delete_many(self, task_ids):
+        """Delete several tasks and their subtasks with a single save; return the removed tasks"""
+        ids = {i for i in task_ids if i in self.index}
+        if self.tree.counts:
+            for task_id in list(ids):
+                ids.update(self.tree.descendant_ids(task_id))
+        doomed = [self.index[i] for i in ids]
+        if doomed:
+            self._remove_many(doomed, f"Delete {len(doomed)} task(s)")
+        return doomed
+
+    @_needs_all_tasks
+    def clear_completed(self):
+        """Remove all completed tasks; return how many were removed"""
+        if self.completed == 0:
+            return 0
+        doomed = [t for t in self.tasks if t.completed]
+        self._remove_many(doomed, f"Clear {len(doomed)} completed task(s)")
+        return len(doomed)
+
+    @_needs_all_tasks
+    def renew_repeating(self, today=None):
+        """Bring back the repeating tasks whose next period has started
+
+        A completed task with a repeat rule comes back, on the day one
+        period after its due date, as a new pending task due that day
+        (periods missed while the app was closed are skipped). The
+        completed task stays as history but drops its rule, so it is
+        renewed only once. Returns the new tasks.
+        """
+        today = today or date.today().isoformat()
+        ids = self._heap("renewals").pop_upto(today)
+        if not ids:
+            return []
+        renewed = [self.index[i] for i in ids]
+        olds = [dict(t) for t in renewed]
+        added = [self._new_task(t.task, next_due(t, today), t.priority, t.repeat, t.parent)
+                 for t in renewed]
+        for task in renewed:
+            task["repeat"] = None
+        self._reindexed(renewed, olds)
+        if self.journal is not None:
+            self._journal(f"Repeat {len(added)} task(s)", ids + [t.id for t in added],
+                          [task_state(old) for old in olds] + [None] * len(added))
+        self.changes.record(ids + [t.id for t in added])
+        self._persist(self.storage.update_many, renewed, self.tasks)
+        self._persist(self.storage.insert_many, added, self.tasks, self.next_id)
+        self._emit("reset")
+        return added
+
+    def _journal(self, label, ids, states):
+        if self.journal is not None:
+            self.journal.record(label, ids, states)
+
+    @_needs_all_tasks
+    def undo(self):
+        """Revert the last change; return its label, or None if there is none"""
+        if self.journal is None or not self.journal.can_undo:
+            return None
+        label, ids, states = self.journal.undo_entry
+        self.journal.undone(self._restore(ids, states))
+        return label
+
+    @_needs_all_tasks
+    def redo(self):
+        """Repeat the last undone change; return its label, or None"""
+        if self.journal is None or not self.journal.can_redo:
+            return None
+        label, ids, states = self.journal.redo_entry
+        self.journal.redone(self._restore(ids, states))
+        return label
+
+    # Tasks re-created by one undo above which the list is re-sorted
+    # instead of inserting each one in place
+    INSORT_MAX = 64
+
+    def _restore(self, ids, states):
+        """Put tasks back into journal states; return the states they had
+
+        Only the tasks in ids are touched. They are saved with at most
+        one call per kind of change (insert, update, delete).
+        """
+        previous = []
+        added, updated, olds, removed = [], [], [], []
+        for task_id, state in zip(ids, states):
+            task = self.index.get(task_id)
+            current = task_state(task)
+            previous.append(current)
+            if state == current:
+                continue
+            if state is None:
+                removed.append(task)
+            elif task is None:
+                added.append(Task(task_id, *state))
+            else:
+                olds.append(dict(task))
+                for field, value in zip(STATE_FIELDS, state):
+                    task[field] = value
+                updated.append(task)
+
+        if removed:
+            gone = {t.id for t in removed}
+            if len(removed) == 1:
+                del self.tasks[self.position(removed[0].id)]
+            else:
+                self.tasks[:] = [t for t in self.tasks if t.id not in gone]
+            for task in removed:
+                del self.index[task.id]
+                if self._search_index is not None:
+                    self._search_index.remove(task.id)
+                if self._tag_index is not None:
+                    self._tag_index.remove(task)
+                if self._tree is not None:
+                    self._tree.remove(task)
+            if self._date_indexes is not None:
+                self._date_indexes.remove_many(removed)
+            if self._heaps:
+                self._reheaped(removed, removed=True)
+        if added:
+            if len(added) <= self.INSORT_MAX:
+                for task in added:
+                    insort(self.tasks, task, key=lambda t: t.id)
+            else:
+                self.tasks.extend(added)
+                self.tasks.sort(key=lambda t: t.id)
+            for task in added:
+                self.index[task.id] = task
+            for task in added:
+                if self._search_index is not None:
+                    self._search_index.add(task.id, task.task)
+                if self._tag_index is not None:
+                    self._tag_index.add(task)
+                if self._tree is not None:
+                    self._tree.add(task)
+            if self._date_indexes is not None:
+                self._date_indexes.add_many(added)
+            if self._heaps:
+                self._reheaped(added)
+            self.next_id = max(self.next_id, max(t.id for t in added) + 1)
+        if updated:
+            if self._search_index is not None:
+                for task, old in zip(updated, olds):
+                    if task.task != old["task"]:
+                        self._search_index.add(task.id, task.task)
+            self._reindexed(updated, olds)
+
+        self.total = len(self.tasks)
+        self.completed += (sum(1 for t in added if t.completed)
+                           - sum(1 for t in removed if t.completed)
+                           + sum(1 for t, o in zip(updated, olds) if t.completed)
+                           - sum(1 for o in olds if o["completed"]))
+        touched = [t.id for t in removed + added + updated]
+        if not touched:
+            return previous
+        self.changes.record(touched)
+        if removed:
+            self._persist(self.storage.delete, [t.id for t in removed], self.tasks)
+        if added:
+            self._persist(self.storage.insert_many, added, self.tasks, self.next_id)
+        if updated:
+            self._persist(self.storage.update_many, updated, self.tasks)
+
+        if len(touched) > 1:
+            self._emit("reset")
+        elif removed:
+            self._emit("remove", self.position(removed[0].id), removed[0])
+        else:
+            task = (added or updated)[0]
+            self._emit("add" if added else "update", self.position(task.id), task)
+        return previous
+
+    @_needs_all_tasks
+    def save(self):
+        """Write every task to storage"""
+        self._persist(self.storage.replace_all, self.tasks, self.next_id)
+
+    def _persist(self, method, *args):
+        """Pass a change to storage, merging first if another instance saved
+
+        On FileChangedError the change is still pending in storage, so
+        sync() keeps it and saves it along with the merged tasks.
+        """
+        try:
+            method(*args)
+        except FileChangedError:
+            self.sync()
+
+    # Merge and save attempts when other instances keep saving in between
+    SYNC_ATTEMPTS = 3
+
+    def sync(self):
+        """Merge in changes another instance saved to the same storage
+
+        Cheap when nothing changed (storage.changed_on_disk). Otherwise
+        tasks are matched by ID: the saved version wins, except for
+        changes made here that are not saved yet, and a task both sides
+        created with the same ID gets a new ID here. Listeners get a
+        "reset" if the task list changed; returns whether it did.
+        """
+        if self._loading is not None:
+            return False  # nothing to merge into yet
+        changed = False
+        for attempt in range(self.SYNC_ATTEMPTS):
+            if not self.storage.changed_on_disk():
+                break
+            changed |= self._merge(self.storage.reload(), self.storage.pending_changes())
+            if not self.storage.pending_changes():
+                break
+            try:
+                self.storage.save_merged(self.tasks, self.index, self.next_id)
+                break
+            except FileChangedError:
+                if attempt == self.SYNC_ATTEMPTS - 1:
+                    raise
+        if changed:
+            self._emit("reset")
+        return changed
+
+    def _merge(self, saved, pending):
+        """Update the tasks in place from a saved list; return True if any changed"""
+        merged = {t["id"]: t for t in saved}
+        next_id = max(self.next_id, self.storage.next_id or 1, max(merged, default=0) + 1)
+        ours = []
+        moved = {}
+        for task_id, kind in pending.items():
+            local = self.index.get(task_id)
+            if kind == "delete" or local is None:
+                merged.pop(task_id, None)
+                continue
+            if kind == "insert" and task_id in merged:
+                # Both sides created a task with this ID: ours moves
+                self._renumber(local, next_id)
+                moved[task_id] = next_id
+                next_id += 1
+            merged[local.id] = local
+            ours.append(local)
+        self.next_id = next_id
+        for local in ours:
+            # Our subtasks of a task that moved follow it
+            if local.parent in moved:
+                old = dict(local)
+                local["parent"] = moved[local.parent]
+                self._reindexed([local], [old])
+
+        touched = [i for i in self.index if i not in merged]
+        for task_id in touched:
+            self._unindexed(self.index.pop(task_id))
+        for task_id, data in merged.items():
+            task = self.index.get(task_id)
+            if task is data:
+                continue
+            if task is None:
+                task = self.index[task_id] = Task.from_dict(data)
+                self._indexed(task)
+                touched.append(task_id)
+            elif task_state(task) != task_state(data):
+                old = dict(task)
+                for field, value in zip(STATE_FIELDS, task_state(data)):
+                    task[field] = value
+                if self._search_index is not None and old["task"] != task.task:
+                    self._search_index.add(task_id, task.task)
+                self._reindexed([task], [old])
+                touched.append(task_id)
+
+        if touched:
+            self.changes.record(touched)
+            self.tasks[:] = sorted(self.index.values(), key=lambda t: t.id)
+            self.total = len(self.tasks)
+            self.completed = sum(1 for t in self.tasks if t.completed)
+        return bool(touched)
+
+    def _renumber(self, task, new_id):
+        self.changes.record([task.id, new_id])
+        if self.journal is not None:
+            self.journal.renumber(task.id, new_id)
+        self._unindexed(self.index.pop(task.id))
+        self.storage.renumber(task.id, new_id)
+        task["id"] = new_id
+        self.index[new_id] = task
+        self._indexed(task)
+
+    def close(self):
+        self._loading = None  # unchanged tasks need no saving
+        if self.journal is not None:
+            self.journal.close()
+        try:
+            self.storage.close()
+        except FileChangedError:
+            # Another instance saved since our last look: merge, then save
+            self.sync()
+            self.storage.close()
@@ -0,0 +1,240 @@
+"""
+undo_journal.py - Undo/redo history of task changes
+Each entry keeps only the previous state of the tasks a change touched,
+and the history is appended to a file so it survives a restart
+"""
+
+import json
+import os
+from collections import deque
+
+# Task fields an entry restores (the id is kept alongside)
+STATE_FIELDS = ("task", "completed", "created_at", "completed_at", "due", "priority", "repeat",
+                "parent")
+
+
+def task_state(task):
+    """The restorable fields of a task as a tuple, or None for no task"""
+    if task is None:
+        return None
+    return (task["task"], task["completed"], task["created_at"],
+            task["completed_at"], task.get("due"), task.get("priority") or 0,
+            task.get("repeat"), task.get("parent"))
+
+
+class UndoJournal:
+    """Stacks of inverse deltas for undo and redo
+
+    An entry is (label, ids, states): putting each task back into its
+    state (None meaning "no such task") reverts the change. Undoing an
+    entry saves the states it overwrote as the redo entry, so both
+    directions cost as much as the change, not the task list. A bulk
+    change is a single entry.
+
+    Entries are estimated at ENTRY_BYTES plus ROW_BYTES and the text of
+    each task; the oldest are dropped once max_bytes is exceeded.
+
+    With a filename, every step is appended to it as a JSON line and
+    replayed when the journal is opened again. The file is rewritten
+    with just the live entries when it grows well past them.
+    """
+
+    MAX_BYTES = 32 * 1024 * 1024
+    ENTRY_BYTES = 200
+    ROW_BYTES = 120
+
+    def __init__(self, filename=None, max_bytes=None):
+        self.filename = filename
+        self.max_bytes = max_bytes or self.MAX_BYTES
+        self.size = 0
+        self._undo = deque()
+        self._redo = deque()
+        self._file = None
+        self._lines = 0        # lines in the file
+        self._file_bytes = 0
+        if filename:
+            self._open()
+
+    def _entry_size(self, states):
+        return self.ENTRY_BYTES + sum(
+            self.ROW_BYTES + (len(s[0]) if s is not None else 0) for s in states
+        )
+
+    def _push(self, stack, label, ids, states):
+        stack.append((label, tuple(ids), tuple(states), self._entry_size(states)))
+        self.size += stack[-1][3]
+
+    def _pop(self, stack):
+        entry = stack.pop()
+        self.size -= entry[3]
+        return entry
+
+    def _trim(self):
+        # Oldest undo entries go first, then the redo entries furthest away
+        while self.size > self.max_bytes and (self._undo or self._redo):
+            stack = self._undo if self._undo else self._redo
+            self.size -= stack.popleft()[3]
+
+    @property
+    def can_undo(self):
+        return bool(self._undo)
+
+    @property
+    def can_redo(self):
+        return bool(self._redo)
+
+    @property
+    def undo_label(self):
+        """Label of the change undo() would revert, or None"""
+        return self._undo[-1][0] if self._undo else None
+
+    @property
+    def redo_label(self):
+        return self._redo[-1][0] if self._redo else None
+
+    @property
+    def undo_entry(self):
+        """(label, ids, states) that undo would restore, or None"""
+        return self._undo[-1][:3] if self._undo else None
+
+    @property
+    def redo_entry(self):
+        return self._redo[-1][:3] if self._redo else None
+
+    def record(self, label, ids, states):
+        """Log a change: states are the tasks' states before it"""
+        self._apply_do(label, ids, states)
+        self._log({"op": "do", "label": label, "ids": list(ids), "states": list(states)})
+
+    def undone(self, states):
+        """Move the top entry to redo; states are what the undo overwrote"""
+        self._apply_move(self._undo, self._redo, states)
+        self._log({"op": "undo", "states": list(states)})
+
+    def redone(self, states):
+        """Move the top redo entry back; states are what the redo overwrote"""
+        self._apply_move(self._redo, self._undo, states)
+        self._log({"op": "redo", "states": list(states)})
+
+    def renumber(self, old_id, new_id):
+        """Follow a task that was given a new ID"""
+        self._apply_renumber(old_id, new_id)
+        self._log({"op": "renumber", "old": old_id, "new": new_id})
+
+    def clear(self):
+        self._undo.clear()
+        self._redo.clear()
+        self.size = 0
+        if self._file is not None:
+            self._rewrite()
+
+    def _apply_do(self, label, ids, states):
+        self._redo.clear()
+        self._push(self._undo, label, ids, states)
+        self._trim()
+
+    def _apply_move(self, source, target, states):
+        label, ids, _, _ = self._pop(source)
+        self._push(target, label, ids, [tuple(s) if s is not None else None for s in states])
+        self._trim()
+
+    def _apply_renumber(self, old_id, new_id):
+        for stack in (self._undo, self._redo):
+            for i, entry in enumerate(stack):
+                if old_id in entry[1]:
+                    ids = tuple(new_id if t == old_id else t for t in entry[1])
+                    stack[i] = (entry[0], ids) + entry[2:]
+
+    # --- File ---
+
+    def _open(self):
+        """Replay the file, then keep it open for appending"""
+        clean = True
+        try:
+            with open(self.filename, 'rb') as f:
+                for raw in f:
+                    try:
+                        self._replay(json.loads(raw))
+                    except (ValueError, KeyError, TypeError, IndexError):
+                        clean = False  # torn last write: keep what came before
+                        break
+                    self._lines += 1
+                    self._file_bytes += len(raw)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            return  # history stays in memory only
+        if not clean or self._needs_rewrite():
+            self._rewrite()
+        else:
+            self._reopen()
+
+    def _replay(self, line):
+        op = line["op"]
+        states = [tuple(s) if s is not None else None for s in line.get("states", ())]
+        if op == "do":
+            self._apply_do(line["label"], line["ids"], states)
+        elif op == "undo":
+            self._apply_move(self._undo, self._redo, states)
+        elif op == "redo":
+            self._apply_move(self._redo, self._undo, states)
+        elif op == "redoable":
+            self._push(self._redo, line["label"], line["ids"], states)
+        elif op == "renumber":
+            self._apply_renumber(line["old"], line["new"])
+        else:
+            raise ValueError(f"unknown op {op!r}")
+
+    def _reopen(self):
+        try:
+            self._file = open(self.filename, 'a', encoding='utf-8')
+        except OSError:
+            self._file = None
+
+    def _needs_rewrite(self):
+        live = len(self._undo) + len(self._redo)
+        return self._lines > 2 * live + 32 or self._file_bytes > 2 * self.max_bytes
+
+    def _log(self, line):
+        if self._file is None:
+            return
+        text = json.dumps(line, ensure_ascii=False) + "\n"
+        try:
+            self._file.write(text)
+            self._file.flush()
+        except OSError:
+            self._file = None
+            return
+        self._lines += 1
+        self._file_bytes += len(text)
+        if self._needs_rewrite():
+            self._rewrite()
+
+    def _rewrite(self):
+        """Replace the file with one line per live entry"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        tmp = self.filename + ".tmp"
+        lines = 0
+        written = 0
+        try:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                for op, stack in (("do", self._undo), ("redoable", self._redo)):
+                    for label, ids, states, _ in stack:
+                        text = json.dumps({"op": op, "label": label, "ids": list(ids),
+                                           "states": list(states)}, ensure_ascii=False) + "\n"
+                        f.write(text)
+                        lines += 1
+                        written += len(text)
+            os.replace(tmp, self.filename)
+        except OSError:
+            return
+        self._lines = lines
+        self._file_bytes = written
+        self._reopen()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None